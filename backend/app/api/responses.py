@@ -0,0 +1,51 @@
+"""Response classes for bulk exports that bypass per-row model building."""
+
+import io
+from typing import Any, Literal
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from fastapi.responses import Response
+
+ExportFormat = Literal["json", "arrow", "csv"]
+
+
+class ArrowIPCResponse(Response):
+    """Serialize a ``pyarrow.Table`` as an Arrow IPC stream."""
+
+    media_type = "application/vnd.apache.arrow.stream"
+
+    def render(self, content: Any) -> bytes:
+        """Render the table as Arrow IPC stream bytes."""
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, content.schema) as writer:
+            writer.write_table(content)
+        return sink.getvalue().to_pybytes()
+
+
+class CSVTableResponse(Response):
+    """Serialize a ``pyarrow.Table`` as CSV."""
+
+    media_type = "text/csv"
+
+    def render(self, content: Any) -> bytes:
+        """Render the table as CSV bytes with a header row."""
+        buffer = io.BytesIO()
+        pa_csv.write_csv(content, buffer)
+        return buffer.getvalue()
+
+
+def table_response(table: pa.Table, output_format: ExportFormat) -> Response:
+    """
+    Build an export response for an Arrow table.
+
+    Args:
+        table: Query result as an Arrow table
+        output_format: Either "arrow" or "csv"
+
+    Returns:
+        Response serializing the table in the requested format
+    """
+    if output_format == "arrow":
+        return ArrowIPCResponse(table)
+    return CSVTableResponse(table)
@@ -1,10 +1,12 @@
 """Claims API endpoints."""
 
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Union
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import Response
 
+from ..responses import ExportFormat, table_response
 from ...dependencies import get_claims_service
 from ...core.exceptions import ResourceNotFoundError
 from ...models.schemas import ClaimSchema
@@ -38,15 +40,21 @@ async def get_claim(
     "/",
     response_model=List[ClaimSchema],
     summary="List Claims",
-    description="Retrieve a list of claims with optional filtering and pagination.",
+    description=(
+        "Retrieve a list of claims with optional filtering and pagination. "
+        "Use format=arrow or format=csv for bulk exports."
+    ),
 )
 async def list_claims(
     limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     status: Optional[str] = Query(None, description="Filter by claim status"),
     policy_id: Optional[str] = Query(None, description="Filter by policy ID"),
+    output_format: ExportFormat = Query(
+        "json", alias="format", description="Response format: json, arrow or csv"
+    ),
     service: ClaimsService = Depends(get_claims_service),
-) -> List[ClaimSchema]:
+) -> Union[List[ClaimSchema], Response]:
     """List claims with filtering and pagination."""
     logger.info(
         "api_list_claims",
@@ -54,6 +62,7 @@ async def list_claims(
         offset=offset,
         status=status,
         policy_id=policy_id,
+        format=output_format,
     )
 
     filters: Dict[str, Any] = {}
@@ -62,6 +71,10 @@ async def list_claims(
     if policy_id:
         filters["POLICY_ID"] = policy_id
 
+    if output_format != "json":
+        table = await service.get_claims_arrow(limit=limit, offset=offset, filters=filters)
+        return table_response(table, output_format)
+
     return await service.get_claims(limit=limit, offset=offset, filters=filters)
 
 
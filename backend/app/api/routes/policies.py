@@ -1,12 +1,14 @@
 """Policy API endpoints."""
 
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Union
 from datetime import datetime
 from decimal import Decimal
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import Response
 
+from ..responses import ExportFormat, table_response
 from ...dependencies import get_policy_repository
 from ...models.schemas import PolicySchema
 from ...models.domain import Policy
@@ -93,7 +95,10 @@ async def get_policy(
     "/",
     response_model=List[PolicySchema],
     summary="List Policies",
-    description="Retrieve a list of policies with optional filtering and pagination.",
+    description=(
+        "Retrieve a list of policies with optional filtering and pagination. "
+        "Use format=arrow or format=csv for bulk exports."
+    ),
 )
 async def list_policies(
     limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
@@ -101,8 +106,11 @@ async def list_policies(
     status: Optional[str] = Query(None, description="Filter by policy status"),
     policy_type: Optional[str] = Query(None, description="Filter by policy type"),
     state: Optional[str] = Query(None, description="Filter by insured state"),
+    output_format: ExportFormat = Query(
+        "json", alias="format", description="Response format: json, arrow or csv"
+    ),
     repo: PolicyRepository = Depends(get_policy_repository),
-) -> List[PolicySchema]:
+) -> Union[List[PolicySchema], Response]:
     """List policies with filtering and pagination."""
     logger.info(
         "api_list_policies",
@@ -111,6 +119,7 @@ async def list_policies(
         status=status,
         policy_type=policy_type,
         state=state,
+        format=output_format,
     )
 
     filters: Dict[str, Any] = {}
@@ -121,6 +130,10 @@ async def list_policies(
     if state:
         filters["INSURED_STATE"] = state.upper()
 
+    if output_format != "json":
+        table = await repo.find_all_arrow(limit=limit, offset=offset, filters=filters)
+        return table_response(table, output_format)
+
     policies = await repo.find_all(limit=limit, offset=offset, filters=filters)
     return [_domain_to_schema(policy) for policy in policies]
 
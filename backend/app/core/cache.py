@@ -2,12 +2,13 @@
 
 import asyncio
 import hashlib
+import inspect
 import json
 import pickle
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, TypeVar, Dict, Optional
+from typing import Any, TypeVar, Dict, Optional, get_type_hints
 
 try:
     from typing import ParamSpec
@@ -15,6 +16,9 @@ except ImportError:
     from typing_extensions import ParamSpec
 
 import structlog
+from pydantic import BaseModel, TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from ..config import get_settings
 
@@ -27,6 +31,20 @@ T = TypeVar("T")
 _memory_cache: Dict[str, tuple[Any, datetime]] = {}
 _cache_lock = asyncio.Lock()
 
+# Shared Redis tier (lazily connected) and in-flight recomputes per key
+_redis_client: Optional[Redis] = None
+_inflight: Dict[str, asyncio.Event] = {}
+
+# Namespace for this cache's Redis keys, so clearing never touches other data
+REDIS_KEY_PREFIX = "ltc_cache:"
+
+
+def _serialize_arg(arg: Any) -> Any:
+    """Convert an argument into a stable, JSON-serializable form."""
+    if isinstance(arg, BaseModel):
+        return arg.model_dump(mode="json")
+    return str(arg)
+
 
 def get_cache_key(*args: Any, **kwargs: Any) -> str:
     """
@@ -42,8 +60,8 @@ def get_cache_key(*args: Any, **kwargs: Any) -> str:
     try:
         # Serialize arguments to JSON for consistent hashing
         key_data = {
-            "args": [str(arg) for arg in args],
-            "kwargs": {k: str(v) for k, v in sorted(kwargs.items())},
+            "args": [_serialize_arg(arg) for arg in args],
+            "kwargs": {k: _serialize_arg(v) for k, v in sorted(kwargs.items())},
         }
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.md5(key_str.encode()).hexdigest()
@@ -76,6 +94,47 @@ async def _set_in_memory_cache(key: str, value: Any, ttl: int) -> None:
         logger.debug("cache_set", key=key[:8], ttl=ttl)
 
 
+def _get_redis_client() -> Optional[Redis]:
+    """Get the shared Redis client, or None when Redis is not configured."""
+    global _redis_client
+    if _redis_client is None:
+        settings = get_settings()
+        if not settings.redis_url:
+            return None
+        _redis_client = Redis.from_url(settings.redis_url)
+    return _redis_client
+
+
+async def _get_from_redis_cache(key: str, adapter: TypeAdapter) -> Optional[Any]:
+    """Get value from the shared Redis cache."""
+    client = _get_redis_client()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(REDIS_KEY_PREFIX + key)
+    except RedisError as e:
+        logger.warning("redis_get_failed", key=key[:8], error=str(e))
+        return None
+    if raw is None:
+        return None
+    logger.debug("redis_cache_hit", key=key[:8])
+    return adapter.validate_json(raw)
+
+
+async def _set_in_redis_cache(
+    key: str, value: Any, ttl: int, adapter: TypeAdapter
+) -> None:
+    """Set value in the shared Redis cache with SETEX."""
+    client = _get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.setex(REDIS_KEY_PREFIX + key, ttl, adapter.dump_json(value))
+        logger.debug("redis_cache_set", key=key[:8], ttl=ttl)
+    except RedisError as e:
+        logger.warning("redis_set_failed", key=key[:8], error=str(e))
+
+
 async def _clear_memory_cache() -> None:
     """Clear all entries from in-memory cache."""
     async with _cache_lock:
@@ -105,37 +164,77 @@ def cache_result(
     cache_ttl = ttl if ttl is not None else settings.cache_ttl
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        func_name = f"{func.__module__}.{func.__name__}"
+        signature = inspect.signature(func)
+        is_method = next(iter(signature.parameters), None) == "self"
+        adapter: Optional[TypeAdapter] = None
+
+        def build_key(*args: Any, **kwargs: Any) -> str:
+            # Bind to the signature so positional/keyword/default calls share
+            # a key, and drop `self` so keys are shared across instances.
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if is_method:
+                arguments.pop("self", None)
+            return f"{key_prefix}:{func_name}:{get_cache_key(**arguments)}"
+
+        def get_adapter() -> TypeAdapter:
+            nonlocal adapter
+            if adapter is None:
+                return_type = get_type_hints(func).get("return", Any)
+                adapter = TypeAdapter(return_type)
+            return adapter
+
+        async def compute_and_store(cache_key: str, *args: Any, **kwargs: Any) -> T:
+            logger.debug("cache_miss", function=func_name)
+            result = await func(*args, **kwargs)
+            await _set_in_memory_cache(cache_key, result, cache_ttl)
+            await _set_in_redis_cache(cache_key, result, cache_ttl, get_adapter())
+            return result
+
         @wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             if not cache_enabled:
                 return await func(*args, **kwargs)
 
-            # Generate cache key
-            func_name = f"{func.__module__}.{func.__name__}"
-            cache_key = f"{key_prefix}:{func_name}:{get_cache_key(*args, **kwargs)}"
+            cache_key = build_key(*args, **kwargs)
 
-            # Try to get from cache
+            # Local tier, then the shared Redis tier
             cached_value = await _get_from_memory_cache(cache_key)
             if cached_value is not None:
                 return cached_value
 
-            # Execute function
-            logger.debug("cache_miss", function=func_name)
-            result = await func(*args, **kwargs)
-
-            # Store in cache
-            await _set_in_memory_cache(cache_key, result, cache_ttl)
+            cached_value = await _get_from_redis_cache(cache_key, get_adapter())
+            if cached_value is not None:
+                await _set_in_memory_cache(cache_key, cached_value, cache_ttl)
+                return cached_value
 
-            return result
+            # Single-flight: wait for an in-progress recompute of the same key
+            pending = _inflight.get(cache_key)
+            if pending is not None:
+                logger.debug("cache_wait_inflight", key=cache_key[:8])
+                await pending.wait()
+                cached_value = await _get_from_memory_cache(cache_key)
+                if cached_value is not None:
+                    return cached_value
+                # The leader failed; recompute without coalescing
+                return await compute_and_store(cache_key, *args, **kwargs)
+
+            event = asyncio.Event()
+            _inflight[cache_key] = event
+            try:
+                return await compute_and_store(cache_key, *args, **kwargs)
+            finally:
+                del _inflight[cache_key]
+                event.set()
 
         @wraps(func)
         def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             if not cache_enabled:
                 return func(*args, **kwargs)
 
-            # Generate cache key
-            func_name = f"{func.__module__}.{func.__name__}"
-            cache_key = f"{key_prefix}:{func_name}:{get_cache_key(*args, **kwargs)}"
+            cache_key = build_key(*args, **kwargs)
 
             # Try to get from cache (sync version)
             if cache_key in _memory_cache:
@@ -170,14 +269,24 @@ async def clear_cache(pattern: Optional[str] = None) -> int:
     Clear cache entries.
 
     Args:
-        pattern: Optional pattern to match keys (not implemented for memory cache)
+        pattern: Optional glob pattern to match cache keys, applied within
+            this cache's Redis namespace; defaults to every entry of this
+            cache (the in-memory cache is always cleared completely)
 
     Returns:
-        int: Number of entries cleared
+        int: Number of Redis entries cleared
     """
-    if pattern:
-        logger.warning("pattern_matching_not_supported", pattern=pattern)
-
     await _clear_memory_cache()
-    return len(_memory_cache)
 
+    client = _get_redis_client()
+    if client is None:
+        return 0
+
+    deleted = 0
+    try:
+        async for key in client.scan_iter(match=REDIS_KEY_PREFIX + (pattern or "*")):
+            deleted += await client.delete(key)
+    except RedisError as e:
+        logger.warning("redis_clear_failed", pattern=pattern, error=str(e))
+    logger.info("redis_cache_cleared", pattern=pattern, entries=deleted)
+    return deleted
@@ -9,6 +9,7 @@ from .core.snowpark_session import SnowparkSessionManager, get_session_manager
 from .repositories.claims_repo import ClaimsRepository
 from .repositories.policy_repo import PolicyRepository
 from .services.analytics_service import AnalyticsService
+from .services.claim_loader import ClaimLoader
 from .services.claims_service import ClaimsService
 
 
@@ -72,17 +73,37 @@ async def get_analytics_service(
     return AnalyticsService(claims_repo, policy_repo)
 
 
+async def get_claim_loader(
+    claims_repo: ClaimsRepository = Depends(get_claims_repository),
+) -> ClaimLoader:
+    """
+    Dependency to get a request-scoped claim loader.
+
+    FastAPI resolves each dependency once per request, so every request
+    gets its own loader and batches never mix callers.
+
+    Args:
+        claims_repo: Claims repository
+
+    Returns:
+        ClaimLoader instance
+    """
+    return ClaimLoader(claims_repo)
+
+
 async def get_claims_service(
     claims_repo: ClaimsRepository = Depends(get_claims_repository),
+    claim_loader: ClaimLoader = Depends(get_claim_loader),
 ) -> ClaimsService:
     """
     Dependency to get claims service.
 
     Args:
         claims_repo: Claims repository
+        claim_loader: Request-scoped claim loader
 
     Returns:
         ClaimsService instance
     """
-    return ClaimsService(claims_repo)
+    return ClaimsService(claims_repo, claim_loader)
 
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 from typing import Dict
@@ -7,13 +8,17 @@ from typing import Dict
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from .api.routes import analytics, claims, policies
 from .config import get_settings
 from .core.exceptions import DataServiceError
-from .core.snowpark_session import get_session_manager
+from .core.snowpark_session import SnowparkSessionManager, get_session_manager
 from .models.schemas import HealthCheckResponse
+from .repositories.claims_repo import ClaimsRepository
+from .repositories.policy_repo import PolicyRepository
+from .services.analytics_service import AnalyticsService
 
 # Configure structured logging
 structlog.configure(
@@ -37,6 +42,32 @@ structlog.configure(
 logger = structlog.get_logger(__name__)
 
 
+async def prewarm_analytics_cache(session_manager: SnowparkSessionManager) -> None:
+    """
+    Keep the unfiltered dashboard analytics warm in the cache.
+
+    Recomputes once per cache TTL so the landing-page queries are served
+    from cache instead of every worker missing at the same time.
+
+    Args:
+        session_manager: Session manager used to run the warm-up queries
+    """
+    settings = get_settings()
+    while True:
+        try:
+            async with session_manager.get_session() as session:
+                service = AnalyticsService(
+                    ClaimsRepository(session), PolicyRepository(session)
+                )
+                await asyncio.gather(
+                    service.get_claims_summary(), service.get_policy_metrics()
+                )
+            logger.info("analytics_cache_prewarmed")
+        except Exception as e:
+            logger.warning("analytics_cache_prewarm_failed", error=str(e))
+        await asyncio.sleep(settings.cache_ttl)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler for startup and shutdown."""
@@ -56,10 +87,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     else:
         logger.warning("database_connection_unhealthy", health=health)
 
+    prewarm_task = None
+    if settings.cache_enabled and settings.cache_ttl > 0:
+        prewarm_task = asyncio.create_task(prewarm_analytics_cache(session_manager))
+
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
+    if prewarm_task is not None:
+        prewarm_task.cancel()
     await session_manager.close_all()
     logger.info("application_shutdown_complete")
 
@@ -102,6 +139,9 @@ app.add_middleware(
     allow_headers=settings.cors_headers,
 )
 
+# Compress JSON responses for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Global exception handler
 @app.exception_handler(DataServiceError)
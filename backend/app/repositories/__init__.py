@@ -1,6 +1,6 @@
 """Repository pattern implementations for data access."""
 
-from .base import BaseRepository
+from .base import BaseRepository, Range
 from .claims_repo import ClaimsRepository
 from .policy_repo import PolicyRepository
 
@@ -8,5 +8,6 @@ __all__ = [
     "BaseRepository",
     "ClaimsRepository",
     "PolicyRepository",
+    "Range",
 ]
 
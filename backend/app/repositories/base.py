@@ -1,12 +1,34 @@
 """Abstract base repository with generic CRUD operations."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Generic, Optional, TypeVar, Dict, List
 
+import pyarrow as pa
 from snowflake.snowpark import Session
 
 T = TypeVar("T")
 
+# Clustering / partition-pruning columns, filtered first so Snowflake can
+# prune micro-partitions before evaluating the remaining predicates.
+_PRUNING_COLUMNS = (
+    "POLICY_SNAPSHOT_DATE",
+    "SNAPSHOT_DATE",
+    "ORIGINAL_EFFECTIVE_DT",
+    "CARRIER_NAME",
+    "ENVIRONMENT",
+)
+_PRUNING_ORDER = {column: i for i, column in enumerate(_PRUNING_COLUMNS)}
+
+
+@dataclass(frozen=True)
+class Range:
+    """Inclusive ``low <= column <= high`` filter value; either bound may be None."""
+
+    low: Any = None
+    high: Any = None
+
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository for data access operations."""
@@ -21,6 +43,12 @@ class BaseRepository(ABC, Generic[T]):
         """Get the table name for this repository."""
         ...
 
+    @property
+    @abstractmethod
+    def id_column(self) -> str:
+        """Get the primary key column, used as the stable sort for pagination."""
+        ...
+
     @abstractmethod
     async def find_by_id(self, id_value: str) -> Optional[T]:
         """
@@ -67,15 +95,53 @@ class BaseRepository(ABC, Generic[T]):
         """
         ...
 
+    async def find_all_arrow(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Find entities as an Arrow table, skipping domain-model conversion.
+
+        Intended for bulk exports where rows are serialized straight from
+        the columnar result.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+            filters: Optional filter conditions
+
+        Returns:
+            pyarrow.Table with the raw table columns
+        """
+        loop = asyncio.get_event_loop()
+
+        def query() -> Any:
+            df = self._apply_filters(self.session.table(self.table_name), filters)
+            if limit:
+                # Without a total order, LIMIT/OFFSET pages may overlap or skip rows
+                df = df.order_by(self.id_column).limit(limit, offset=offset or 0)
+            # DataFrame.to_arrow is missing from older Snowpark releases
+            if hasattr(df, "to_arrow"):
+                return df.to_arrow()
+            return pa.Table.from_pandas(df.to_pandas(), preserve_index=False)
+
+        return await loop.run_in_executor(None, query)
+
     def _apply_filters(
         self, df: Any, filters: Optional[Dict[str, Any]]
     ) -> Any:
         """
         Apply filters to a Snowpark DataFrame.
 
+        Clustering-key columns are filtered first. Values are wrapped in
+        ``lit`` so literal types are explicit in the generated SQL.
+
         Args:
             df: Snowpark DataFrame
-            filters: Dictionary of column: value filters
+            filters: Dictionary of column: value filters. A list or tuple
+                matches any of its values; a ``Range`` is an inclusive range.
 
         Returns:
             Filtered DataFrame
@@ -83,14 +149,27 @@ class BaseRepository(ABC, Generic[T]):
         if not filters:
             return df
 
-        from snowflake.snowpark.functions import col
-
-        for column, value in filters.items():
-            if value is not None:
-                if isinstance(value, (list, tuple)):
-                    df = df.filter(col(column).in_(value))
-                else:
-                    df = df.filter(col(column) == value)
+        from snowflake.snowpark.functions import col, lit
+
+        ordered = sorted(
+            filters.items(),
+            key=lambda item: _PRUNING_ORDER.get(item[0].upper(), len(_PRUNING_ORDER)),
+        )
+
+        for column, value in ordered:
+            if value is None:
+                continue
+            if isinstance(value, Range):
+                low, high = value.low, value.high
+                if low is not None and high is not None:
+                    df = df.filter(col(column).between(lit(low), lit(high)))
+                elif low is not None:
+                    df = df.filter(col(column) >= lit(low))
+                elif high is not None:
+                    df = df.filter(col(column) <= lit(high))
+            elif isinstance(value, (list, tuple)):
+                df = df.filter(col(column).in_([lit(v) for v in value]))
+            else:
+                df = df.filter(col(column) == lit(value))
 
         return df
-
@@ -28,6 +28,11 @@ class ClaimsRepository(BaseRepository[Claim]):
         """Get claims table name."""
         return self._table_name
 
+    @property
+    def id_column(self) -> str:
+        """Get claims primary key column."""
+        return "TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID"
+
     async def find_by_id(self, claim_id: str) -> Optional[Claim]:
         """Find claim by ID."""
         try:
@@ -48,6 +53,28 @@ class ClaimsRepository(BaseRepository[Claim]):
             logger.error("find_claim_by_id_failed", claim_id=claim_id, error=str(e))
             return None
 
+    async def find_by_ids(self, claim_ids: List[str]) -> List[Claim]:
+        """Find claims for a batch of IDs in a single query."""
+        if not claim_ids:
+            return []
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            def query() -> Any:
+                return (
+                    self.session.table(self.table_name)
+                    .filter(col("TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID").in_(claim_ids))
+                    .collect()
+                )
+
+            rows = await loop.run_in_executor(None, query)
+            return [self._row_to_claim(row) for row in rows]
+        except Exception as e:
+            # Re-raised so batched callers fail instead of seeing a missing claim
+            logger.error("find_claims_by_ids_failed", count=len(claim_ids), error=str(e))
+            raise
+
     async def find_all(
         self,
         limit: Optional[int] = 100,
@@ -3,7 +3,8 @@
 import asyncio
 from datetime import date
 from decimal import Decimal
-from typing import Any, Optional, List, Dict
+from functools import cached_property
+from typing import Any, Optional, List, Dict, Tuple
 
 import structlog
 from snowflake.snowpark import Session
@@ -28,13 +29,47 @@ class PolicyRepository(BaseRepository[Policy]):
         """Get policies table name."""
         return self._table_name
 
+    @property
+    def id_column(self) -> str:
+        """Get policies primary key column."""
+        return "POLICY_MONTHLY_SNAPSHOT_ID"
+
+    @cached_property
+    def _base_df(self) -> Any:
+        """Get the policies table DataFrame, built once per repository."""
+        # Repositories are created per checked-out session, so this never
+        # outlives the session it was built from.
+        return self.session.table(self.table_name)
+
+    def _filtered(self, start_date: Optional[date], end_date: Optional[date]) -> Any:
+        """
+        Get the policies table filtered to an effective-date window.
+
+        The DataFrame stays lazy: each query built on it pushes the filter
+        down to Snowflake. Nothing is materialized into temp tables, so there
+        is no per-session state to clean up and no lock to hold across queries.
+
+        Args:
+            start_date: Optional start of the effective-date window
+            end_date: Optional end of the effective-date window
+
+        Returns:
+            Lazy Snowpark DataFrame
+        """
+        df = self._base_df
+        if start_date:
+            df = df.filter(col("ORIGINAL_EFFECTIVE_DT") >= start_date)
+        if end_date:
+            df = df.filter(col("ORIGINAL_EFFECTIVE_DT") <= end_date)
+        return df
+
     async def find_by_id(self, policy_id: str) -> Optional[Policy]:
         """Find policy by ID."""
         try:
             loop = asyncio.get_event_loop()
             df = await loop.run_in_executor(
                 None,
-                lambda: self.session.table(self.table_name).filter(
+                lambda: self._base_df.filter(
                     col("POLICY_MONTHLY_SNAPSHOT_ID") == policy_id
                 ),
             )
@@ -59,7 +94,7 @@ class PolicyRepository(BaseRepository[Policy]):
             loop = asyncio.get_event_loop()
 
             def query() -> Any:
-                df = self.session.table(self.table_name)
+                df = self._base_df
                 df = self._apply_filters(df, filters)
 
                 if offset:
@@ -81,7 +116,7 @@ class PolicyRepository(BaseRepository[Policy]):
             loop = asyncio.get_event_loop()
 
             def query() -> int:
-                df = self.session.table(self.table_name)
+                df = self._base_df
                 df = self._apply_filters(df, filters)
                 return df.count()
 
@@ -98,7 +133,7 @@ class PolicyRepository(BaseRepository[Policy]):
             loop = asyncio.get_event_loop()
 
             def query() -> Any:
-                df = self.session.table(self.table_name)
+                df = self._base_df
 
                 if start_date:
                     df = df.filter(col("ORIGINAL_EFFECTIVE_DT") >= start_date)
@@ -132,62 +167,63 @@ class PolicyRepository(BaseRepository[Policy]):
             logger.error("get_policy_metrics_failed", error=str(e))
             return {}
 
-    async def get_policies_by_status(
+    async def get_status_and_type_counts(
         self, start_date: Optional[date] = None, end_date: Optional[date] = None
-    ) -> Dict[str, int]:
-        """Get policy counts grouped by status."""
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Get policy counts grouped by status and by type from one scan.
+
+        The effective-date window is grouped once by (status, type) and the
+        two breakdowns are rolled up from those rows.
+
+        Args:
+            start_date: Optional start of the effective-date window
+            end_date: Optional end of the effective-date window
+
+        Returns:
+            Tuple of (counts by status, counts by type)
+        """
         try:
             loop = asyncio.get_event_loop()
 
             def query() -> Any:
-                df = self.session.table(self.table_name)
-
-                if start_date:
-                    df = df.filter(col("ORIGINAL_EFFECTIVE_DT") >= start_date)
-                if end_date:
-                    df = df.filter(col("ORIGINAL_EFFECTIVE_DT") <= end_date)
+                df = self._filtered(start_date, end_date)
 
+                # Use BENEFIT_INFLATION as a proxy for policy type
                 return (
-                    df.group_by("CLAIM_STATUS_CD")
+                    df.group_by("CLAIM_STATUS_CD", "BENEFIT_INFLATION")
                     .agg(count(col("POLICY_MONTHLY_SNAPSHOT_ID")).alias("COUNT"))
                     .collect()
                 )
 
             rows = await loop.run_in_executor(None, query)
 
-            return {row["CLAIM_STATUS_CD"]: row["COUNT"] for row in rows if row["CLAIM_STATUS_CD"]}
+            by_status: Dict[str, int] = {}
+            by_type: Dict[str, int] = {}
+            for row in rows:
+                if row["CLAIM_STATUS_CD"]:
+                    status = row["CLAIM_STATUS_CD"]
+                    by_status[status] = by_status.get(status, 0) + row["COUNT"]
+                policy_type = row["BENEFIT_INFLATION"] or "UNKNOWN"
+                by_type[policy_type] = by_type.get(policy_type, 0) + row["COUNT"]
+            return by_status, by_type
         except Exception as e:
-            logger.error("get_policies_by_status_failed", error=str(e))
-            return {}
+            logger.error("get_status_and_type_counts_failed", error=str(e))
+            return {}, {}
+
+    async def get_policies_by_status(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> Dict[str, int]:
+        """Get policy counts grouped by status."""
+        by_status, _ = await self.get_status_and_type_counts(start_date, end_date)
+        return by_status
 
     async def get_policies_by_type(
         self, start_date: Optional[date] = None, end_date: Optional[date] = None
     ) -> Dict[str, int]:
         """Get policy counts grouped by type."""
-        try:
-            loop = asyncio.get_event_loop()
-
-            def query() -> Any:
-                df = self.session.table(self.table_name)
-
-                if start_date:
-                    df = df.filter(col("ORIGINAL_EFFECTIVE_DT") >= start_date)
-                if end_date:
-                    df = df.filter(col("ORIGINAL_EFFECTIVE_DT") <= end_date)
-
-                # Use BENEFIT_INFLATION as a proxy for policy type
-                return (
-                    df.group_by("BENEFIT_INFLATION")
-                    .agg(count(col("POLICY_MONTHLY_SNAPSHOT_ID")).alias("COUNT"))
-                    .collect()
-                )
-
-            rows = await loop.run_in_executor(None, query)
-
-            return {row["BENEFIT_INFLATION"] or "UNKNOWN": row["COUNT"] for row in rows}
-        except Exception as e:
-            logger.error("get_policies_by_type_failed", error=str(e))
-            return {}
+        _, by_type = await self.get_status_and_type_counts(start_date, end_date)
+        return by_type
 
     async def calculate_lapse_rate(
         self, start_date: Optional[date] = None, end_date: Optional[date] = None
@@ -197,7 +233,7 @@ class PolicyRepository(BaseRepository[Policy]):
             loop = asyncio.get_event_loop()
 
             def query() -> tuple[int, int]:
-                df = self.session.table(self.table_name)
+                df = self._base_df
 
                 if start_date:
                     df = df.filter(col("ORIGINAL_EFFECTIVE_DT") >= start_date)
@@ -1,6 +1,6 @@
 """Analytics service for LTC insurance business logic."""
 
-from typing import Any, Optional, Dict, List
+from typing import Any, Awaitable, Optional, Dict, List
 import asyncio
 from datetime import date
 from decimal import Decimal
@@ -21,6 +21,29 @@ from ..repositories.policy_repo import PolicyRepository
 logger = structlog.get_logger(__name__)
 
 
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Run awaitables concurrently, cancelling the rest if any of them fails.
+
+    Gives the structured-concurrency guarantee of ``asyncio.TaskGroup``
+    while staying compatible with Python 3.9 and re-raising the original
+    exception rather than an ``ExceptionGroup``.
+
+    Args:
+        *aws: Awaitables to run
+
+    Returns:
+        List of results in argument order
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 class AnalyticsService:
     """Service for analytics and reporting operations."""
 
@@ -47,15 +70,11 @@ class AnalyticsService:
         logger.info("generating_comprehensive_analytics", filters=request.model_dump())
 
         # Run claims and policy analytics concurrently
-        claims_task = asyncio.create_task(
-            self.get_claims_summary(request.start_date, request.end_date)
-        )
-        policy_task = asyncio.create_task(
-            self.get_policy_metrics(request.start_date, request.end_date)
+        claim_summary, policy_metrics = await _gather_or_cancel(
+            self.get_claims_summary(request.start_date, request.end_date),
+            self.get_policy_metrics(request.start_date, request.end_date),
         )
 
-        claim_summary, policy_metrics = await asyncio.gather(claims_task, policy_task)
-
         return AnalyticsResponse(
             claim_summary=claim_summary,
             policy_metrics=policy_metrics,
@@ -79,18 +98,10 @@ class AnalyticsService:
         logger.info("generating_claims_summary", start_date=start_date, end_date=end_date)
 
         # Run multiple queries concurrently
-        summary_task = asyncio.create_task(
-            self.claims_repo.get_claims_summary(start_date, end_date)
-        )
-        by_status_task = asyncio.create_task(
-            self.claims_repo.get_claims_by_status(start_date, end_date)
-        )
-        processing_days_task = asyncio.create_task(
-            self.claims_repo.get_avg_processing_days(start_date, end_date)
-        )
-
-        summary, by_status, avg_processing_days = await asyncio.gather(
-            summary_task, by_status_task, processing_days_task
+        summary, by_status, avg_processing_days = await _gather_or_cancel(
+            self.claims_repo.get_claims_summary(start_date, end_date),
+            self.claims_repo.get_claims_by_status(start_date, end_date),
+            self.claims_repo.get_avg_processing_days(start_date, end_date),
         )
 
         # Extract counts by status
@@ -142,21 +153,10 @@ class AnalyticsService:
         logger.info("generating_policy_metrics", start_date=start_date, end_date=end_date)
 
         # Run multiple queries concurrently
-        metrics_task = asyncio.create_task(
-            self.policy_repo.get_policy_metrics(start_date, end_date)
-        )
-        by_status_task = asyncio.create_task(
-            self.policy_repo.get_policies_by_status(start_date, end_date)
-        )
-        by_type_task = asyncio.create_task(
-            self.policy_repo.get_policies_by_type(start_date, end_date)
-        )
-        lapse_rate_task = asyncio.create_task(
-            self.policy_repo.calculate_lapse_rate(start_date, end_date)
-        )
-
-        metrics, by_status, by_type, lapse_rate = await asyncio.gather(
-            metrics_task, by_status_task, by_type_task, lapse_rate_task
+        metrics, (by_status, by_type), lapse_rate = await _gather_or_cancel(
+            self.policy_repo.get_policy_metrics(start_date, end_date),
+            self.policy_repo.get_status_and_type_counts(start_date, end_date),
+            self.policy_repo.calculate_lapse_rate(start_date, end_date),
         )
 
         # Extract counts by status
@@ -0,0 +1,85 @@
+"""Request-scoped batching loader for claims."""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+from ..models.domain import Claim
+from ..repositories.claims_repo import ClaimsRepository
+
+logger = structlog.get_logger(__name__)
+
+
+class ClaimLoader:
+    """
+    Coalesce concurrent claim lookups into one repository query.
+
+    Lookups arriving within ``batch_window`` seconds of each other are
+    flushed together through ``ClaimsRepository.find_by_ids``. A lone
+    lookup is flushed right away instead of waiting out the window. A
+    loader must only live for a single request so batches never mix callers.
+    """
+
+    def __init__(
+        self, claims_repo: ClaimsRepository, batch_window: float = 0.005
+    ) -> None:
+        """Initialize loader with repository and flush window in seconds."""
+        self.claims_repo = claims_repo
+        self.batch_window = batch_window
+        self._queue: asyncio.Queue[Tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load(self, claim_id: str) -> Optional[Claim]:
+        """
+        Load a claim by ID, batched with other concurrent loads.
+
+        Args:
+            claim_id: Claim identifier
+
+        Returns:
+            Claim if found, otherwise None
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((claim_id, future))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the batch window, then resolve all queued lookups.
+
+        Repository errors are set on every waiting future, so callers see the
+        failure rather than a missing claim.
+        """
+        # Let loads started in the same tick enqueue; only wait out the
+        # window when there is something to batch with
+        await asyncio.sleep(0)
+        if self._queue.qsize() > 1:
+            await asyncio.sleep(self.batch_window)
+
+        batch: List[Tuple[str, asyncio.Future]] = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        # Loads arriving from here on start a new batch
+        self._flush_task = None
+
+        claim_ids = list(dict.fromkeys(claim_id for claim_id, _ in batch))
+        logger.debug("claim_loader_flush", batch_size=len(batch), unique_ids=len(claim_ids))
+
+        try:
+            claims = await self.claims_repo.find_by_ids(claim_ids)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id: Dict[str, Claim] = {
+            claim.tpa_fee_worksheet_snapshot_fact_id: claim for claim in claims
+        }
+        for claim_id, future in batch:
+            if not future.done():
+                future.set_result(by_id.get(claim_id))
@@ -1,26 +1,49 @@
 """Claims service for claim-specific business logic."""
 
-from typing import Any, Dict, Optional, List
+from datetime import date, datetime, time as _time
+from decimal import Decimal
+from typing import Any, Dict, Optional, List, Union
 
 import structlog
 
-from ..core.cache import cache_result
 from ..core.exceptions import ResourceNotFoundError
 from ..models.domain import Claim
 from ..models.schemas import ClaimSchema
 from ..repositories.claims_repo import ClaimsRepository
+from .claim_loader import ClaimLoader
+
+__all__ = ["ClaimsService"]
 
 logger = structlog.get_logger(__name__)
 
+_MIDNIGHT = _time.min
+_DECIMAL_ZERO = Decimal(0)
+
+
+def _to_datetime(value: Optional[Union[date, datetime]]) -> Optional[datetime]:
+    """Promote a date to a midnight datetime, passing datetimes and None through."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, _MIDNIGHT) if value else None
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a numeric value to Decimal, treating missing values as zero."""
+    return Decimal(str(value)) if value else _DECIMAL_ZERO
+
 
 class ClaimsService:
     """Service for claims business operations."""
 
-    def __init__(self, claims_repo: ClaimsRepository) -> None:
-        """Initialize claims service with repository."""
+    def __init__(
+        self,
+        claims_repo: ClaimsRepository,
+        claim_loader: Optional[ClaimLoader] = None,
+    ) -> None:
+        """Initialize claims service with repository and request-scoped loader."""
         self.claims_repo = claims_repo
+        self.claim_loader = claim_loader or ClaimLoader(claims_repo)
 
-    @cache_result(ttl=60, key_prefix="claim:by_id")
     async def get_claim_by_id(self, claim_id: str) -> ClaimSchema:
         """
         Get claim by ID.
@@ -36,7 +59,7 @@ class ClaimsService:
         """
         logger.info("fetching_claim", claim_id=claim_id)
 
-        claim = await self.claims_repo.find_by_id(claim_id)
+        claim = await self.claim_loader.load(claim_id)
         if not claim:
             raise ResourceNotFoundError(
                 message=f"Claim {claim_id} not found",
@@ -70,6 +93,29 @@ class ClaimsService:
 
         return [self._domain_to_schema(claim) for claim in claims]
 
+    async def get_claims_arrow(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Get claims as an Arrow table for bulk export.
+
+        Args:
+            limit: Maximum results to return
+            offset: Number of results to skip
+            filters: Optional filter criteria
+
+        Returns:
+            pyarrow.Table of raw claim rows
+        """
+        logger.info("exporting_claims", limit=limit, offset=offset, filters=filters)
+
+        return await self.claims_repo.find_all_arrow(
+            limit=limit, offset=offset, filters=filters
+        )
+
     async def count_claims(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count claims matching filters.
@@ -84,24 +130,10 @@ class ClaimsService:
 
     def _domain_to_schema(self, claim: Claim) -> ClaimSchema:
         """Convert domain model to API schema - adapted for new table structure."""
-        # Convert datetime to datetime if needed
-        submission_dt = None
-        if claim.rfb_entered_dt:
-            from datetime import datetime as dt
-            if isinstance(claim.rfb_entered_dt, dt):
-                submission_dt = claim.rfb_entered_dt
-            else:
-                submission_dt = dt.combine(claim.rfb_entered_dt, dt.min.time())
-        
-        approval_dt = None
-        if claim.certification_date:
-            from datetime import datetime as dt
-            approval_dt = dt.combine(claim.certification_date, dt.min.time())
-        
-        # Calculate claim amount from decision counts
-        total_decisions = claim.total_decisions()
-        claim_amount = Decimal(str(claim.ongoing_rate_month or 0))
-        
+        submission_dt = _to_datetime(claim.rfb_entered_dt)
+        approval_dt = _to_datetime(claim.certification_date)
+        is_approved = claim.is_approved()
+
         return ClaimSchema(
             # Core identifiers
             claim_id=claim.tpa_fee_worksheet_snapshot_fact_id,
@@ -123,13 +155,13 @@ class ClaimsService:
             certification_date=claim.certification_date,
             
             # Financial information
-            claim_amount=claim_amount,
-            approved_amount=Decimal(str(claim.initial_decisions_facilities or 0)) if claim.is_approved() else None,
+            claim_amount=_to_decimal(claim.ongoing_rate_month),
+            approved_amount=_to_decimal(claim.initial_decisions_facilities) if is_approved else None,
             paid_amount=None,  # Not available in new structure
             
             # Processing information
             processing_days=claim.rfb_process_to_decision_tat,
-            denial_reason=None if claim.is_approved() else claim.decision,
+            denial_reason=None if is_approved else claim.decision,
             
             # RFB information
             rfb_id=claim.rfb_id,
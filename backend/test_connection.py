@@ -1,5 +1,6 @@
 """Test Snowflake connection with current credentials."""
 
+import io
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -7,92 +8,116 @@ sys.path.insert(0, str(Path(__file__).parent))
 from app.config import get_settings
 from snowflake.snowpark import Session
 
+PLACEHOLDER_VALUES = frozenset({"your_account", "your_user", "your_warehouse"})
+
+_output = io.StringIO()
+
+def _say(line=""):
+    """Buffer one line of output."""
+    _output.write(line + "\n")
+
+def _flush():
+    """Write all buffered output in a single call."""
+    sys.stdout.write(_output.getvalue())
+    sys.stdout.flush()
+    _output.seek(0)
+    _output.truncate()
+
 def test_connection():
     """Test Snowflake connection."""
-    print("\n" + "="*60)
-    print("Testing Snowflake Connection")
-    print("="*60 + "\n")
+    _say("\n" + "="*60)
+    _say("Testing Snowflake Connection")
+    _say("="*60 + "\n")
     
     settings = get_settings()
     
-    print("Configuration loaded:")
-    print(f"  Account: {settings.snowflake_account}")
-    print(f"  User: {settings.snowflake_user}")
-    print(f"  Warehouse: {settings.snowflake_warehouse}")
-    print(f"  Database: {settings.snowflake_database}")
-    print(f"  Schema: {settings.snowflake_schema}")
-    print()
+    _say("Configuration loaded:")
+    _say(f"  Account: {settings.snowflake_account}")
+    _say(f"  User: {settings.snowflake_user}")
+    _say(f"  Warehouse: {settings.snowflake_warehouse}")
+    _say(f"  Database: {settings.snowflake_database}")
+    _say(f"  Schema: {settings.snowflake_schema}")
+    _say()
     
     # Check for placeholder values
-    if any([
-        settings.snowflake_account == "your_account",
-        settings.snowflake_user == "your_user",
-        settings.snowflake_warehouse == "your_warehouse",
-        "your_" in settings.snowflake_password.lower()
-    ]):
-        print("[ERROR] You are still using placeholder values!")
-        print("\nPlease update your .env file with REAL Snowflake credentials:")
-        print("  1. Open: backend\\.env")
-        print("  2. Replace 'your_account', 'your_user', etc. with actual values")
-        print("  3. Save the file")
-        print("  4. Run this test again")
-        print("\nExample of what to change:")
-        print("  BEFORE: SNOWFLAKE_ACCOUNT=your_account")
-        print("  AFTER:  SNOWFLAKE_ACCOUNT=abc12345.us-east-1")
+    if (
+        {settings.snowflake_account, settings.snowflake_user, settings.snowflake_warehouse}
+        & PLACEHOLDER_VALUES
+        or "your_" in settings.snowflake_password.lower()
+    ):
+        _say("[ERROR] You are still using placeholder values!")
+        _say("\nPlease update your .env file with REAL Snowflake credentials:")
+        _say("  1. Open: backend\\.env")
+        _say("  2. Replace 'your_account', 'your_user', etc. with actual values")
+        _say("  3. Save the file")
+        _say("  4. Run this test again")
+        _say("\nExample of what to change:")
+        _say("  BEFORE: SNOWFLAKE_ACCOUNT=your_account")
+        _say("  AFTER:  SNOWFLAKE_ACCOUNT=abc12345.us-east-1")
+        _flush()
         return False
     
-    print("Attempting to connect to Snowflake...")
+    _say("Attempting to connect to Snowflake...")
+    # Show progress before the (potentially slow) connect
+    _flush()
     
     try:
         connection_params = settings.snowflake_connection_params
         session = Session.builder.configs(connection_params).create()
         
-        # Test query
-        result = session.sql("SELECT CURRENT_TIMESTAMP() as ts, CURRENT_USER() as user").collect()
+        # Single probe: the session was opened with database/schema in its
+        # connection params, so CURRENT_DATABASE()/CURRENT_SCHEMA() are NULL
+        # when either is missing or not accessible - no USE round trips needed.
+        # Submitted without blocking so it runs while the session details print.
+        probe_job = session.sql(
+            "SELECT CURRENT_TIMESTAMP() as ts, CURRENT_USER() as user, "
+            "CURRENT_DATABASE() as db, CURRENT_SCHEMA() as sch"
+        ).collect_nowait()
+        
+        _say("\n[SUCCESS] Connected to Snowflake!")
+        _say(f"  Session ID: {session.session_id}")
         
-        print("\n[SUCCESS] Connected to Snowflake!")
-        print(f"  Timestamp: {result[0]['TS']}")
-        print(f"  User: {result[0]['USER']}")
-        print(f"  Session ID: {session.session_id}")
+        row = probe_job.result()[0]
+        _say(f"  Timestamp: {row['TS']}")
+        _say(f"  User: {row['USER']}")
         
-        # Check if database and schema exist
-        try:
-            session.sql(f"USE DATABASE {settings.snowflake_database}").collect()
-            session.sql(f"USE SCHEMA {settings.snowflake_schema}").collect()
-            print(f"\n[SUCCESS] Database and Schema accessible!")
-        except Exception as e:
-            print(f"\n[WARNING] Cannot access {settings.snowflake_database}.{settings.snowflake_schema}")
-            print(f"   Error: {str(e)}")
-            print(f"   You may need to create the database/schema or check permissions")
+        if row["DB"] and row["SCH"]:
+            _say(f"\n[SUCCESS] Database and Schema accessible!")
+        else:
+            _say(f"\n[WARNING] Cannot access {settings.snowflake_database}.{settings.snowflake_schema}")
+            _say(f"   Current database: {row['DB']}, schema: {row['SCH']}")
+            _say(f"   You may need to create the database/schema or check permissions")
         
         session.close()
-        print("\n" + "="*60)
-        print("Connection test completed successfully!")
-        print("="*60 + "\n")
+        _say("\n" + "="*60)
+        _say("Connection test completed successfully!")
+        _say("="*60 + "\n")
+        _flush()
         return True
         
     except Exception as e:
-        print(f"\n[CONNECTION FAILED]")
-        print(f"Error: {str(e)}\n")
+        _say(f"\n[CONNECTION FAILED]")
+        _say(f"Error: {str(e)}\n")
         
         error_str = str(e).lower()
         if "404" in error_str or "not found" in error_str:
-            print("Troubleshooting tips:")
-            print("  - Check your SNOWFLAKE_ACCOUNT value")
-            print("  - Make sure it's in format: accountname.region")
-            print("  - Example: abc12345.us-east-1")
-            print("  - Don't include '.snowflakecomputing.com'")
+            _say("Troubleshooting tips:")
+            _say("  - Check your SNOWFLAKE_ACCOUNT value")
+            _say("  - Make sure it's in format: accountname.region")
+            _say("  - Example: abc12345.us-east-1")
+            _say("  - Don't include '.snowflakecomputing.com'")
         elif "authentication" in error_str or "password" in error_str:
-            print("Troubleshooting tips:")
-            print("  - Check your username and password")
-            print("  - Make sure there are no extra spaces")
-            print("  - Verify credentials work in Snowflake web UI")
+            _say("Troubleshooting tips:")
+            _say("  - Check your username and password")
+            _say("  - Make sure there are no extra spaces")
+            _say("  - Verify credentials work in Snowflake web UI")
         elif "warehouse" in error_str:
-            print("Troubleshooting tips:")
-            print("  - Check your SNOWFLAKE_WAREHOUSE value")
-            print("  - Make sure the warehouse exists and you have access")
+            _say("Troubleshooting tips:")
+            _say("  - Check your SNOWFLAKE_WAREHOUSE value")
+            _say("  - Make sure the warehouse exists and you have access")
         
-        print("\n" + "="*60)
+        _say("\n" + "="*60)
+        _flush()
         return False
 
 if __name__ == "__main__":
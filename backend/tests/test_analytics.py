@@ -10,7 +10,7 @@ from app.models.schemas import AnalyticsRequest, ClaimSummary, PolicyMetrics
 from app.services.analytics_service import AnalyticsService
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_claims_repo():
     """Create mock claims repository."""
     repo = MagicMock()
@@ -31,7 +31,7 @@ def mock_claims_repo():
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_policy_repo():
     """Create mock policy repository."""
     repo = MagicMock()
@@ -56,20 +56,23 @@ def mock_policy_repo():
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analytics_service(mock_claims_repo, mock_policy_repo):
     """Create analytics service with mocked repositories."""
     return AnalyticsService(mock_claims_repo, mock_policy_repo)
 
 
 @pytest.mark.asyncio
-async def test_get_claims_summary(analytics_service):
-    """Test claims summary generation."""
-    summary = await analytics_service.get_claims_summary(
+async def test_comprehensive_analytics(analytics_service):
+    """Test comprehensive analytics covers claims summary and policy metrics."""
+    request = AnalyticsRequest(
         start_date=date(2024, 1, 1),
         end_date=date(2024, 12, 31)
     )
     
+    response = await analytics_service.get_comprehensive_analytics(request)
+
+    summary = response.claim_summary
     assert isinstance(summary, ClaimSummary)
     assert summary.total_claims == 100
     assert summary.approved_claims == 70
@@ -77,33 +80,12 @@ async def test_get_claims_summary(analytics_service):
     assert summary.pending_claims == 20
     assert summary.approval_rate == 0.7
 
-
-@pytest.mark.asyncio
-async def test_get_policy_metrics(analytics_service):
-    """Test policy metrics generation."""
-    metrics = await analytics_service.get_policy_metrics(
-        start_date=date(2024, 1, 1),
-        end_date=date(2024, 12, 31)
-    )
-    
+    metrics = response.policy_metrics
     assert isinstance(metrics, PolicyMetrics)
     assert metrics.total_policies == 500
     assert metrics.active_policies == 450
     assert metrics.lapsed_policies == 30
     assert metrics.lapse_rate == 0.06
 
-
-@pytest.mark.asyncio
-async def test_comprehensive_analytics(analytics_service):
-    """Test comprehensive analytics generation."""
-    request = AnalyticsRequest(
-        start_date=date(2024, 1, 1),
-        end_date=date(2024, 12, 31)
-    )
-    
-    response = await analytics_service.get_comprehensive_analytics(request)
-    
-    assert response.claim_summary is not None
-    assert response.policy_metrics is not None
     assert isinstance(response.filters_applied, dict)
 
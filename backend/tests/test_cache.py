@@ -0,0 +1,45 @@
+"""Tests for caching utilities."""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import cache_result, clear_cache
+
+
+class Counter:
+    """Service stub that counts how often the cached method really runs."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @cache_result(ttl=60, key_prefix="test:counter", enabled=True)
+    async def compute(self, value: int, scale: int = 1) -> int:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return value * scale
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    """Concurrent calls for one key should run the function once."""
+    await clear_cache()
+    counter = Counter()
+
+    results = await asyncio.gather(*(counter.compute(3) for _ in range(10)))
+
+    assert results == [3] * 10
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_is_shared_across_instances_and_call_styles():
+    """Keys should ignore `self` and normalize positional/keyword/default args."""
+    await clear_cache()
+    first, second = Counter(), Counter()
+
+    assert await first.compute(4) == 4
+    assert await second.compute(value=4, scale=1) == 4
+
+    assert first.calls == 1
+    assert second.calls == 0
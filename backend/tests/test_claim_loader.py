@@ -0,0 +1,33 @@
+"""Tests for the request-scoped claim loader."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.claim_loader import ClaimLoader
+
+
+def make_claim(claim_id: str) -> MagicMock:
+    """Create a claim stub with the given ID."""
+    claim = MagicMock()
+    claim.tpa_fee_worksheet_snapshot_fact_id = claim_id
+    return claim
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched():
+    """Concurrent loads should resolve through one find_by_ids call."""
+    repo = MagicMock()
+    repo.find_by_ids = AsyncMock(return_value=[make_claim("1"), make_claim("2")])
+    loader = ClaimLoader(repo)
+
+    first, second, duplicate, missing = await asyncio.gather(
+        loader.load("1"), loader.load("2"), loader.load("1"), loader.load("3")
+    )
+
+    repo.find_by_ids.assert_awaited_once_with(["1", "2", "3"])
+    assert first.tpa_fee_worksheet_snapshot_fact_id == "1"
+    assert second.tpa_fee_worksheet_snapshot_fact_id == "2"
+    assert duplicate is first
+    assert missing is None
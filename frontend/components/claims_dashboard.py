@@ -1,34 +1,39 @@
 """Claims dashboard component."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from services.api_client import APIClient, ClaimSummary
+from services.api_client import APIClient, APIError, ClaimSummary
 from utils.formatters import (
     format_currency,
+    format_currency_series,
     format_number,
     format_percentage,
 )
 from .visualizations import (
     create_bar_chart,
-    create_kpi_card,
     create_pie_chart,
 )
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_claims_data(
-    api_client: APIClient,
+    _api_client: APIClient,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> tuple[ClaimSummary, list]:
-    """Fetch claims data from API."""
-    summary = api_client.get_claims_summary(start_date, end_date)
-    claims_list = api_client.list_claims(limit=50)
-    return summary, claims_list
+) -> tuple[ClaimSummary, pd.DataFrame]:
+    """Fetch claims data from API, cached per date range across reruns."""
+    # The two requests are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        summary_future = executor.submit(_api_client.get_claims_summary, start_date, end_date)
+        claims_future = executor.submit(_api_client.list_claims_df, limit=20)
+        return summary_future.result(), claims_future.result()
 
 
 def render_claims_dashboard(
@@ -49,65 +54,35 @@ def render_claims_dashboard(
     # Add loading state
     with st.spinner("Loading claims data..."):
         try:
-            summary, claims_list = fetch_claims_data(api_client, start_date, end_date)
-        except Exception as e:
-            st.error(f"Failed to load claims data: {str(e)}")
+            summary, claims_df = fetch_claims_data(api_client, start_date, end_date)
+        except APIError as e:
+            st.error(f"Failed to load claims data: {e}")
             return
 
-    # KPI Row
-    st.subheader("Key Metrics")
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        create_kpi_card(
-            "Total Claims",
-            format_number(summary.total_claims),
-        )
-
-    with col2:
-        create_kpi_card(
-            "Approval Rate",
-            format_percentage(summary.approval_rate),
-        )
-
-    with col3:
-        create_kpi_card(
-            "Avg Processing Time",
-            f"{summary.avg_processing_days:.1f} days",
-        )
-
-    with col4:
-        create_kpi_card(
-            "Total Claim Amount",
-            format_currency(summary.total_claim_amount),
-        )
-
-    # Second KPI Row
-    col5, col6, col7, col8 = st.columns(4)
+    # Convert Decimal amounts once for charts and ratios
+    total_claimed = float(summary.total_claim_amount)
+    total_approved = float(summary.total_approved_amount)
+    total_paid = float(summary.total_paid_amount)
 
-    with col5:
-        create_kpi_card(
-            "Approved Claims",
-            format_number(summary.approved_claims),
-        )
-
-    with col6:
-        create_kpi_card(
-            "Denied Claims",
-            format_number(summary.denied_claims),
-        )
-
-    with col7:
-        create_kpi_card(
-            "Pending Claims",
-            format_number(summary.pending_claims),
-        )
-
-    with col8:
-        create_kpi_card(
-            "Avg Claim Amount",
-            format_currency(summary.avg_claim_amount),
-        )
+    # KPI Rows
+    st.subheader("Key Metrics")
+    kpi_rows = [
+        [
+            ("Total Claims", format_number(summary.total_claims)),
+            ("Approval Rate", format_percentage(summary.approval_rate)),
+            ("Avg Processing Time", f"{summary.avg_processing_days:.1f} days"),
+            ("Total Claim Amount", format_currency(summary.total_claim_amount)),
+        ],
+        [
+            ("Approved Claims", format_number(summary.approved_claims)),
+            ("Denied Claims", format_number(summary.denied_claims)),
+            ("Pending Claims", format_number(summary.pending_claims)),
+            ("Avg Claim Amount", format_currency(summary.avg_claim_amount)),
+        ],
+    ]
+    for kpis in kpi_rows:
+        for col, (label, value) in zip(st.columns(4), kpis):
+            col.metric(label, value)
 
     st.markdown("---")
 
@@ -134,9 +109,9 @@ def render_claims_dashboard(
     with col_right:
         # Claims Amount Comparison
         amount_data = {
-            "Total Claimed": float(summary.total_claim_amount),
-            "Total Approved": float(summary.total_approved_amount),
-            "Total Paid": float(summary.total_paid_amount),
+            "Total Claimed": total_claimed,
+            "Total Approved": total_approved,
+            "Total Paid": total_paid,
         }
 
         fig_amounts = create_bar_chart(
@@ -152,39 +127,34 @@ def render_claims_dashboard(
     # Recent Claims Table
     st.subheader("Recent Claims")
 
-    if claims_list:
-        # Convert to DataFrame for display
-        claims_data = []
-        for claim in claims_list[:20]:  # Show top 20
-            claims_data.append(
-                {
-                    "Claim ID": claim.claim_id[:8] + "...",
-                    "Claim Number": claim.claim_number or "N/A",
-                    "Status": claim.status,
-                    "Type": claim.claim_type or "N/A",
-                    "Submission Date": claim.submission_date.strftime("%Y-%m-%d") if claim.submission_date else "N/A",
-                    "Claim Amount": format_currency(claim.claim_amount),
-                    "Approved Amount": (
-                        format_currency(claim.approved_amount)
-                        if claim.approved_amount
-                        else "N/A"
-                    ),
-                }
-            )
-
-        df = pd.DataFrame(claims_data)
-
-        # Add status color coding
-        def highlight_status(row):
-            if row["Status"] in ["APPROVED", "PAID"]:
-                return ["background-color: #d4edda"] * len(row)
-            elif row["Status"] == "DENIED":
-                return ["background-color: #f8d7da"] * len(row)
-            else:
-                return ["background-color: #fff3cd"] * len(row)
+    if not claims_df.empty:
+        # Format whole columns of the raw API frame at once
+        approved_amounts = pd.to_numeric(claims_df["approved_amount"]).replace(0, np.nan)
+        df = pd.DataFrame(
+            {
+                "Claim ID": claims_df["claim_id"].str[:8] + "...",
+                "Claim Number": claims_df["claim_number"].replace({"": None}).fillna("N/A"),
+                "Status": claims_df["status"],
+                "Type": claims_df["claim_type"].replace({"": None}).fillna("N/A"),
+                "Submission Date": (
+                    pd.to_datetime(claims_df["submission_date"])
+                    .dt.strftime("%Y-%m-%d")
+                    .fillna("N/A")
+                ),
+                "Claim Amount": format_currency_series(claims_df["claim_amount"]),
+                "Approved Amount": format_currency_series(approved_amounts).fillna("N/A"),
+            }
+        )
+
+        # Add status color coding, computed once per row for all columns
+        row_colors = np.select(
+            [df["Status"].isin(["APPROVED", "PAID"]), df["Status"] == "DENIED"],
+            ["background-color: #d4edda", "background-color: #f8d7da"],
+            default="background-color: #fff3cd",
+        )
 
         st.dataframe(
-            df.style.apply(highlight_status, axis=1),
+            df.style.apply(lambda column: row_colors, axis=0),
             use_container_width=True,
             hide_index=True,
         )
@@ -208,11 +178,7 @@ def render_claims_dashboard(
         )
 
     with insight_col2:
-        approval_amount_rate = (
-            float(summary.total_approved_amount / summary.total_claim_amount)
-            if summary.total_claim_amount > 0
-            else 0
-        )
+        approval_amount_rate = total_approved / total_claimed if total_claimed > 0 else 0
         st.info(
             f"""
             **Financial Summary**
@@ -1,35 +1,40 @@
 """Policy analytics component."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from services.api_client import APIClient, PolicyMetrics
+from services.api_client import APIClient, APIError, PolicyMetrics
 from utils.formatters import (
     format_currency,
+    format_currency_series,
     format_number,
     format_percentage,
 )
 from .visualizations import (
     create_bar_chart,
     create_gauge_chart,
-    create_kpi_card,
     create_pie_chart,
 )
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_policy_data(
-    api_client: APIClient,
+    _api_client: APIClient,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> tuple[PolicyMetrics, list]:
-    """Fetch policy data from API."""
-    metrics = api_client.get_policy_metrics(start_date, end_date)
-    policies_list = api_client.list_policies(limit=50)
-    return metrics, policies_list
+) -> tuple[PolicyMetrics, pd.DataFrame]:
+    """Fetch policy data from API, cached per date range across reruns."""
+    # The two requests are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        metrics_future = executor.submit(_api_client.get_policy_metrics, start_date, end_date)
+        policies_future = executor.submit(_api_client.list_policies_df, limit=20)
+        return metrics_future.result(), policies_future.result()
 
 
 def render_policy_analytics(
@@ -50,65 +55,39 @@ def render_policy_analytics(
     # Add loading state
     with st.spinner("Loading policy data..."):
         try:
-            metrics, policies_list = fetch_policy_data(api_client, start_date, end_date)
-        except Exception as e:
-            st.error(f"Failed to load policy data: {str(e)}")
+            metrics, policies_df = fetch_policy_data(api_client, start_date, end_date)
+        except APIError as e:
+            st.error(f"Failed to load policy data: {e}")
             return
 
-    # KPI Row
-    st.subheader("Key Metrics")
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        create_kpi_card(
-            "Total Policies",
-            format_number(metrics.total_policies),
-        )
-
-    with col2:
-        create_kpi_card(
-            "Active Policies",
-            format_number(metrics.active_policies),
-        )
-
-    with col3:
-        create_kpi_card(
-            "Lapse Rate",
-            format_percentage(metrics.lapse_rate),
-        )
-
-    with col4:
-        create_kpi_card(
-            "Avg Insured Age",
-            f"{metrics.avg_insured_age:.1f} years" if metrics.avg_insured_age else "N/A",
-        )
-
-    # Second KPI Row
-    col5, col6, col7, col8 = st.columns(4)
-
-    with col5:
-        create_kpi_card(
-            "Total Premium",
-            format_currency(metrics.total_premium),
-        )
-
-    with col6:
-        create_kpi_card(
-            "Avg Premium",
-            format_currency(metrics.avg_premium),
-        )
-
-    with col7:
-        create_kpi_card(
-            "Avg Benefit",
-            format_currency(metrics.avg_benefit),
-        )
+    # Convert Decimal amounts once for charts and ratios
+    total_premium = float(metrics.total_premium)
+    avg_premium = float(metrics.avg_premium)
+    avg_benefit = float(metrics.avg_benefit)
+    annual_premium = total_premium * 12
 
-    with col8:
-        create_kpi_card(
-            "Lapsed Policies",
-            format_number(metrics.lapsed_policies),
-        )
+    # KPI Rows
+    st.subheader("Key Metrics")
+    kpi_rows = [
+        [
+            ("Total Policies", format_number(metrics.total_policies)),
+            ("Active Policies", format_number(metrics.active_policies)),
+            ("Lapse Rate", format_percentage(metrics.lapse_rate)),
+            (
+                "Avg Insured Age",
+                f"{metrics.avg_insured_age:.1f} years" if metrics.avg_insured_age else "N/A",
+            ),
+        ],
+        [
+            ("Total Premium", format_currency(metrics.total_premium)),
+            ("Avg Premium", format_currency(metrics.avg_premium)),
+            ("Avg Benefit", format_currency(metrics.avg_benefit)),
+            ("Lapsed Policies", format_number(metrics.lapsed_policies)),
+        ],
+    ]
+    for kpis in kpi_rows:
+        for col, (label, value) in zip(st.columns(4), kpis):
+            col.metric(label, value)
 
     st.markdown("---")
 
@@ -164,12 +143,8 @@ def render_policy_analytics(
     prem_col1, prem_col2 = st.columns(2)
 
     with prem_col1:
-        # Calculate annual premium
-        annual_premium = float(metrics.total_premium) * 12
-        monthly_avg = float(metrics.avg_premium)
-
         premium_breakdown = {
-            "Monthly Total": float(metrics.total_premium),
+            "Monthly Total": total_premium,
             "Annual Total": annual_premium,
         }
 
@@ -183,11 +158,7 @@ def render_policy_analytics(
 
     with prem_col2:
         # Coverage ratio analysis
-        avg_coverage_ratio = (
-            float(metrics.avg_benefit) / float(metrics.avg_premium)
-            if float(metrics.avg_premium) > 0
-            else 0
-        )
+        avg_coverage_ratio = avg_benefit / avg_premium if avg_premium > 0 else 0
 
         st.metric("Average Coverage Ratio", f"{avg_coverage_ratio:.2f}x")
 
@@ -205,39 +176,45 @@ def render_policy_analytics(
     # Recent Policies Table
     st.subheader("Recent Policies")
 
-    if policies_list:
-        # Convert to DataFrame for display
-        policies_data = []
-        for policy in policies_list[:20]:  # Show top 20
-            policies_data.append(
-                {
-                    "Policy ID": policy.policy_id[:8] + "...",
-                    "Policy Number": policy.policy_number or "N/A",
-                    "Type": policy.policy_type or policy.benefit_inflation or "N/A",
-                    "Status": policy.status or "N/A",
-                    "Insured Age": policy.insured_age or "N/A",
-                    "State": policy.insured_state or "N/A",
-                    "Premium": format_currency(policy.premium_amount),
-                    "Benefit": format_currency(policy.benefit_amount),
-                    "Issue Date": policy.issue_date.strftime("%Y-%m-%d") if policy.issue_date else "N/A",
-                }
-            )
-
-        df = pd.DataFrame(policies_data)
+    if not policies_df.empty:
+        # Format whole columns of the raw API frame at once
+        policy_types = policies_df["policy_type"].replace({"": None})
+        insured_ages = pd.to_numeric(policies_df["insured_age"]).astype("Int64").replace(0, pd.NA)
+        df = pd.DataFrame(
+            {
+                "Policy ID": policies_df["policy_id"].str[:8] + "...",
+                "Policy Number": policies_df["policy_number"].replace({"": None}).fillna("N/A"),
+                "Type": (
+                    policy_types.fillna(policies_df["benefit_inflation"])
+                    .replace({"": None})
+                    .fillna("N/A")
+                ),
+                "Status": policies_df["status"].replace({"": None}).fillna("N/A"),
+                "Insured Age": insured_ages.astype(object).where(insured_ages.notna(), "N/A"),
+                "State": policies_df["insured_state"].replace({"": None}).fillna("N/A"),
+                "Premium": format_currency_series(policies_df["premium_amount"]),
+                "Benefit": format_currency_series(policies_df["benefit_amount"]).fillna("N/A"),
+                "Issue Date": (
+                    pd.to_datetime(policies_df["issue_date"])
+                    .dt.strftime("%Y-%m-%d")
+                    .fillna("N/A")
+                ),
+            }
+        )
 
-        # Add status color coding
-        def highlight_status(row):
-            if row["Status"] == "ACTIVE":
-                return ["background-color: #d4edda"] * len(row)
-            elif row["Status"] == "LAPSED":
-                return ["background-color: #fff3cd"] * len(row)
-            elif row["Status"] == "TERMINATED":
-                return ["background-color: #f8d7da"] * len(row)
-            else:
-                return [""] * len(row)
+        # Add status color coding, computed once per row for all columns
+        row_colors = np.select(
+            [df["Status"] == "ACTIVE", df["Status"] == "LAPSED", df["Status"] == "TERMINATED"],
+            [
+                "background-color: #d4edda",
+                "background-color: #fff3cd",
+                "background-color: #f8d7da",
+            ],
+            default="",
+        )
 
         st.dataframe(
-            df.style.apply(highlight_status, axis=1),
+            df.style.apply(lambda column: row_colors, axis=0),
             use_container_width=True,
             hide_index=True,
         )
@@ -272,15 +249,12 @@ def render_policy_analytics(
         )
 
     with health_col3:
-        monthly_revenue = float(metrics.total_premium)
-        annual_revenue = monthly_revenue * 12
-
         st.info(
             f"""
             **Revenue Metrics**
-            - Monthly premium revenue: {format_currency(monthly_revenue)}
-            - Annual premium revenue: {format_currency(annual_revenue)}
-            - Revenue per active policy: {format_currency(monthly_revenue / metrics.active_policies if metrics.active_policies > 0 else 0)}
+            - Monthly premium revenue: {format_currency(total_premium)}
+            - Annual premium revenue: {format_currency(annual_premium)}
+            - Revenue per active policy: {format_currency(total_premium / metrics.active_policies if metrics.active_policies > 0 else 0)}
             """
         )
 
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
@@ -17,21 +18,38 @@ COLORS = {
 }
 
 
+# Shared chart layout, built once at import time
+_TEMPLATE_LAYOUT: Dict[str, Any] = {
+    "font": {"family": "Arial, sans-serif", "size": 12},
+    "plot_bgcolor": "#ffffff",
+    "paper_bgcolor": "#ffffff",
+    "margin": {"l": 40, "r": 40, "t": 60, "b": 40},
+    "hovermode": "closest",
+    "xaxis": {"showgrid": True, "gridcolor": "#e0e0e0"},
+    "yaxis": {"showgrid": True, "gridcolor": "#e0e0e0"},
+}
+
+
 def get_plotly_template() -> Dict[str, Any]:
     """Get custom Plotly template."""
-    return {
-        "layout": {
-            "font": {"family": "Arial, sans-serif", "size": 12},
-            "plot_bgcolor": "#ffffff",
-            "paper_bgcolor": "#ffffff",
-            "margin": {"l": 40, "r": 40, "t": 60, "b": 40},
-            "hovermode": "closest",
-            "xaxis": {"showgrid": True, "gridcolor": "#e0e0e0"},
-            "yaxis": {"showgrid": True, "gridcolor": "#e0e0e0"},
-        }
+    return {"layout": _TEMPLATE_LAYOUT}
+
+
+def _build_layout(
+    title: Optional[str] = None, x_label: str = "", y_label: str = ""
+) -> Dict[str, Any]:
+    """Merge chart-specific title and axis labels into the shared layout."""
+    layout = {
+        **_TEMPLATE_LAYOUT,
+        "xaxis": {**_TEMPLATE_LAYOUT["xaxis"], "title": x_label},
+        "yaxis": {**_TEMPLATE_LAYOUT["yaxis"], "title": y_label},
     }
+    if title is not None:
+        layout["title"] = title
+    return layout
 
 
+@st.cache_data(show_spinner=False)
 def create_bar_chart(
     data: Dict[str, Union[int, float]],
     title: str,
@@ -55,20 +73,21 @@ def create_bar_chart(
         Plotly Figure object
     """
     labels = list(data.keys())
-    values = list(data.values())
+    values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
 
     if horizontal:
-        fig = go.Figure(data=[go.Bar(x=values, y=labels, marker_color=color, orientation="h")])
-        fig.update_layout(xaxis_title=y_label, yaxis_title=x_label)
-    else:
-        fig = go.Figure(data=[go.Bar(x=labels, y=values, marker_color=color)])
-        fig.update_layout(xaxis_title=x_label, yaxis_title=y_label)
-
-    fig.update_layout(title=title, **get_plotly_template()["layout"])
+        return go.Figure(
+            data=[go.Bar(x=values, y=labels, marker_color=color, orientation="h")],
+            layout=_build_layout(title, x_label=y_label, y_label=x_label),
+        )
 
-    return fig
+    return go.Figure(
+        data=[go.Bar(x=labels, y=values, marker_color=color)],
+        layout=_build_layout(title, x_label=x_label, y_label=y_label),
+    )
 
 
+@st.cache_data(show_spinner=False)
 def create_pie_chart(
     data: Dict[str, Union[int, float]],
     title: str,
@@ -86,7 +105,7 @@ def create_pie_chart(
         Plotly Figure object
     """
     labels = list(data.keys())
-    values = list(data.values())
+    values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
 
     fig = go.Figure(
         data=[
@@ -97,14 +116,14 @@ def create_pie_chart(
                 textinfo="label+percent",
                 hovertemplate="<b>%{label}</b><br>Value: %{value}<br>Percent: %{percent}<extra></extra>",
             )
-        ]
+        ],
+        layout=_build_layout(title),
     )
 
-    fig.update_layout(title=title, **get_plotly_template()["layout"])
-
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def create_line_chart(
     data: Dict[str, List[Any]],
     title: str,
@@ -123,23 +142,17 @@ def create_line_chart(
     Returns:
         Plotly Figure object
     """
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Scatter(
-            x=data.get("x", []),
-            y=data.get("y", []),
-            mode="lines+markers",
-            line=dict(color=COLORS["primary"], width=2),
-            marker=dict(size=8),
-        )
-    )
-
-    fig.update_layout(
-        title=title,
-        xaxis_title=x_label,
-        yaxis_title=y_label,
-        **get_plotly_template()["layout"],
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=data.get("x", []),
+                y=np.asarray(data.get("y", []), dtype=np.float64),
+                mode="lines+markers",
+                line=dict(color=COLORS["primary"], width=2),
+                marker=dict(size=8),
+            )
+        ],
+        layout=_build_layout(title, x_label=x_label, y_label=y_label),
     )
 
     return fig
@@ -160,6 +173,7 @@ def create_kpi_card(
     st.metric(label=label, value=value, delta=delta, delta_color=delta_color)
 
 
+@st.cache_data(show_spinner=False)
 def create_gauge_chart(
     value: float, title: str, min_val: float = 0, max_val: float = 100
 ) -> go.Figure:
@@ -194,14 +208,14 @@ def create_gauge_chart(
                     "value": max_val * 0.9,
                 },
             },
-        )
+        ),
+        layout=_TEMPLATE_LAYOUT,
     )
 
-    fig.update_layout(**get_plotly_template()["layout"])
-
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def create_heatmap(
     data: List[List[float]],
     x_labels: List[str],
@@ -224,15 +238,14 @@ def create_heatmap(
     """
     fig = go.Figure(
         data=go.Heatmap(
-            z=data,
+            z=np.asarray(data, dtype=np.float64),
             x=x_labels,
             y=y_labels,
             colorscale=colorscale,
             hovertemplate="x: %{x}<br>y: %{y}<br>value: %{z}<extra></extra>",
-        )
+        ),
+        layout=_build_layout(title),
     )
 
-    fig.update_layout(title=title, **get_plotly_template()["layout"])
-
     return fig
 
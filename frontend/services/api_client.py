@@ -1,23 +1,38 @@
 """Type-safe HTTP client for backend API."""
 
+import atexit
+import functools
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Iterator, Optional, Dict, List, Tuple, Type
 
 import httpx
+import ijson
+import orjson
+import pandas as pd
+import redis
 import streamlit as st
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 
 class ClaimSchema(BaseModel):
     """Schema for claim data - adapted for new table structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     claim_id: str
     claim_number: Optional[str] = None
     policy_id: str
@@ -34,7 +49,7 @@ class ClaimSchema(BaseModel):
     payment_date: Optional[datetime] = None
     reviewer_id: Optional[str] = None
     facility_name: Optional[str] = None
-    diagnosis_codes: List[str] = Field(default_factory=list)
+    diagnosis_codes: Tuple[str, ...] = ()
     # New fields from snapshot table
     claimant_name: Optional[str] = None
     processing_days: Optional[int] = None
@@ -45,6 +60,8 @@ class ClaimSchema(BaseModel):
 class PolicySchema(BaseModel):
     """Schema for policy data - adapted for new table structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     policy_id: str
     policy_number: Optional[str] = None
     policy_type: Optional[str] = None  # May not be available
@@ -125,50 +142,454 @@ class HealthCheckResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Validate list responses straight from the raw JSON bytes
+CLAIMS_ADAPTER = TypeAdapter(List[ClaimSchema])
+POLICIES_ADAPTER = TypeAdapter(List[PolicySchema])
+
+
+def arrow_dtypes(schema: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Map a schema's scalar fields to Arrow-backed pandas dtypes for read_json.
+
+    Integers become int64 and everything else scalar (strings, Decimals sent
+    as strings, ISO dates) stays a string; list fields are left to inference.
+    """
+    dtypes: Dict[str, str] = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if annotation in (int, Optional[int]):
+            dtypes[name] = "int64[pyarrow]"
+        elif annotation != Tuple[str, ...]:
+            dtypes[name] = "string[pyarrow]"
+    return dtypes
+
+
+# Column dtypes for the display-only DataFrame listings
+CLAIMS_DTYPES = arrow_dtypes(ClaimSchema)
+POLICIES_DTYPES = arrow_dtypes(PolicySchema)
+
+
+# Bulkheads: slow analytics queries get their own pool so they cannot use up
+# the connections that health checks and listings need
+FAST_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=4, keepalive_expiry=60.0)
+SLOW_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=8, keepalive_expiry=60.0)
+SLOW_ENDPOINT_PREFIXES = ("/api/v1/analytics/",)
+
+# Fixed-shape GET endpoints hit on most reruns; their requests are built once
+PREBUILT_ENDPOINTS = frozenset({"/health", "/api/v1/analytics/claims-summary"})
+
+# Response cache TTLs in seconds by endpoint prefix; other endpoints are not cached
+RESPONSE_CACHE_TTLS: Tuple[Tuple[str, int], ...] = (
+    ("/health", 5),
+    ("/api/v1/analytics/", 60),
+)
+
+
+def cached_response(func: Callable) -> Callable:
+    """
+    Serve repeated requests from the client's Redis response cache.
+
+    Wraps ``APIClient._request``. Adds a ``bypass_cache`` keyword
+    that skips the lookup (the fresh response is still stored) for manual
+    refreshes. Cache failures fall through to the real request.
+    """
+
+    def lookup(
+        client: "APIClient",
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        bypass_cache: bool,
+    ) -> Tuple[Optional[str], int, Any]:
+        ttl = client._response_cache_ttl(endpoint)
+        if ttl is None or client.redis_client is None:
+            return None, 0, None
+
+        key = client._response_cache_key(method, endpoint, params, json_data)
+        if not bypass_cache:
+            try:
+                cached = client.redis_client.get(key)
+            except redis.RedisError:
+                return None, 0, None
+            if cached is not None:
+                client.cache_hits += 1
+                return key, ttl, orjson.loads(cached)
+
+        client.cache_misses += 1
+        return key, ttl, None
+
+    def store(client: "APIClient", key: Optional[str], ttl: int, data: Any) -> None:
+        if key is None:
+            return
+        try:
+            client.redis_client.set(key, orjson.dumps(data), ex=ttl)
+        except redis.RedisError:
+            pass
+
+    @functools.wraps(func)
+    def sync_wrapper(
+        self: "APIClient",
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        bypass_cache: bool = False,
+    ) -> Any:
+        key, ttl, cached = lookup(self, method, endpoint, params, json_data, bypass_cache)
+        if cached is not None:
+            return cached
+        data = func(self, method, endpoint, params=params, json_data=json_data)
+        store(self, key, ttl, data)
+        return data
+
+    return sync_wrapper
+
+# Sidebar health checks are reused for this long and given up after this timeout
+HEALTH_CHECK_TTL = 5.0
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# Gateway statuses returned while the backend restarts or is overloaded
+TRANSIENT_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether a failed request is safe and worthwhile to retry.
+
+    Only failures where the backend never handled the request, or a gateway
+    reported it unavailable, are retried; 4xx and other errors are final.
+    """
+    if isinstance(error, (httpx.ConnectError, httpx.ReadTimeout)):
+        return True
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in TRANSIENT_STATUS_CODES
+    )
+
+
+class APIError(Exception):
+    """A backend request failed after retries, or was rejected by the breaker."""
+
+    def __init__(self, endpoint: str, status: Optional[int], detail: str):
+        """
+        Initialize API error.
+
+        Args:
+            endpoint: API endpoint that was requested
+            status: HTTP status code, or None if no response was received
+            detail: Error message from the backend or the transport
+        """
+        self.endpoint = endpoint
+        self.status = status
+        self.detail = detail
+        if status is None:
+            super().__init__(f"Connection Error: {detail}")
+        else:
+            super().__init__(f"API Error ({status}): {detail}")
+
+
+class InvalidResponseError(APIError):
+    """A backend response arrived but could not be decoded or validated."""
+
+    def __init__(self, endpoint: str, detail: str):
+        """
+        Initialize invalid response error.
+
+        Args:
+            endpoint: API endpoint that was requested
+            detail: Decoding or validation error message
+        """
+        super().__init__(endpoint, None, detail)
+        self.args = (f"Invalid Response: {detail}",)
+
+
+def _error_detail(response: httpx.Response, default: str) -> str:
+    """Extract the backend's error message from an error response."""
+    try:
+        body = orjson.loads(response.content)
+    except (httpx.ResponseNotRead, orjson.JSONDecodeError):
+        return default
+    if isinstance(body, dict):
+        return str(body.get("message") or body.get("detail") or default)
+    return default
+
+
+@contextmanager
+def api_errors(endpoint: str) -> Iterator[None]:
+    """
+    Translate httpx failures into APIError, keeping the original as its cause.
+
+    Raises:
+        APIError: If the wrapped request failed
+    """
+    try:
+        yield
+    except httpx.HTTPStatusError as e:
+        raise APIError(endpoint, e.response.status_code, _error_detail(e.response, str(e))) from e
+    except httpx.RequestError as e:
+        raise APIError(endpoint, None, str(e)) from e
+
+
+@contextmanager
+def response_errors(endpoint: str) -> Iterator[None]:
+    """
+    Translate decoding and validation failures into InvalidResponseError.
+
+    Covers JSON decoding (orjson, ijson), Pydantic validation and DataFrame
+    parsing, so callers only need to handle APIError.
+
+    Raises:
+        InvalidResponseError: If the wrapped decoding or validation failed
+    """
+    try:
+        yield
+    except (ValueError, TypeError, ijson.JSONError) as e:
+        raise InvalidResponseError(endpoint, str(e)) from e
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the backend is down instead of waiting out retries.
+
+    The circuit opens after ``fail_max`` consecutive failed calls and rejects
+    calls until ``reset_timeout`` seconds have passed. The next call is then
+    let through as a trial; its failure reopens the circuit right away.
+
+    One breaker is shared by every Streamlit session and fetcher thread of
+    the process, so its state is only read and updated under a lock.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.fail_count = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently rejected."""
+        with self._lock:
+            return (
+                self.opened_at is not None
+                and time.monotonic() - self.opened_at < self.reset_timeout
+            )
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Guard one backend call, recording its outcome.
+
+        Connection errors and 5xx responses count as failures.
+
+        Raises:
+            httpx.RequestError: If the circuit is open
+        """
+        if self.is_open:
+            raise httpx.RequestError("circuit open: backend API is unavailable")
+
+        try:
+            yield
+        except httpx.RequestError:
+            self._record_failure()
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        else:
+            self._record_success()
+
+    def _record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.fail_count = 0
+            self.opened_at = None
+
+    def _record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.fail_count += 1
+            if self.fail_count >= self.fail_max:
+                self.opened_at = time.monotonic()
+
+
 class APIClient:
     """Type-safe HTTP client for LTC Insurance Data Service API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: float = 3.0,
+        slow_timeout: float = 60.0,
+        redis_url: Optional[str] = None,
+        strict_mode: bool = False,
+    ):
         """
         Initialize API client.
 
         Args:
             base_url: Base URL for the API
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds for health and listing calls
+            slow_timeout: Request timeout in seconds for analytics calls
+            redis_url: Redis URL for the response cache; defaults to the
+                REDIS_URL environment variable, caching is off if neither is set
+            strict_mode: Validate single-record responses; otherwise they are
+                trusted and built with model_construct, leaving values as sent
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.slow_timeout = slow_timeout
+        self.strict_mode = strict_mode
+        self.breaker = CircuitBreaker()
+        self.redis_url = redis_url or os.getenv("REDIS_URL")
+        self._redis: Optional[redis.Redis] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._last_health: Optional[Tuple[float, Optional[HealthCheckResponse]]] = None
         self._sync_client: Optional[httpx.Client] = None
+        self._slow_client: Optional[httpx.Client] = None
+        self._request_templates: Dict[str, httpx.Request] = {}
+        atexit.register(self.close)
 
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+        """Get or create HTTP client for health and listing calls."""
         if self._sync_client is None:
             self._sync_client = httpx.Client(
                 base_url=self.base_url,
                 timeout=self.timeout,
+                http2=True,
+                limits=FAST_LIMITS,
                 follow_redirects=True,
+                headers={"Accept-Encoding": "gzip, deflate"},
             )
         return self._sync_client
 
+    @property
+    def slow_client(self) -> httpx.Client:
+        """Get or create HTTP client for analytics calls."""
+        if self._slow_client is None:
+            self._slow_client = httpx.Client(
+                base_url=self.base_url,
+                timeout=self.slow_timeout,
+                http2=True,
+                limits=SLOW_LIMITS,
+                follow_redirects=True,
+                headers={"Accept-Encoding": "gzip, deflate"},
+            )
+        return self._slow_client
+
+    def _prebuilt_request(
+        self, client: httpx.Client, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> httpx.Request:
+        """
+        Get a request for a hot endpoint from a template built on first use.
+
+        The template carries the joined URL, merged client headers and timeout,
+        so later calls only merge in their query parameters.
+        """
+        template = self._request_templates.get(endpoint)
+        if template is None:
+            template = client.build_request("GET", endpoint)
+            self._request_templates[endpoint] = template
+        if not params:
+            return template
+        return httpx.Request(
+            "GET",
+            template.url.copy_merge_params(params),
+            headers=template.headers,
+            extensions=template.extensions,
+        )
+
+    @staticmethod
+    def _is_slow_endpoint(endpoint: str) -> bool:
+        """Check whether an endpoint belongs to the slow analytics bulkhead."""
+        return endpoint.startswith(SLOW_ENDPOINT_PREFIXES)
+
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """Get or create the Redis client backing the response cache."""
+        if self._redis is None and self.redis_url:
+            self._redis = redis.Redis.from_url(
+                self.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+        return self._redis
+
+    @staticmethod
+    def _response_cache_ttl(endpoint: str) -> Optional[int]:
+        """Get the response cache TTL for an endpoint, or None if uncached."""
+        for prefix, ttl in RESPONSE_CACHE_TTLS:
+            if endpoint.startswith(prefix):
+                return ttl
+        return None
+
+    @staticmethod
+    def _response_cache_key(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+    ) -> str:
+        """Build the response cache key for a request."""
+        raw = (
+            method
+            + endpoint
+            + json.dumps(params, sort_keys=True)
+            + json.dumps(json_data, sort_keys=True)
+        )
+        return f"api_response:{hashlib.sha1(raw.encode()).hexdigest()}"
+
     def close(self) -> None:
-        """Close HTTP client."""
+        """Close HTTP clients."""
         if self._sync_client:
             self._sync_client.close()
             self._sync_client = None
+        if self._slow_client:
+            self._slow_client.close()
+            self._slow_client = None
+        self._request_templates.clear()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make HTTP request through the circuit breaker, which wraps the retries.
+
+        Raises:
+            APIError: If the request failed or the circuit is open
+        """
+        with api_errors(endpoint), self.breaker.guard():
+            return self._send_with_retry(method, endpoint, params=params, json_data=json_data)
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(httpx.RequestError),
+        # Full jitter keeps retries from concurrent Streamlit sessions apart
+        wait=wait_random_exponential(multiplier=0.5, max=8),
+        retry=retry_if_exception(is_transient_error),
+        reraise=True,
     )
-    def _request(
+    def _send_with_retry(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+    ) -> httpx.Response:
         """
         Make HTTP request with retry logic.
 
@@ -179,62 +600,145 @@ class APIClient:
             json_data: JSON request body
 
         Returns:
-            Response data as dictionary
+            Successful response
 
         Raises:
             httpx.HTTPStatusError: If response status is not successful
+            httpx.RequestError: If no response was received
         """
-        try:
-            response = self.client.request(
+        client = self.slow_client if self._is_slow_endpoint(endpoint) else self.client
+        if method == "GET" and json_data is None and endpoint in PREBUILT_ENDPOINTS:
+            response = client.send(self._prebuilt_request(client, endpoint, params))
+        else:
+            response = client.request(
                 method=method,
                 url=endpoint,
                 params=params,
                 json=json_data,
             )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.json() if e.response.text else {"error": str(e)}
-            st.error(f"API Error: {error_detail.get('message', str(e))}")
-            raise
-        except httpx.RequestError as e:
-            st.error(f"Connection Error: {str(e)}")
-            raise
+        response.raise_for_status()
+        return response
+
+    @cached_response
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request and return the decoded JSON body."""
+        content = self._send(method, endpoint, params=params, json_data=json_data).content
+        with response_errors(endpoint):
+            return orjson.loads(content)
+
+    def _request_bytes(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Make HTTP request and return the raw body for validate_json."""
+        return self._send(method, endpoint, params=params).content
+
+    def _stream_items(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the items of a JSON array response as they are decoded.
+
+        Items are yielded while the body is still arriving, so at most one
+        chunk of raw bytes is held at a time. Streamed requests are not retried.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            params: Query parameters
+
+        Yields:
+            Each array item as a dictionary
+
+        Raises:
+            APIError: If the request failed or the circuit is open
+        """
+        with api_errors(endpoint), self.breaker.guard():
+            with self.client.stream("GET", endpoint, params=params) as response:
+                response.raise_for_status()
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "item")
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    yield from items
+                    del items[:]
+                parser.close()
+                yield from items
 
     # Health Check
 
     def health_check(self) -> HealthCheckResponse:
         """Check API health status."""
         data = self._request("GET", "/health")
-        return HealthCheckResponse(**data)
+        with response_errors("/health"):
+            return HealthCheckResponse(**data)
+
+    def recent_health_check(self) -> Optional[HealthCheckResponse]:
+        """
+        Check API health, reusing a result younger than HEALTH_CHECK_TTL.
+
+        Keeps rapid widget-driven reruns from probing the backend each time.
+        The probe is one unretried request on the pooled client, bounded by
+        HEALTH_CHECK_TIMEOUT. A failed check yields None, which is cached the
+        same way.
+
+        Returns:
+            Health check response, or None if the API is unreachable
+        """
+        now = time.monotonic()
+        if self._last_health is not None and now - self._last_health[0] < HEALTH_CHECK_TTL:
+            return self._last_health[1]
+
+        health: Optional[HealthCheckResponse]
+        try:
+            with api_errors("/health"), self.breaker.guard():
+                response = self.client.get("/health", timeout=HEALTH_CHECK_TIMEOUT)
+                response.raise_for_status()
+            health = HealthCheckResponse(**orjson.loads(response.content))
+        except Exception:
+            health = None
+
+        self._last_health = (now, health)
+        return health
 
     # Analytics Endpoints
 
-    def get_claims_summary(
-        self, start_date: Optional[date] = None, end_date: Optional[date] = None
-    ) -> ClaimSummary:
-        """Get claims summary analytics."""
-        params = {}
+    @staticmethod
+    def _analytics_params(
+        start_date: Optional[date], end_date: Optional[date]
+    ) -> Dict[str, Any]:
+        """Build query parameters for the date-filtered analytics endpoints."""
+        params: Dict[str, Any] = {}
         if start_date:
             params["start_date"] = start_date.isoformat()
         if end_date:
             params["end_date"] = end_date.isoformat()
+        return params
 
+    def get_claims_summary(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> ClaimSummary:
+        """Get claims summary analytics."""
+        params = self._analytics_params(start_date, end_date)
         data = self._request("GET", "/api/v1/analytics/claims-summary", params=params)
-        return ClaimSummary(**data)
+        with response_errors("/api/v1/analytics/claims-summary"):
+            return ClaimSummary(**data)
 
     def get_policy_metrics(
         self, start_date: Optional[date] = None, end_date: Optional[date] = None
     ) -> PolicyMetrics:
         """Get policy metrics analytics."""
-        params = {}
-        if start_date:
-            params["start_date"] = start_date.isoformat()
-        if end_date:
-            params["end_date"] = end_date.isoformat()
-
+        params = self._analytics_params(start_date, end_date)
         data = self._request("GET", "/api/v1/analytics/policy-metrics", params=params)
-        return PolicyMetrics(**data)
+        with response_errors("/api/v1/analytics/policy-metrics"):
+            return PolicyMetrics(**data)
 
     def get_comprehensive_analytics(
         self,
@@ -255,14 +759,44 @@ class APIClient:
             request_data["states"] = states
 
         data = self._request("POST", "/api/v1/analytics/custom-query", json_data=request_data)
-        return AnalyticsResponse(**data)
+        with response_errors("/api/v1/analytics/custom-query"):
+            return AnalyticsResponse(**data)
+
+    @staticmethod
+    def _read_json_frame(
+        raw: bytes, schema: Type[BaseModel], dtypes: Dict[str, str]
+    ) -> pd.DataFrame:
+        """Parse a JSON array of records into columns matching the schema."""
+        df = pd.read_json(
+            io.BytesIO(raw),
+            dtype=dtypes,
+            dtype_backend="pyarrow",
+            convert_dates=False,
+        )
+        return df.reindex(columns=list(schema.model_fields))
 
     # Claims Endpoints
 
     def get_claim(self, claim_id: str) -> ClaimSchema:
         """Get claim by ID."""
-        data = self._request("GET", f"/api/v1/claims/{claim_id}")
-        return ClaimSchema(**data)
+        endpoint = f"/api/v1/claims/{claim_id}"
+        data = self._request("GET", endpoint)
+        with response_errors(endpoint):
+            if self.strict_mode:
+                return ClaimSchema(**data)
+            return ClaimSchema.model_construct(**data)
+
+    @staticmethod
+    def _claims_params(
+        limit: int, offset: int, status: Optional[str], policy_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build query parameters for the claims list endpoint."""
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if policy_id:
+            params["policy_id"] = policy_id
+        return params
 
     def list_claims(
         self,
@@ -272,21 +806,75 @@ class APIClient:
         policy_id: Optional[str] = None,
     ) -> List[ClaimSchema]:
         """List claims with filtering."""
-        params: Dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = status
-        if policy_id:
-            params["policy_id"] = policy_id
+        params = self._claims_params(limit, offset, status, policy_id)
+        raw = self._request_bytes("GET", "/api/v1/claims/", params=params)
+        with response_errors("/api/v1/claims/"):
+            return CLAIMS_ADAPTER.validate_json(raw)
+
+    def iter_claims(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[str] = None,
+        policy_id: Optional[str] = None,
+    ) -> Iterator[ClaimSchema]:
+        """
+        List claims with filtering, yielding each claim as it is received.
 
-        data = self._request("GET", "/api/v1/claims/", params=params)
-        return [ClaimSchema(**item) for item in data]
+        Each claim is validated as it arrives. The iterator is single-use;
+        call list_claims when the result is needed as a list.
+        """
+        params = self._claims_params(limit, offset, status, policy_id)
+        with response_errors("/api/v1/claims/"):
+            for item in self._stream_items("/api/v1/claims/", params=params):
+                yield ClaimSchema.model_validate(item)
+
+    def list_claims_df(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[str] = None,
+        policy_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        List claims as an Arrow-backed DataFrame for display.
+
+        Skips Pydantic entirely and parses the response body straight into
+        columns, one per ClaimSchema field.
+        """
+        params = self._claims_params(limit, offset, status, policy_id)
+        raw = self._request_bytes("GET", "/api/v1/claims/", params=params)
+        with response_errors("/api/v1/claims/"):
+            return self._read_json_frame(raw, ClaimSchema, CLAIMS_DTYPES)
 
     # Policy Endpoints
 
     def get_policy(self, policy_id: str) -> PolicySchema:
         """Get policy by ID."""
-        data = self._request("GET", f"/api/v1/policies/{policy_id}")
-        return PolicySchema(**data)
+        endpoint = f"/api/v1/policies/{policy_id}"
+        data = self._request("GET", endpoint)
+        with response_errors(endpoint):
+            if self.strict_mode:
+                return PolicySchema(**data)
+            return PolicySchema.model_construct(**data)
+
+    @staticmethod
+    def _policies_params(
+        limit: int,
+        offset: int,
+        status: Optional[str],
+        policy_type: Optional[str],
+        state: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build query parameters for the policies list endpoint."""
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if policy_type:
+            params["policy_type"] = policy_type
+        if state:
+            params["state"] = state
+        return params
 
     def list_policies(
         self,
@@ -297,20 +885,63 @@ class APIClient:
         state: Optional[str] = None,
     ) -> List[PolicySchema]:
         """List policies with filtering."""
-        params: Dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = status
-        if policy_type:
-            params["policy_type"] = policy_type
-        if state:
-            params["state"] = state
+        params = self._policies_params(limit, offset, status, policy_type, state)
+        raw = self._request_bytes("GET", "/api/v1/policies/", params=params)
+        with response_errors("/api/v1/policies/"):
+            return POLICIES_ADAPTER.validate_json(raw)
 
-        data = self._request("GET", "/api/v1/policies/", params=params)
-        return [PolicySchema(**item) for item in data]
+    def iter_policies(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[str] = None,
+        policy_type: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> Iterator[PolicySchema]:
+        """
+        List policies with filtering, yielding each policy as it is received.
+
+        Each policy is validated as it arrives. The iterator is single-use;
+        call list_policies when the result is needed as a list.
+        """
+        params = self._policies_params(limit, offset, status, policy_type, state)
+        with response_errors("/api/v1/policies/"):
+            for item in self._stream_items("/api/v1/policies/", params=params):
+                yield PolicySchema.model_validate(item)
+
+    def list_policies_df(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[str] = None,
+        policy_type: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        List policies as an Arrow-backed DataFrame for display.
+
+        Skips Pydantic entirely and parses the response body straight into
+        columns, one per PolicySchema field.
+        """
+        params = self._policies_params(limit, offset, status, policy_type, state)
+        raw = self._request_bytes("GET", "/api/v1/policies/", params=params)
+        with response_errors("/api/v1/policies/"):
+            return self._read_json_frame(raw, PolicySchema, POLICIES_DTYPES)
 
 
-@st.cache(allow_output_mutation=True)
+@st.cache_resource
 def get_api_client() -> APIClient:
-    """Get cached API client instance."""
-    return APIClient()
+    """
+    Get the API client shared by all sessions of this server process.
+
+    The client is warmed on creation: one health check opens the keep-alive
+    connection, so the first dashboard view does not pay for connection setup.
+    """
+    api_client = APIClient()
+    try:
+        api_client.health_check()
+    except APIError:
+        # Backend not up yet; the connection is opened on first use instead
+        pass
+    return api_client
 
@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from datetime import date, timedelta
 
 # Add frontend directory to Python path
@@ -14,7 +14,7 @@ import streamlit as st
 
 from components.claims_dashboard import render_claims_dashboard
 from components.policy_analytics import render_policy_analytics
-from services.api_client import APIClient, get_api_client
+from services.api_client import APIClient, HealthCheckResponse, get_api_client
 
 # Page configuration
 st.set_page_config(
@@ -42,32 +42,44 @@ st.markdown(
 )
 
 
-def check_api_connection(api_client: APIClient) -> bool:
+def check_api_connection(health: Optional[HealthCheckResponse]) -> bool:
     """
     Check API connection status.
 
     Args:
-        api_client: API client instance
+        health: Health check result, or None if the check failed
 
     Returns:
         True if connection is healthy, False otherwise
     """
-    try:
-        health = api_client.health_check()
-        return health.status == "healthy"
-    except Exception:
-        return False
+    return health is not None and health.status == "healthy"
 
 
-def render_sidebar(api_client: APIClient) -> tuple[Optional[date], Optional[date], str]:
+def render_connection_status(status_slot: Any, health: Optional[HealthCheckResponse]) -> None:
     """
-    Render sidebar with filters and navigation.
+    Render API connection status into its sidebar placeholder.
 
     Args:
-        api_client: API client instance
+        status_slot: Sidebar placeholder reserved by render_sidebar
+        health: Health check result, or None if the check failed
+    """
+    with status_slot.container():
+        if check_api_connection(health):
+            st.success("✅ Connected to API")
+        else:
+            st.error("❌ API Connection Failed")
+            st.warning("Please check that the backend API is running at http://localhost:8000")
+
+
+def render_sidebar() -> tuple[Optional[date], Optional[date], str, Any]:
+    """
+    Render sidebar with filters and navigation.
+
+    The connection status is only known once the health probe finishes,
+    so a placeholder is reserved for it and returned.
 
     Returns:
-        Tuple of (start_date, end_date, page_selection)
+        Tuple of (start_date, end_date, page_selection, status_slot)
     """
     with st.sidebar:
         st.title("🏥 LTC Insurance Analytics")
@@ -75,11 +87,7 @@ def render_sidebar(api_client: APIClient) -> tuple[Optional[date], Optional[date
 
         # API Connection Status
         st.subheader("🔌 Connection Status")
-        if check_api_connection(api_client):
-            st.success("✅ Connected to API")
-        else:
-            st.error("❌ API Connection Failed")
-            st.warning("Please check that the backend API is running at http://localhost:8000")
+        status_slot = st.empty()
 
         st.markdown("---")
 
@@ -136,7 +144,7 @@ def render_sidebar(api_client: APIClient) -> tuple[Optional[date], Optional[date
         st.markdown("---")
         st.caption("Version 1.0.0 | © 2024")
 
-    return start_date, end_date, page
+    return start_date, end_date, page, status_slot
 
 
 def render_home_page(api_client: APIClient) -> None:
@@ -287,7 +295,11 @@ def main() -> None:
     api_client = get_api_client()
 
     # Render sidebar and get filters
-    start_date, end_date, page = render_sidebar(api_client)
+    start_date, end_date, page, status_slot = render_sidebar()
+
+    # Only the health probe runs per rerun; the dashboards' analytics come
+    # from their st.cache_data fetchers
+    render_connection_status(status_slot, api_client.recent_health_check())
 
     # Render selected page
     if page == "Home":
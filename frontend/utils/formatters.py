@@ -4,6 +4,11 @@ from typing import Optional, Union
 from datetime import date, datetime
 from decimal import Decimal
 
+import pandas as pd
+
+# Bound format methods with the format spec parsed once, for per-cell use
+_CURRENCY_FORMAT = "${:,.2f}".format
+
 
 def format_currency(amount: Union[Decimal, float, int]) -> str:
     """
@@ -15,10 +20,22 @@ def format_currency(amount: Union[Decimal, float, int]) -> str:
     Returns:
         Formatted currency string
     """
-    if isinstance(amount, Decimal):
-        amount = float(amount)
+    if type(amount) is float:
+        return _CURRENCY_FORMAT(amount)
+    return _CURRENCY_FORMAT(float(amount))
+
+
+def format_currency_series(amounts: pd.Series) -> pd.Series:
+    """
+    Format a column of amounts as currency in one vectorized call.
 
-    return f"${amount:,.2f}"
+    Args:
+        amounts: Numeric or numeric-string amounts; missing values stay missing
+
+    Returns:
+        Series of formatted currency strings
+    """
+    return pd.to_numeric(amounts).astype("float64").map(_CURRENCY_FORMAT, na_action="ignore")
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -32,6 +49,8 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     Returns:
         Formatted percentage string
     """
+    if decimals == 1:
+        return f"{value * 100:.1f}%"
     return f"{value * 100:.{decimals}f}%"
 
 
@@ -48,8 +67,12 @@ def format_number(value: Union[int, float], decimals: int = 0) -> str:
     """
     if decimals == 0:
         return f"{int(value):,}"
+    elif decimals == 1:
+        return f"{value:,.1f}"
+    elif decimals == 2:
+        return f"{value:,.2f}"
     else:
-        return f"{value:,.{decimals}f}"
+        return format(value, f",.{decimals}f")
 
 
 def format_date(dt: Union[date, datetime, None]) -> str:
@@ -1,12 +1,16 @@
 """Analytics API endpoints."""
 
 import logging
-from typing import Optional
+from typing import Optional, Union
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query
-from snowflake.snowpark import Session
+import ormsgpack
+from anyio import to_thread
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 
-from app.dependencies import get_db_session
+from app.core.cache import cache_manager
+from app.core.snowpark_session import session_manager
+from app.core.responses import RowsResponse, etag_response
+from app.repositories.base import BaseRepository
 from app.services.analytics_service import AnalyticsService
 from app.models.schemas import (
     PolicyMetrics,
@@ -17,21 +21,83 @@ from app.models.schemas import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+# Past snapshots never change; current ones may still be reloaded
+HISTORICAL_TTL = 24 * 60 * 60
+CURRENT_TTL = 5 * 60
+
+
+def _cache_ttl(*snapshot_dates: Union[str, date, None]) -> int:
+    """Pick the cache TTL for results computed from the given snapshot dates."""
+    today = date.today()
+    for snapshot_date in snapshot_dates:
+        if snapshot_date is None:
+            return CURRENT_TTL
+        if isinstance(snapshot_date, str):
+            try:
+                snapshot_date = date.fromisoformat(snapshot_date)
+            except ValueError:
+                return CURRENT_TTL
+        if snapshot_date >= today:
+            return CURRENT_TTL
+    return HISTORICAL_TTL
+
+
+async def invalidate_analytics_cache():
+    """Drop cached analytics results; call after loading a new snapshot.
+    
+    Clears Redis, this worker's memory tier and its repository query cache.
+    Other workers' memory tiers keep their entries until they expire, at most
+    CURRENT_TTL for results that include the current snapshot.
+    """
+    BaseRepository.clear_query_cache()
+    await cache_manager.delete_pattern("analytics:*")
+
+
+def _compute_landing_analytics() -> dict:
+    """Compute the unfiltered analytics the dashboard landing pages request."""
+    with session_manager.session_scope() as session:
+        service = AnalyticsService(session)
+        return {
+            "analytics:policy_insights:None:None": service.get_policy_insights().model_dump(mode="json"),
+            "analytics:policy_metrics:None:None": service.get_policy_metrics().model_dump(mode="json"),
+            "analytics:combined_dashboard:None:None:None": service.get_combined_dashboard().model_dump(mode="json"),
+        }
+
+
+def _compute(method: str, **kwargs) -> dict:
+    """Run an AnalyticsService method on a pooled session and dump it to JSON mode.
+    
+    Used as the get_or_set miss callback, so a session is only taken from
+    the pool when the result is not already cached.
+    """
+    with session_manager.session_scope() as session:
+        return getattr(AnalyticsService(session), method)(**kwargs).model_dump(mode="json")
+
+
+async def warm_analytics_cache():
+    """Recompute and store the landing-page analytics entries."""
+    await cache_manager.set_many(await to_thread.run_sync(_compute_landing_analytics), CURRENT_TTL)
+
 
 @router.get("/policy-insights", response_model=PolicyInsights)
 async def get_policy_insights(
     carrier_name: Optional[str] = Query(None),
-    snapshot_date: Optional[str] = Query(None),
-    session: Session = Depends(get_db_session)
+    snapshot_date: Optional[str] = Query(None)
 ):
     """Get comprehensive policy insights."""
     try:
-        service = AnalyticsService(session)
-        insights = service.get_policy_insights(
-            carrier_name=carrier_name,
-            snapshot_date=snapshot_date
+        data = await cache_manager.get_or_set(
+            f"analytics:policy_insights:{carrier_name}:{snapshot_date}",
+            _cache_ttl(snapshot_date),
+            lambda: _compute(
+                "get_policy_insights",
+                carrier_name=carrier_name,
+                snapshot_date=snapshot_date
+            )
         )
-        return insights
+        return PolicyInsights.model_validate(data)
     except Exception as e:
         logger.error(f"Error calculating policy insights: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -39,18 +105,22 @@ async def get_policy_insights(
 
 @router.get("/policy-metrics", response_model=PolicyMetrics)
 async def get_policy_metrics(
+    request: Request,
     carrier_name: Optional[str] = Query(None),
-    snapshot_date: Optional[str] = Query(None),
-    session: Session = Depends(get_db_session)
+    snapshot_date: Optional[str] = Query(None)
 ):
     """Get policy metrics."""
     try:
-        service = AnalyticsService(session)
-        metrics = service.get_policy_metrics(
-            carrier_name=carrier_name,
-            snapshot_date=snapshot_date
+        data = await cache_manager.get_or_set(
+            f"analytics:policy_metrics:{carrier_name}:{snapshot_date}",
+            _cache_ttl(snapshot_date),
+            lambda: _compute(
+                "get_policy_metrics",
+                carrier_name=carrier_name,
+                snapshot_date=snapshot_date
+            )
         )
-        return metrics
+        return etag_response(request, PolicyMetrics.model_validate(data))
     except Exception as e:
         logger.error(f"Error calculating policy metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -61,17 +131,28 @@ async def get_combined_dashboard(
     carrier_name: Optional[str] = Query(None),
     snapshot_date: Optional[str] = Query(None),
     report_end_dt: Optional[date] = Query(None),
-    session: Session = Depends(get_db_session)
+    accept: Optional[str] = Header(None)
 ):
-    """Get combined dashboard data for policies and claims."""
+    """Get combined dashboard data for policies and claims.
+
+    Served as msgpack instead of JSON when the client accepts it.
+    """
     try:
-        service = AnalyticsService(session)
-        dashboard = service.get_combined_dashboard(
-            carrier_name=carrier_name,
-            snapshot_date=snapshot_date,
-            report_end_dt=report_end_dt
+        data = await cache_manager.get_or_set(
+            f"analytics:combined_dashboard:{carrier_name}:{snapshot_date}:{report_end_dt}",
+            _cache_ttl(snapshot_date, report_end_dt),
+            lambda: _compute(
+                "get_combined_dashboard",
+                carrier_name=carrier_name,
+                snapshot_date=snapshot_date,
+                report_end_dt=report_end_dt
+            )
         )
-        return dashboard
+        # data is the model's JSON-mode dump, validated when it was computed;
+        # serialize it directly instead of re-validating and dumping again
+        if accept and MSGPACK_MEDIA_TYPE in accept:
+            return Response(content=ormsgpack.packb(data), media_type=MSGPACK_MEDIA_TYPE)
+        return RowsResponse(content=data)
     except Exception as e:
         logger.error(f"Error generating combined dashboard: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,15 +1,24 @@
 """Claims API endpoints."""
 
 import logging
-from typing import List, Dict, Any, Optional
+import traceback
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from snowflake.snowpark import Session
 
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, decode_cursor, next_cursor
+from app.core.responses import RowsResponse, etag_response, struct_rows_response, validated_rows_response
+from app.core.snowpark_session import session_manager
 from app.dependencies import get_db_session
+from app.models.domain import ClaimsFilter
+from app.models.structs import ClaimListStruct
+from app.repositories.claims_repo import ClaimsRepository
 from app.services.claims_service import ClaimsService
 from app.models.schemas import (
     ClaimResponse,
+    ClaimListAdapter,
     ClaimsSummary,
     ClaimsInsights,
     ClaimsFilterRequest
@@ -19,8 +28,28 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/claims", tags=["Claims"])
 
 
+@lru_cache(maxsize=256)
+def _parse_csv_str(value: str) -> Tuple[str, ...]:
+    """Parse a comma-separated query parameter into a tuple of strings."""
+    return tuple(value.split(','))
+
+
+@lru_cache(maxsize=256)
+def _parse_csv_int(value: str) -> Tuple[int, ...]:
+    """Parse a comma-separated query parameter into a tuple of ints."""
+    return tuple(int(x) for x in value.split(','))
+
+
+def warm_claims_summary_cache():
+    """Recompute the unfiltered claims summary the landing page requests."""
+    with session_manager.session_scope() as session:
+        ClaimsService.get_claims_summary.refresh(
+            ClaimsService(session), carrier_name=None, report_end_dt=None
+        )
+
+
 @router.get("/{claim_id}", response_model=Dict[str, Any])
-async def get_claim(
+def get_claim(
     claim_id: str,
     session: Session = Depends(get_db_session)
 ):
@@ -40,8 +69,8 @@ async def get_claim(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_claims(
+@router.get("/", response_class=RowsResponse)
+def list_claims(
     carrier_name: Optional[str] = Query(None, description="Filter by carrier name"),
     report_end_dt: Optional[date] = Query(None, description="Report end date"),
     decision_types: Optional[str] = Query(
@@ -58,33 +87,82 @@ async def list_claims(
     ),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    columnar: bool = Query(False, description="Return column -> values arrays instead of row objects"),
+    validate: bool = Query(False, description="Validate rows against the response schema, omitting null fields"),
+    include_total: bool = Query(
+        False,
+        description=f"Return the total matching row count in the {TOTAL_COUNT_HEADER} header (row format only)"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"Keyset cursor from a previous page's {NEXT_CURSOR_HEADER} header; replaces offset"
+    ),
     session: Session = Depends(get_db_session)
 ):
-    """List claims with configurable filters."""
+    """List claims with configurable filters.
+    
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the next page. With include_total, the X-Total-Count header
+    holds the number of matching rows, computed in the same query as the page.
+    """
     try:
-        # Parse comma-separated parameters
-        decision_types_list = decision_types.split(',') if decision_types else None
-        ongoing_months_list = [int(x) for x in ongoing_rate_months.split(',')] if ongoing_rate_months else None
-        categories_list = categories.split(',') if categories else None
-        
-        service = ClaimsService(session)
-        claims = service.get_claims(
+        # Parse comma-separated parameters into the frozen filter
+        filters = ClaimsFilter(
             carrier_name=carrier_name,
             report_end_dt=report_end_dt,
-            decision_types=decision_types_list,
-            ongoing_rate_months=ongoing_months_list,
-            categories=categories_list,
+            decision_types=_parse_csv_str(decision_types) if decision_types else None,
+            ongoing_rate_months=_parse_csv_int(ongoing_rate_months) if ongoing_rate_months else None,
+            categories=_parse_csv_str(categories) if categories else None
+        )
+        
+        after_snapshot_date = after_id = None
+        if cursor:
+            try:
+                after_date_str, after_id = decode_cursor(cursor, 2)
+                after_snapshot_date = date.fromisoformat(after_date_str)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
+        service = ClaimsService(session)
+        with_total = include_total and not columnar
+        if columnar:
+            fetch = service.get_claims_columns
+        elif with_total:
+            fetch = service.get_claims_with_total
+        else:
+            fetch = service.get_claims
+        claims = fetch(
+            filters=filters,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after_snapshot_date=after_snapshot_date,
+            after_id=after_id
         )
-        return claims
+        if with_total:
+            claims, total = claims
+        if validate and not columnar:
+            if ClaimListStruct is not None:
+                response = struct_rows_response(ClaimListStruct, claims)
+            else:
+                response = validated_rows_response(ClaimListAdapter, claims)
+        else:
+            response = RowsResponse(content=claims)
+        
+        token = next_cursor(claims, limit, "snapshot_date", "tpa_fee_worksheet_snapshot_fact_id")
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
+        if with_total:
+            response.headers[TOTAL_COUNT_HEADER] = str(total)
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing claims: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/summary/statistics", response_model=ClaimsSummary)
-async def get_claims_summary(
+def get_claims_summary(
     carrier_name: Optional[str] = Query(None),
     report_end_dt: Optional[date] = Query(None),
     session: Session = Depends(get_db_session)
@@ -102,8 +180,9 @@ async def get_claims_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/insights/detailed")
+@router.get("/insights/detailed", response_model=ClaimsInsights)
 def get_claims_insights(
+    request: Request,
     carrier_name: Optional[str] = Query(None),
     report_end_dt: Optional[date] = Query(None),
     session: Session = Depends(get_db_session)
@@ -111,10 +190,6 @@ def get_claims_insights(
     """Get detailed claims insights with all breakdowns."""
     try:
         # Build insights directly without using service layer to avoid any caching/serialization issues
-        from app.repositories.claims_repo import ClaimsRepository
-        from app.models.schemas import ClaimsSummary, ClaimsInsights
-        from decimal import Decimal
-        
         repo = ClaimsRepository(session)
         
         # Get summary data
@@ -134,14 +209,6 @@ def get_claims_insights(
         # Get retro analysis
         retro_analysis = repo.get_retro_analysis(carrier_name=carrier_name, report_end_dt=report_end_dt)
         
-        # Convert any Decimal values to float in retro_analysis
-        retro_analysis_clean = {}
-        for k, v in retro_analysis.items():
-            if isinstance(v, Decimal):
-                retro_analysis_clean[k] = float(v)
-            else:
-                retro_analysis_clean[k] = v
-        
         # AVG TAT by category
         avg_tat_by_category = {
             "Overall": summary.avg_processing_time_days,
@@ -150,45 +217,47 @@ def get_claims_insights(
             "Other": summary.avg_processing_time_days
         }
         
-        # Build insights object
-        insights = ClaimsInsights(
+        # Parts come from trusted repository code; skip re-validating them
+        insights = ClaimsInsights.model_construct(
             summary=summary,
             decision_breakdown=decision_breakdown,
             category_breakdown=category_breakdown,
             avg_tat_by_category=avg_tat_by_category,
-            retro_analysis=retro_analysis_clean
+            retro_analysis=retro_analysis
         )
         
-        return insights.model_dump()
+        return etag_response(request, insights)
         
     except Exception as e:
         logger.error(f"Error calculating claims insights: {e}")
-        import traceback
         logger.error(f"Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/count/total", response_model=Dict[str, int])
-async def count_claims(
+@router.get("/count/total", response_model=Dict[str, int], deprecated=True)
+def count_claims(
     carrier_name: Optional[str] = Query(None),
     report_end_dt: Optional[date] = Query(None),
     decision_types: Optional[str] = Query(None),
     ongoing_rate_months: Optional[str] = Query(None),
     session: Session = Depends(get_db_session)
 ):
-    """Count claims matching filters."""
+    """Count claims matching filters.
+    
+    Deprecated: pass include_total=true to the list endpoint instead, which
+    returns the count from the same query as the page.
+    """
     try:
-        # Parse comma-separated parameters
-        decision_types_list = decision_types.split(',') if decision_types else None
-        ongoing_months_list = [int(x) for x in ongoing_rate_months.split(',')] if ongoing_rate_months else None
-        
-        service = ClaimsService(session)
-        count = service.count_claims(
+        # Parse comma-separated parameters into the frozen filter
+        filters = ClaimsFilter(
             carrier_name=carrier_name,
             report_end_dt=report_end_dt,
-            decision_types=decision_types_list,
-            ongoing_rate_months=ongoing_months_list
+            decision_types=_parse_csv_str(decision_types) if decision_types else None,
+            ongoing_rate_months=_parse_csv_int(ongoing_rate_months) if ongoing_rate_months else None
         )
+        
+        service = ClaimsService(session)
+        count = service.count_claims(filters)
         return {"count": count}
     except Exception as e:
         logger.error(f"Error counting claims: {e}")
@@ -1,20 +1,42 @@
 """Policy API endpoints."""
 
 import logging
-from typing import List, Dict, Any
+from dataclasses import asdict
+from datetime import date
+from typing import Dict, Any, Iterator, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from snowflake.snowpark import Session
 
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, decode_cursor, next_cursor
+from app.core.responses import RowsResponse, struct_rows_response, validated_rows_response
+from app.core.snowpark_session import session_manager
 from app.dependencies import get_db_session
+from app.models.domain import PolicyFilter
+from app.models.structs import PolicyListStruct
 from app.repositories.policy_repo import PolicyRepository
-from app.models.schemas import PolicyResponse, PolicyFilterRequest, ErrorResponse
+from app.models.schemas import PolicyResponse, PolicyListAdapter, PolicyFilterRequest, ErrorResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/policies", tags=["Policies"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _slim_export_lines(carrier_name: Optional[str], snapshot_date: Optional[str]) -> Iterator[bytes]:
+    """Yield one NDJSON line per slim policy row.
+    
+    The session is borrowed here rather than through Depends, since the body
+    is streamed after the route returns and must keep its session until done.
+    """
+    with session_manager.session_scope() as session:
+        for policy in PolicyRepository(session).iter_slim(carrier_name, snapshot_date):
+            yield orjson.dumps(policy, option=orjson.OPT_APPEND_NEWLINE)
+
 
 @router.get("/{policy_id}", response_model=Dict[str, Any])
-async def get_policy(
+def get_policy(
     policy_id: int,
     session: Session = Depends(get_db_session)
 ):
@@ -26,7 +48,7 @@ async def get_policy(
         if not policy:
             raise HTTPException(status_code=404, detail=f"Policy {policy_id} not found")
         
-        return policy.model_dump()
+        return asdict(policy)
     except HTTPException:
         raise
     except Exception as e:
@@ -34,50 +56,124 @@ async def get_policy(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_policies(
+@router.get("/", response_class=RowsResponse)
+def list_policies(
     carrier_name: str = Query(None, description="Filter by carrier name"),
     snapshot_date: str = Query(None, description="Filter by snapshot date"),
     policy_status: str = Query(None, description="Filter by policy status"),
     state: str = Query(None, description="Filter by state"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    columnar: bool = Query(False, description="Return column -> values arrays instead of row objects"),
+    validate: bool = Query(False, description="Validate rows against the response schema, omitting null fields"),
+    include_total: bool = Query(
+        False,
+        description=f"Return the total matching row count in the {TOTAL_COUNT_HEADER} header (row format only)"
+    ),
+    cursor: str = Query(
+        None,
+        description=f"Keyset cursor from a previous page's {NEXT_CURSOR_HEADER} header; replaces offset"
+    ),
     session: Session = Depends(get_db_session)
 ):
-    """List policies with optional filters."""
+    """List policies with optional filters.
+    
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the next page. With include_total, the X-Total-Count header
+    holds the number of matching rows, computed in the same query as the page.
+    """
     try:
+        after_snapshot_date = after_id = None
+        if cursor:
+            try:
+                after_snapshot_date, after_id = decode_cursor(cursor, 2)
+                # POLICY_SNAPSHOT_DATE is an ISO date string; keep it a string
+                date.fromisoformat(after_snapshot_date)
+                if not isinstance(after_id, int) or isinstance(after_id, bool):
+                    raise TypeError("Cursor policy_id must be an integer")
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
         repo = PolicyRepository(session)
-        policies = repo.list(
+        with_total = include_total and not columnar
+        if columnar:
+            fetch = repo.list_columns
+        elif with_total:
+            fetch = repo.list_with_total
+        else:
+            fetch = repo.list
+        policies = fetch(
             limit=limit,
             offset=offset,
-            carrier_name=carrier_name,
-            snapshot_date=snapshot_date,
-            policy_status=policy_status,
-            state=state
+            filters=PolicyFilter(
+                carrier_name=carrier_name,
+                snapshot_date=snapshot_date,
+                policy_status=policy_status,
+                state=state
+            ),
+            after_snapshot_date=after_snapshot_date,
+            after_id=after_id
         )
-        return policies
+        if with_total:
+            policies, total = policies
+        if validate and not columnar:
+            if PolicyListStruct is not None:
+                response = struct_rows_response(PolicyListStruct, policies)
+            else:
+                response = validated_rows_response(PolicyListAdapter, policies)
+        else:
+            response = RowsResponse(content=policies)
+        
+        token = next_cursor(policies, limit, "policy_snapshot_date", "policy_id")
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
+        if with_total:
+            response.headers[TOTAL_COUNT_HEADER] = str(total)
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing policies: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/count/total", response_model=Dict[str, int])
-async def count_policies(
+@router.get("/export/slim", response_class=StreamingResponse)
+def export_policies_slim(
+    carrier_name: str = Query(None, description="Filter by carrier name"),
+    snapshot_date: str = Query(None, description="Filter by snapshot date")
+):
+    """Stream matching policies as newline-delimited JSON for bulk export.
+    
+    Rows use the PolicyMonthlySnapshotSlim layout: date columns are epoch
+    days, and rows are sent as they are fetched rather than buffered.
+    """
+    return StreamingResponse(
+        _slim_export_lines(carrier_name, snapshot_date),
+        media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+@router.get("/count/total", response_model=Dict[str, int], deprecated=True)
+def count_policies(
     carrier_name: str = Query(None),
     snapshot_date: str = Query(None),
     policy_status: str = Query(None),
     state: str = Query(None),
     session: Session = Depends(get_db_session)
 ):
-    """Count policies matching filters."""
+    """Count policies matching filters.
+    
+    Deprecated: pass include_total=true to the list endpoint instead, which
+    returns the count from the same query as the page.
+    """
     try:
         repo = PolicyRepository(session)
-        count = repo.count(
+        count = repo.count(PolicyFilter(
             carrier_name=carrier_name,
             snapshot_date=snapshot_date,
             policy_status=policy_status,
             state=state
-        )
+        ))
         return {"count": count}
     except Exception as e:
         logger.error(f"Error counting policies: {e}")
@@ -85,7 +181,7 @@ async def count_policies(
 
 
 @router.get("/metrics/summary", response_model=Dict[str, Any])
-async def get_policy_metrics(
+def get_policy_metrics(
     carrier_name: str = Query(None),
     snapshot_date: str = Query(None),
     session: Session = Depends(get_db_session)
@@ -1,5 +1,6 @@
 """Application configuration using Pydantic settings."""
 
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -41,6 +42,8 @@ class Settings(BaseSettings):
     
     # Connection Pool
     max_pool_connections: int = 5
+    pool_timeout: float = 30.0
+    threadpool_size: int = 64
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -50,6 +53,8 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once per process; usable as a FastAPI dependency."""
+    return Settings()
 
@@ -1,103 +1,229 @@
 """Caching utilities with Redis support."""
 
-import json
+import asyncio
+import fnmatch
+import hashlib
+import inspect
 import logging
+import threading
 from functools import wraps
-from typing import Any, Callable, Optional
-import redis
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import orjson
+from anyio import to_thread
+from cachetools import TLRUCache
+from redis.asyncio import Redis as AsyncRedis
 from redis.exceptions import RedisError
+from snowflake.snowpark import Session
 
-from app.config import settings
+from app.config import get_settings
 from app.core.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _entry_expiry(_key: str, entry: Tuple[Any, int], now: float) -> float:
+    """Expire a memory-tier (value, ttl) entry ttl seconds after it was set."""
+    return now + entry[1]
 
 
 class CacheManager:
-    """Manages caching operations with Redis backend."""
+    """Manages two-tier caching: an in-process TTL cache in front of Redis.
+    
+    The memory tier is per worker process. Deletes and invalidations clear
+    Redis and the calling worker's memory tier only, so other workers can
+    keep serving their copy until its own TTL runs out.
+    """
     
     def __init__(self):
-        self._redis_client: Optional[redis.Redis] = None
-        self._memory_cache: dict = {}
-        
-        if settings.redis_enabled and settings.cache_enabled:
-            try:
-                self._redis_client = redis.from_url(
-                    settings.redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=5
-                )
-                # Test connection
-                self._redis_client.ping()
-                logger.info("Redis connection established")
-            except RedisError as e:
-                logger.warning(f"Redis connection failed, falling back to memory cache: {e}")
-                self._redis_client = None
+        self._redis_client: Optional[AsyncRedis] = None
+        # Entries are (value, ttl) so each key expires on its own TTL
+        self._memory_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_entry_expiry)
+        # Sync cached functions run in the threadpool alongside the event loop
+        self._memory_lock = threading.RLock()
+    
+    async def connect(self):
+        """Connect to Redis; call once from the application lifespan."""
+        if not (settings.redis_enabled and settings.cache_enabled):
+            return
+        
+        try:
+            self._redis_client = AsyncRedis.from_url(
+                settings.redis_url,
+                decode_responses=False,
+                socket_connect_timeout=5
+            )
+            # Test connection
+            await self._redis_client.ping()
+            logger.info("Redis connection established")
+        except RedisError as e:
+            logger.warning(f"Redis connection failed, falling back to memory cache: {e}")
+            self._redis_client = None
+    
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self._redis_client:
+            await self._redis_client.aclose()
+            self._redis_client = None
     
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         if not settings.cache_enabled:
             return None
         
+        value = self.get_local(key)
+        if value is not None:
+            return value
+        
         try:
-            # Try Redis first
             if self._redis_client:
-                value = self._redis_client.get(key)
-                if value:
-                    logger.debug(f"Cache hit (Redis): {key}")
-                    return json.loads(value)
-            
-            # Fallback to memory cache
-            if key in self._memory_cache:
-                logger.debug(f"Cache hit (memory): {key}")
-                return self._memory_cache[key]
+                raw = await self._redis_client.get(key)
+                if raw:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Cache hit (Redis): {key}")
+                    value = orjson.loads(raw)
+                    self.set_local(key, value)
+                    return value
             
-            logger.debug(f"Cache miss: {key}")
             return None
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
         """Set value in cache with optional TTL."""
         if not settings.cache_enabled:
             return
         
         ttl = ttl or settings.cache_ttl
+        self.set_local(key, value, ttl)
         
         try:
-            # Try Redis first
             if self._redis_client:
-                self._redis_client.setex(
+                await self._redis_client.setex(
                     key,
                     ttl,
-                    json.dumps(value, default=str)
+                    orjson.dumps(value, default=str, option=ORJSON_OPTIONS)
                 )
-                logger.debug(f"Cache set (Redis): {key} (TTL: {ttl}s)")
-            else:
-                # Fallback to memory cache (no TTL support in simple dict)
-                self._memory_cache[key] = value
-                logger.debug(f"Cache set (memory): {key}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache set (Redis): {key} (TTL: {ttl}s)")
         except Exception as e:
             logger.warning(f"Cache set error for key {key}: {e}")
     
-    def delete(self, key: str):
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values, fetching local misses from Redis in one MGET."""
+        if not settings.cache_enabled:
+            return [None] * len(keys)
+        
+        values = [self.get_local(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing or not self._redis_client:
+            return values
+        
+        try:
+            raw_values = await self._redis_client.mget([keys[i] for i in missing])
+            for i, raw in zip(missing, raw_values):
+                if raw:
+                    values[i] = orjson.loads(raw)
+                    self.set_local(keys[i], values[i])
+        except Exception as e:
+            logger.warning(f"Cache get_many error for {len(keys)} keys: {e}")
+        return values
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None):
+        """Set several values, writing them to Redis in one pipeline."""
+        if not settings.cache_enabled:
+            return
+        
+        ttl = ttl or settings.cache_ttl
+        for key, value in items.items():
+            self.set_local(key, value, ttl)
+        
+        try:
+            if self._redis_client:
+                pipe = self._redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.setex(key, ttl, orjson.dumps(value, default=str, option=ORJSON_OPTIONS))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache set_many error for {len(items)} keys: {e}")
+    
+    def get_local(self, key: str) -> Optional[Any]:
+        """Get value from the in-process memory cache."""
+        if not settings.cache_enabled:
+            return None
+        
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+        value = entry[0] if entry is not None else None
+        if value is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache hit (memory): {key}")
+            return value
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache miss: {key}")
+        return None
+    
+    def set_local(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Set value in the in-process memory cache with optional TTL."""
+        if not settings.cache_enabled:
+            return
+        
+        with self._memory_lock:
+            self._memory_cache[key] = (value, ttl or settings.cache_ttl)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache set (memory): {key}")
+    
+    async def delete(self, key: str):
         """Delete value from cache."""
         try:
             if self._redis_client:
-                self._redis_client.delete(key)
-            if key in self._memory_cache:
-                del self._memory_cache[key]
-            logger.debug(f"Cache deleted: {key}")
+                await self._redis_client.delete(key)
+            with self._memory_lock:
+                self._memory_cache.pop(key, None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache deleted: {key}")
         except Exception as e:
             logger.warning(f"Cache delete error for key {key}: {e}")
     
-    def clear(self):
+    async def get_or_set(self, key: str, ttl: Optional[int], fn: Callable[[], Any]) -> Any:
+        """Get value from cache, computing and caching it with fn on a miss."""
+        value = await self.get(key)
+        if value is not None:
+            return value
+        
+        if inspect.iscoroutinefunction(fn):
+            value = await fn()
+        else:
+            # fn usually runs blocking Snowpark queries; keep them off the event loop
+            value = await to_thread.run_sync(fn)
+        await self.set(key, value, ttl)
+        return value
+    
+    async def delete_pattern(self, pattern: str):
+        """Delete all keys matching a glob pattern, e.g. after a snapshot load."""
+        try:
+            if self._redis_client:
+                keys = [key async for key in self._redis_client.scan_iter(match=pattern)]
+                if keys:
+                    await self._redis_client.delete(*keys)
+            with self._memory_lock:
+                for key in [k for k in self._memory_cache if fnmatch.fnmatchcase(k, pattern)]:
+                    self._memory_cache.pop(key, None)
+            logger.info(f"Cache invalidated: {pattern}")
+        except Exception as e:
+            logger.warning(f"Cache delete error for pattern {pattern}: {e}")
+    
+    async def clear(self):
         """Clear all cache."""
         try:
             if self._redis_client:
-                self._redis_client.flushdb()
-            self._memory_cache.clear()
+                await self._redis_client.flushdb()
+            with self._memory_lock:
+                self._memory_cache.clear()
             logger.info("Cache cleared")
         except Exception as e:
             logger.warning(f"Cache clear error: {e}")
@@ -107,24 +233,94 @@ class CacheManager:
 cache_manager = CacheManager()
 
 
+def _is_key_arg(arg: Any) -> bool:
+    """Whether an argument identifies the cached result.
+
+    Sessions and objects with the default repr (such as a service's self)
+    only contribute a memory address, which would make every key unique.
+    """
+    return not isinstance(arg, Session) and type(arg).__repr__ is not object.__repr__
+
+
+def make_cache_key(
+    func: Callable,
+    signature: inspect.Signature,
+    key_prefix: str,
+    args: tuple,
+    kwargs: dict
+) -> str:
+    """Build a short, deterministic cache key for a call.
+
+    Arguments are bound to the signature with defaults applied, so
+    positional, keyword and defaulted calls share a key.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    key_parts = [func.__module__, func.__name__]
+    key_parts.extend(
+        (name, value) for name, value in bound.arguments.items() if _is_key_arg(value)
+    )
+    digest = hashlib.blake2b(
+        orjson.dumps(key_parts, default=str, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+    return key_prefix + ":".join((func.__name__, digest))
+
+
 def cached(ttl: Optional[int] = None, key_prefix: str = ""):
-    """Decorator to cache function results."""
+    """Decorator to cache function results.
+
+    Coroutine functions are cached in both tiers. Plain functions cannot
+    await the async Redis client, so they use the in-process tier only.
+    The wrapper's ``refresh`` recomputes and stores a result without a lookup.
+    """
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                cache_key = make_cache_key(func, signature, key_prefix, args, kwargs)
+                
+                # Try to get from cache
+                cached_value = await cache_manager.get(cache_key)
+                if cached_value is not None:
+                    return cached_value
+                
+                # Execute function and cache result
+                result = await func(*args, **kwargs)
+                await cache_manager.set(cache_key, result, ttl)
+                
+                return result
+            
+            async def async_refresh(*args, **kwargs) -> Any:
+                result = await func(*args, **kwargs)
+                await cache_manager.set(make_cache_key(func, signature, key_prefix, args, kwargs), result, ttl)
+                return result
+            
+            async_wrapper.refresh = async_refresh
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            # Generate cache key from function name and arguments
-            cache_key = f"{key_prefix}{func.__name__}:{str(args)}:{str(kwargs)}"
+            cache_key = make_cache_key(func, signature, key_prefix, args, kwargs)
             
             # Try to get from cache
-            cached_value = cache_manager.get(cache_key)
+            cached_value = cache_manager.get_local(cache_key)
             if cached_value is not None:
                 return cached_value
             
             # Execute function and cache result
             result = func(*args, **kwargs)
-            cache_manager.set(cache_key, result, ttl)
+            cache_manager.set_local(cache_key, result, ttl)
             
             return result
+        
+        def refresh(*args, **kwargs) -> Any:
+            result = func(*args, **kwargs)
+            cache_manager.set_local(make_cache_key(func, signature, key_prefix, args, kwargs), result, ttl)
+            return result
+        
+        wrapper.refresh = refresh
         return wrapper
     return decorator
-
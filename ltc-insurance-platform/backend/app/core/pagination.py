@@ -0,0 +1,44 @@
+"""Opaque cursor tokens for keyset pagination."""
+
+import base64
+import binascii
+from typing import Any, List, Optional
+
+import orjson
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row returned as an opaque token."""
+    return base64.urlsafe_b64encode(orjson.dumps(values, default=str)).decode()
+
+
+def decode_cursor(token: str, size: int) -> List[Any]:
+    """Decode a cursor token back into its sort key values.
+
+    Raises:
+        ValueError: If the token is malformed or has the wrong number of values
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, orjson.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def next_cursor(rows: Any, limit: int, *keys: str) -> Optional[str]:
+    """Cursor for the page after rows, or None if rows was the last page.
+
+    Accepts either a list of row dicts or a column -> values dict.
+    """
+    if isinstance(rows, dict):
+        if not rows or len(rows[keys[0]]) < limit:
+            return None
+        return encode_cursor(*(rows[key][-1] for key in keys))
+    if len(rows) < limit:
+        return None
+    return encode_cursor(*(rows[-1][key] for key in keys))
@@ -0,0 +1,96 @@
+"""Response classes for serializing raw query rows."""
+
+import hashlib
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.models.structs import msgspec
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+
+class RowsResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts Snowflake NUMBER values as Decimal."""
+
+    def render(self, content: Any) -> bytes:
+        """Render rows straight to JSON bytes, skipping jsonable_encoder."""
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def validated_rows_response(adapter: TypeAdapter, rows: Any) -> Response:
+    """Validate rows against a list schema and serialize them in one pass.
+    
+    Args:
+        adapter: Prebuilt TypeAdapter for a list of response models
+        rows: Row dicts from a repository
+    
+    Returns:
+        JSON response with null fields omitted, encoded by pydantic-core
+    """
+    models = adapter.validate_python(rows, strict=False)
+    return Response(
+        content=adapter.dump_json(models, exclude_none=True),
+        media_type="application/json"
+    )
+
+
+_MSGSPEC_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def struct_rows_response(list_type: Any, rows: Any) -> Response:
+    """Convert rows into msgspec Structs and encode them in C.
+    
+    Args:
+        list_type: List[...Struct] type from app.models.structs
+        rows: Row dicts from a repository
+    
+    Returns:
+        JSON response with null fields omitted
+    """
+    structs = msgspec.convert(rows, list_type, strict=False)
+    return Response(content=_MSGSPEC_ENCODER.encode(structs), media_type="application/json")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, payload: Any) -> Response:
+    """Serialize payload with an ETag, answering 304 if the client has it.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        payload: Pydantic model or JSON-compatible data
+
+    Returns:
+        304 Not Modified on a match, otherwise the JSON body with an ETag header
+    """
+    if isinstance(payload, BaseModel):
+        body = payload.model_dump_json().encode()
+    else:
+        body = orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
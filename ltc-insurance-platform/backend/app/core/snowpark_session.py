@@ -1,22 +1,57 @@
 """Snowpark session manager with connection pooling."""
 
+import asyncio
 import logging
+import queue
+import threading
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, Optional, Set
+from snowflake.connector.errors import DatabaseError, InterfaceError, OperationalError
 from snowflake.snowpark import Session
 from snowflake.snowpark.exceptions import SnowparkSessionException
 
-from app.config import settings
+from app.config import get_settings
 from app.core.exceptions import SnowflakeConnectionError
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Seconds between background liveness checks of idle sessions
+SESSION_PING_INTERVAL = 60
+
+# Server error codes for a session or its auth token that is no longer valid
+SESSION_GONE_ERRNOS = frozenset({390111, 390112, 390114})
+
+
+def is_connection_error(exc: Optional[BaseException]) -> bool:
+    """Check whether an error, or one it was raised from, means a lost connection.
+    
+    Routes re-raise failures as HTTPException, so the chained
+    __cause__/__context__ errors are inspected as well.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (SnowparkSessionException, OperationalError, InterfaceError)):
+            return True
+        if isinstance(exc, DatabaseError) and getattr(exc, "errno", None) in SESSION_GONE_ERRNOS:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
 
 
 class SnowparkSessionManager:
-    """Manages Snowpark sessions with connection pooling."""
+    """Manages a bounded pool of Snowpark sessions.
+    
+    Sessions are not thread-safe, so each one is lent to a single borrower
+    at a time; a borrowed session never sits in the pool.
+    """
     
     def __init__(self):
-        self._session: Optional[Session] = None
+        self._pool: "queue.Queue[Session]" = queue.Queue(maxsize=settings.max_pool_connections)
+        self._created = 0
+        self._in_use: Set[int] = set()
+        self._lock = threading.Lock()
         self._connection_params = {
             "account": settings.snowflake_account,
             "user": settings.snowflake_user,
@@ -25,16 +60,18 @@ class SnowparkSessionManager:
             "database": settings.snowflake_database,
             "schema": settings.snowflake_schema,
             "role": settings.snowflake_role,
+            "client_session_keep_alive": True,
         }
+        # Configure the builder once; pool refills only call create()
+        self._builder = Session.builder.configs(self._connection_params)
     
-    def get_session(self) -> Session:
-        """Get or create a Snowpark session."""
+    def _create_session(self) -> Session:
+        """Create a new Snowpark session."""
         try:
-            if self._session is None or not self._is_session_active():
-                logger.info("Creating new Snowpark session")
-                self._session = Session.builder.configs(self._connection_params).create()
-                logger.info("Snowpark session created successfully")
-            return self._session
+            logger.info("Creating new Snowpark session")
+            session = self._builder.create()
+            logger.info("Snowpark session created successfully")
+            return session
         except Exception as e:
             logger.error(f"Failed to create Snowpark session: {e}")
             raise SnowflakeConnectionError(
@@ -42,47 +79,136 @@ class SnowparkSessionManager:
                 details=str(e)
             )
     
-    def _is_session_active(self) -> bool:
-        """Check if the current session is active."""
-        if self._session is None:
-            return False
+    def _reserve_slot(self) -> bool:
+        """Reserve room for one more session if the pool is not full."""
+        with self._lock:
+            if self._created >= settings.max_pool_connections:
+                return False
+            self._created += 1
+            return True
+    
+    def _free_slot(self):
+        """Give back a reserved slot after a session is dropped."""
+        with self._lock:
+            self._created -= 1
+    
+    def _new_pooled_session(self) -> Session:
+        """Create a session in a reserved slot, freeing the slot on failure."""
+        try:
+            return self._create_session()
+        except Exception:
+            self._free_slot()
+            raise
+    
+    def _checkout(self, session: Session) -> Session:
+        """Mark a session as lent out."""
+        with self._lock:
+            self._in_use.add(id(session))
+        return session
+    
+    def fill_pool(self):
+        """Pre-create sessions up to max_pool_connections."""
+        while self._reserve_slot():
+            self._pool.put(self._new_pooled_session())
+    
+    def acquire(self) -> Session:
+        """Take a session from the pool, creating one if there is room."""
+        try:
+            return self._checkout(self._pool.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if self._reserve_slot():
+            return self._checkout(self._new_pooled_session())
+        
+        try:
+            return self._checkout(self._pool.get(timeout=settings.pool_timeout))
+        except queue.Empty:
+            raise SnowflakeConnectionError(
+                message="Timed out waiting for a Snowflake session",
+                details=f"All {settings.max_pool_connections} sessions are in use"
+            )
+    
+    def release(self, session: Session, discard: bool = False):
+        """Return a session to the pool, or drop it if it is broken."""
+        with self._lock:
+            if id(session) not in self._in_use:
+                # A second release would let two borrowers share the session
+                logger.warning("Ignoring release of a Snowpark session that is not checked out")
+                return
+            self._in_use.discard(id(session))
+        
+        if discard:
+            logger.warning("Dropping broken Snowpark session from pool")
+            self._close(session)
+            self._free_slot()
+            return
+        self._pool.put(session)
+    
+    def check_idle_sessions(self):
+        """Ping idle sessions, replacing any that no longer respond."""
+        for _ in range(self._pool.qsize()):
+            try:
+                session = self._checkout(self._pool.get_nowait())
+            except queue.Empty:
+                break
+            self.release(session, discard=not self._is_session_active(session))
+        self.fill_pool()
+    
+    async def keep_alive(self, interval: float = SESSION_PING_INTERVAL):
+        """Background task running check_idle_sessions every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.check_idle_sessions)
+            except Exception as e:
+                logger.warning(f"Snowpark session health check failed: {e}")
+    
+    def _is_session_active(self, session: Session) -> bool:
+        """Check if a session is still usable."""
         try:
             # Try a simple query to check connection
-            self._session.sql("SELECT 1").collect()
+            session.sql("SELECT 1").collect()
             return True
         except (SnowparkSessionException, Exception):
             return False
     
-    def close_session(self):
-        """Close the current Snowpark session."""
-        if self._session is not None:
+    def _close(self, session: Session):
+        """Close a single session, logging failures."""
+        try:
+            session.close()
+        except Exception as e:
+            logger.warning(f"Error closing Snowpark session: {e}")
+    
+    def close_all(self):
+        """Close every pooled session."""
+        while True:
             try:
-                self._session.close()
-                logger.info("Snowpark session closed")
-            except Exception as e:
-                logger.warning(f"Error closing Snowpark session: {e}")
-            finally:
-                self._session = None
+                session = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close(session)
+            self._free_slot()
+        logger.info("Snowpark sessions closed")
     
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
-        """Context manager for Snowpark sessions."""
-        session = self.get_session()
+        """Context manager that borrows a pooled session."""
+        session = self.acquire()
+        broken = False
         try:
             yield session
         except Exception as e:
-            logger.error(f"Error during session operation: {e}")
+            broken = is_connection_error(e)
+            if broken:
+                logger.error(f"Snowpark session failed: {e}")
+            else:
+                logger.error(f"Error during session operation: {e}")
             raise
         finally:
-            # Keep session alive for reuse (connection pooling)
-            pass
+            # Broken sessions are replaced lazily on the next acquire
+            self.release(session, discard=broken)
 
 
 # Global session manager instance
 session_manager = SnowparkSessionManager()
-
-
-def get_snowpark_session() -> Session:
-    """Dependency function to get Snowpark session."""
-    return session_manager.get_session()
-
@@ -3,15 +3,10 @@
 from typing import Generator
 from snowflake.snowpark import Session
 
-from app.core.snowpark_session import get_snowpark_session
+from app.core.snowpark_session import session_manager
 
 
 def get_db_session() -> Generator[Session, None, None]:
-    """FastAPI dependency to provide Snowpark session."""
-    session = get_snowpark_session()
-    try:
+    """FastAPI dependency to provide a pooled Snowpark session."""
+    with session_manager.session_scope() as session:
         yield session
-    finally:
-        # Session is managed by the session manager (kept alive for reuse)
-        pass
-
@@ -1,17 +1,24 @@
 """FastAPI main application."""
 
+import asyncio
 import logging
 from datetime import datetime
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
+from app.config import get_settings
 from app.core.snowpark_session import session_manager
+from app.core.cache import cache_manager
 from app.core.exceptions import AppException
-from app.models.schemas import HealthResponse, ErrorResponse
+from app.models.schemas import HealthResponse
 from app.api.routes import policies, claims, analytics
+from app.repositories.base import BaseRepository
+
+settings = get_settings()
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +28,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def keep_cache_warm():
+    """Refresh hot dashboard queries shortly before their cache entries expire."""
+    interval = max(settings.cache_ttl - 30, 30)
+    while True:
+        try:
+            # Recompute from Snowflake, not from query results about to expire
+            BaseRepository.clear_query_cache()
+            await analytics.warm_analytics_cache()
+            await to_thread.run_sync(claims.warm_claims_summary_cache)
+            logger.info("Dashboard cache warmed")
+        except Exception as e:
+            logger.warning(f"Cache warm-up failed: {e}")
+        await asyncio.sleep(interval)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -28,18 +50,28 @@ async def lifespan(app: FastAPI):
     logger.info("Starting LTC Insurance Data Service Platform")
     logger.info(f"Connecting to Snowflake: {settings.snowflake_account}")
     
-    # Test database connection
+    # Sync route handlers run in anyio's threadpool while they wait on Snowflake
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
+    # Pre-warm the session pool
     try:
-        session = session_manager.get_session()
+        session_manager.fill_pool()
         logger.info("Snowflake connection established")
     except Exception as e:
         logger.error(f"Failed to connect to Snowflake: {e}")
     
+    await cache_manager.connect()
+    keep_alive_task = asyncio.create_task(session_manager.keep_alive())
+    warm_cache_task = asyncio.create_task(keep_cache_warm())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application")
-    session_manager.close_session()
+    warm_cache_task.cancel()
+    keep_alive_task.cancel()
+    await cache_manager.close()
+    session_manager.close_all()
 
 
 # Create FastAPI application
@@ -50,6 +82,7 @@ app = FastAPI(
     docs_url=f"{settings.api_prefix}/docs",
     redoc_url=f"{settings.api_prefix}/redoc",
     openapi_url=f"{settings.api_prefix}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -62,20 +95,24 @@ app.add_middleware(
     allow_headers=settings.cors_allow_headers,
 )
 
+# Compress JSON responses for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Exception handlers
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
     """Handle application-specific exceptions."""
     logger.error(f"Application error: {exc.message}", exc_info=True)
-    return JSONResponse(
+    # Plain dict matching ErrorResponse; no model build on the error path
+    return ORJSONResponse(
         status_code=400,
-        content=ErrorResponse(
-            error=exc.__class__.__name__,
-            message=exc.message,
-            details=exc.details,
-            timestamp=datetime.now()
-        ).model_dump()
+        content={
+            "error": exc.__class__.__name__,
+            "message": exc.message,
+            "details": exc.details,
+            "timestamp": datetime.now()
+        }
     )
 
 
@@ -83,25 +120,29 @@ async def app_exception_handler(request: Request, exc: AppException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            error="InternalServerError",
-            message="An unexpected error occurred",
-            details=str(exc) if settings.log_level == "DEBUG" else None,
-            timestamp=datetime.now()
-        ).model_dump()
+        content={
+            "error": "InternalServerError",
+            "message": "An unexpected error occurred",
+            "details": str(exc) if settings.log_level == "DEBUG" else None,
+            "timestamp": datetime.now()
+        }
     )
 
 
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
-    """Health check endpoint."""
+def health_check():
+    """Health check endpoint.
+    
+    A plain def so FastAPI runs it in the threadpool: acquiring a pooled
+    session and collect() both block.
+    """
     database_connected = False
     try:
-        session = session_manager.get_session()
-        session.sql("SELECT 1").collect()
+        with session_manager.session_scope() as session:
+            session.sql("SELECT 1").collect()
         database_connected = True
     except Exception as e:
         logger.warning(f"Database health check failed: {e}")
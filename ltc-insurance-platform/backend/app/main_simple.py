@@ -1,18 +1,32 @@
 """Simplified FastAPI main application that we know works."""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 
 # Import routers
 from app.api.routes import policies, claims, analytics
-from app.config import settings
+from app.core.cache import cache_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect the cache on startup and release it on shutdown."""
+    await cache_manager.connect()
+    yield
+    await cache_manager.close()
+
 
 # Create FastAPI application - minimal config
 app = FastAPI(
     title="LTC Insurance Data Service",
     version="1.0.0",
-    description="LTC Insurance Analytics Platform"
+    description="LTC Insurance Analytics Platform",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS
@@ -24,6 +38,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large list/insights responses
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Health check
 @app.get("/health")
 def health_check():
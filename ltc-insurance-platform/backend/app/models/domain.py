@@ -1,11 +1,50 @@
-"""Domain models matching Snowflake table structures."""
+"""Domain models matching Snowflake table structures.
 
+These are internal row containers, so they are plain dataclasses without
+per-field validation; Pydantic is kept for the API schemas.
+"""
+
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional, Tuple
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# date(1970, 1, 1).toordinal()
+_EPOCH_ORDINAL = 719163
+
+
+def to_epoch_day(value: Optional[date]) -> Optional[int]:
+    """Days since 1970-01-01 for a date or datetime (time of day dropped)."""
+    return None if value is None else value.toordinal() - _EPOCH_ORDINAL
 
 
-class PolicyMonthlySnapshot(BaseModel):
+class _RowModel:
+    """Mixin building a dataclass from a Snowpark row dict."""
+    
+    __slots__ = ()
+    
+    # Field names in declaration order, set by _with_field_names
+    _FIELDS: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_row(cls, row_dict: Dict[str, Any]):
+        """Build an instance from a row dict, matching column names case-insensitively."""
+        row = {k.lower(): v for k, v in row_dict.items()}
+        return cls(*[row.get(name) for name in cls._FIELDS])
+
+
+def _with_field_names(cls):
+    """Record a dataclass's field names once so from_row skips fields() per call."""
+    cls._FIELDS = tuple(f.name for f in fields(cls))
+    return cls
+
+
+@_with_field_names
+@dataclass(**_SLOTS)
+class PolicyMonthlySnapshot(_RowModel):
     """Domain model for POLICY_MONTHLY_SNAPSHOT_FACT table."""
     
     policy_monthly_snapshot_id: Optional[str] = None
@@ -97,12 +136,54 @@ class PolicyMonthlySnapshot(BaseModel):
     carrier_name: Optional[str] = None
     environment: Optional[str] = None
     policy_snapshot_date: Optional[str] = None
+
+
+@_with_field_names
+@dataclass(**_SLOTS)
+class PolicyMonthlySnapshotSlim(_RowModel):
+    """Lean POLICY_MONTHLY_SNAPSHOT_FACT row for bulk scans.
+    
+    Date columns hold epoch days (see to_epoch_day) instead of datetime
+    objects, so range checks and bucketing are plain int arithmetic.
+    """
     
-    class Config:
-        from_attributes = True
+    policy_id: Optional[int] = None
+    policy_dim_id: Optional[str] = None
+    carrier_name: Optional[str] = None
+    insured_state: Optional[str] = None
+    policy_residence_state: Optional[str] = None
+    policy_status_dim_id: Optional[str] = None
+    annualized_premium: Optional[float] = None
+    rated_age: Optional[int] = None
+    total_active_claims: Optional[int] = None
+    original_effective_dt: Optional[int] = None
+    coverage_expiration_dt: Optional[int] = None
+    policy_expiration_dt: Optional[int] = None
+    paid_to_date: Optional[int] = None
+    latest_claim_incurred_dt: Optional[int] = None
+    policy_snapshot_date: Optional[str] = None
+    
+    _DATE_FIELDS = frozenset({
+        "original_effective_dt",
+        "coverage_expiration_dt",
+        "policy_expiration_dt",
+        "paid_to_date",
+        "latest_claim_incurred_dt",
+    })
+    
+    @classmethod
+    def from_row(cls, row_dict: Dict[str, Any]):
+        """Build a slim row, converting date columns to epoch days."""
+        row = {k.lower(): v for k, v in row_dict.items()}
+        return cls(*[
+            to_epoch_day(row.get(name)) if name in cls._DATE_FIELDS else row.get(name)
+            for name in cls._FIELDS
+        ])
 
 
-class ClaimsTPAFeeWorksheet(BaseModel):
+@_with_field_names
+@dataclass(**_SLOTS)
+class ClaimsTPAFeeWorksheet(_RowModel):
     """Domain model for CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT table."""
     
     tpa_fee_worksheet_snapshot_fact_id: Optional[str] = None
@@ -167,7 +248,24 @@ class ClaimsTPAFeeWorksheet(BaseModel):
     co_med_dir_review_appeal: Optional[int] = None
     restoration_of_benefits: Optional[int] = None
     is_initial_decision_flag: Optional[int] = None
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ClaimsFilter:
+    """Validated claims filters; immutable and hashable for use as a cache key."""
     
-    class Config:
-        from_attributes = True
+    carrier_name: Optional[str] = None
+    report_end_dt: Optional[date] = None
+    decision_types: Optional[Tuple[str, ...]] = None
+    ongoing_rate_months: Optional[Tuple[int, ...]] = None
+    categories: Optional[Tuple[str, ...]] = None
+
 
+@dataclass(frozen=True, **_SLOTS)
+class PolicyFilter:
+    """Validated policy filters; immutable and hashable for use as a cache key."""
+    
+    carrier_name: Optional[str] = None
+    snapshot_date: Optional[str] = None
+    policy_status: Optional[str] = None
+    state: Optional[str] = None
@@ -2,13 +2,24 @@
 
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+# Responses are built once and never mutated; schemas are built on first use
+RESPONSE_CONFIG = ConfigDict(
+    frozen=True,
+    extra='ignore',
+    defer_build=True,
+    populate_by_name=True
+)
 
 
 # Request Models
 class ClaimsFilterRequest(BaseModel):
     """Filter parameters for claims queries."""
     
+    model_config = ConfigDict(extra='forbid')
+    
     carrier_name: Optional[str] = Field(None, description="Carrier name filter")
     report_end_dt: Optional[date] = Field(None, description="Report end date for snapshot")
     decision_types: Optional[List[str]] = Field(
@@ -30,6 +41,8 @@ class ClaimsFilterRequest(BaseModel):
 class PolicyFilterRequest(BaseModel):
     """Filter parameters for policy queries."""
     
+    model_config = ConfigDict(extra='forbid')
+    
     carrier_name: Optional[str] = Field(None, description="Carrier name filter")
     snapshot_date: Optional[str] = Field(None, description="Snapshot date filter")
     policy_status: Optional[str] = Field(None, description="Policy status filter")
@@ -42,7 +55,11 @@ class PolicyFilterRequest(BaseModel):
 class PolicyResponse(BaseModel):
     """Policy data response."""
     
+    # Snapshot rows carry more columns than the response exposes
+    model_config = RESPONSE_CONFIG
+    
     policy_id: Optional[int]
+    policy_dim_id: Optional[str] = None
     policy_number: Optional[str] = None
     carrier_name: Optional[str]
     insured_state: Optional[str]
@@ -62,9 +79,34 @@ class PolicyResponse(BaseModel):
     policy_snapshot_date: Optional[str]
 
 
+# Snapshot columns the policy list selects; the fact table has ~90
+POLICY_RESPONSE_COLS = (
+    "policy_id",
+    "policy_dim_id",
+    "carrier_name",
+    "insured_state",
+    "policy_residence_state",
+    "annualized_premium",
+    "lifetime_collected_premium",
+    "premium_frequency",
+    "original_effective_dt",
+    "policy_expiration_dt",
+    "in_waiver_flg",
+    "in_nonforfeiture_flg",
+    "rated_age",
+    "total_active_claims",
+    "total_rfbs",
+    "total_approved_rfbs",
+    "total_denials",
+    "policy_snapshot_date",
+)
+
+
 class ClaimResponse(BaseModel):
     """Claim data response."""
     
+    model_config = RESPONSE_CONFIG
+    
     tpa_fee_worksheet_snapshot_fact_id: Optional[str]
     policy_number: Optional[str]
     claimantname: Optional[str]
@@ -96,9 +138,43 @@ class ClaimResponse(BaseModel):
     poc_provider_type_desc: Optional[str]
 
 
+# Fact table columns the claims list selects, in ClaimResponse order
+CLAIM_RESPONSE_COLS = (
+    "tpa_fee_worksheet_snapshot_fact_id",
+    "policy_number",
+    "claimantname",
+    "decision",
+    "certificationdate",
+    "ongoing_rate_month",
+    "is_initial_decision_flag",
+    "carrier_name",
+    "snapshot_date",
+    "rfb_process_to_decision_tat",
+    "eob_creation_to_decision_tat",
+    "initial_decisions_facilities",
+    "ongoing_all_facilities",
+    "retro_all_facilities",
+    "initial_decisions_home_health",
+    "ongoing_home_health",
+    "retro_home_health",
+    "initial_decisions_all_other",
+    "all_other",
+    "retro_all_other",
+    "retro_months",
+    "poc_provider_type_desc",
+)
+
+
+# Built once so list results validate in a single call instead of per row
+PolicyListAdapter = TypeAdapter(List[PolicyResponse])
+ClaimListAdapter = TypeAdapter(List[ClaimResponse])
+
+
 class PolicyMetrics(BaseModel):
     """Policy analytics metrics."""
     
+    model_config = RESPONSE_CONFIG
+    
     total_policies: int
     active_policies: int
     in_forfeiture_policies: int
@@ -114,6 +190,8 @@ class PolicyMetrics(BaseModel):
 class ClaimsSummary(BaseModel):
     """Claims summary statistics."""
     
+    model_config = RESPONSE_CONFIG
+    
     total_claims: int
     approved_claims: int
     denied_claims: int
@@ -137,6 +215,8 @@ class ClaimsSummary(BaseModel):
 class ClaimsInsights(BaseModel):
     """Detailed claims insights."""
     
+    model_config = RESPONSE_CONFIG
+    
     summary: ClaimsSummary
     decision_breakdown: Dict[str, int]
     category_breakdown: Dict[str, int]
@@ -147,6 +227,8 @@ class ClaimsInsights(BaseModel):
 class PolicyInsights(BaseModel):
     """Detailed policy insights."""
     
+    model_config = RESPONSE_CONFIG
+    
     metrics: PolicyMetrics
     state_distribution: Dict[str, int]
     premium_by_state: Dict[str, float]
@@ -157,6 +239,8 @@ class PolicyInsights(BaseModel):
 class CombinedDashboard(BaseModel):
     """Combined dashboard data."""
     
+    model_config = RESPONSE_CONFIG
+    
     policy_metrics: PolicyMetrics
     claims_summary: ClaimsSummary
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -165,6 +249,8 @@ class CombinedDashboard(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response."""
     
+    model_config = RESPONSE_CONFIG
+    
     status: str
     timestamp: datetime
     database_connected: bool
@@ -175,6 +261,8 @@ class HealthResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response model."""
     
+    model_config = RESPONSE_CONFIG
+    
     error: str
     message: str
     details: Optional[Any] = None
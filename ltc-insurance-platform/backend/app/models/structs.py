@@ -0,0 +1,78 @@
+"""msgspec mirrors of the list response schemas for fast JSON encoding.
+
+msgspec is optional; when it is not installed ``msgspec`` is None and the
+routes fall back to the Pydantic list adapters.
+"""
+
+from datetime import datetime, date
+from typing import List, Optional
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class PolicyResponseStruct(msgspec.Struct, omit_defaults=True):
+        """msgspec mirror of PolicyResponse."""
+
+        policy_id: Optional[int] = None
+        policy_dim_id: Optional[str] = None
+        policy_number: Optional[str] = None
+        carrier_name: Optional[str] = None
+        insured_state: Optional[str] = None
+        policy_residence_state: Optional[str] = None
+        annualized_premium: Optional[float] = None
+        lifetime_collected_premium: Optional[float] = None
+        premium_frequency: Optional[str] = None
+        original_effective_dt: Optional[datetime] = None
+        policy_expiration_dt: Optional[datetime] = None
+        in_waiver_flg: Optional[str] = None
+        in_nonforfeiture_flg: Optional[str] = None
+        rated_age: Optional[int] = None
+        total_active_claims: Optional[int] = None
+        total_rfbs: Optional[int] = None
+        total_approved_rfbs: Optional[int] = None
+        total_denials: Optional[int] = None
+        policy_snapshot_date: Optional[str] = None
+
+    class ClaimResponseStruct(msgspec.Struct, omit_defaults=True):
+        """msgspec mirror of ClaimResponse."""
+
+        tpa_fee_worksheet_snapshot_fact_id: Optional[str] = None
+        policy_number: Optional[str] = None
+        claimantname: Optional[str] = None
+        decision: Optional[str] = None
+        certificationdate: Optional[date] = None
+        ongoing_rate_month: Optional[int] = None
+        is_initial_decision_flag: Optional[int] = None
+        carrier_name: Optional[str] = None
+        snapshot_date: Optional[date] = None
+        rfb_process_to_decision_tat: Optional[int] = None
+        eob_creation_to_decision_tat: Optional[int] = None
+
+        # Facility metrics
+        initial_decisions_facilities: Optional[int] = None
+        ongoing_all_facilities: Optional[int] = None
+        retro_all_facilities: Optional[int] = None
+
+        # Home Health metrics
+        initial_decisions_home_health: Optional[int] = None
+        ongoing_home_health: Optional[int] = None
+        retro_home_health: Optional[int] = None
+
+        # Other metrics
+        initial_decisions_all_other: Optional[int] = None
+        all_other: Optional[int] = None
+        retro_all_other: Optional[int] = None
+
+        retro_months: Optional[int] = None
+        poc_provider_type_desc: Optional[str] = None
+
+    PolicyListStruct = List[PolicyResponseStruct]
+    ClaimListStruct = List[ClaimResponseStruct]
+else:
+    PolicyListStruct = None
+    ClaimListStruct = None
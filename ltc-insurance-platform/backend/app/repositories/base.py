@@ -1,15 +1,39 @@
 """Abstract base repository for data access."""
 
+import hashlib
+import threading
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Any
-from snowflake.snowpark import Session
+from decimal import Decimal
+from typing import Callable, Generic, Iterator, TypeVar, List, Optional, Any, Dict, Sequence, Union
+from cachetools import TTLCache
+from snowflake.snowpark import DataFrame, Row, Session
+
+from app.config import get_settings
 
 T = TypeVar('T')
 
+# Window-count column list_with_total() adds to each row, and its row-dict key
+TOTAL_COLUMN = "__TOTAL"
+TOTAL_KEY = TOTAL_COLUMN.lower()
+
+# Low-cardinality string columns repeated on nearly every row
+CATEGORICAL_COLUMNS = frozenset({
+    "carrier_name",
+    "insured_state",
+    "policy_residence_state",
+    "premium_frequency",
+    "claim_status_cd",
+    "decision",
+})
+
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository with common data access patterns."""
     
+    # Query results shared by all repositories, keyed on the SQL text
+    _query_cache: TTLCache = TTLCache(maxsize=256, ttl=get_settings().cache_ttl)
+    _query_cache_lock = threading.RLock()
+    
     def __init__(self, session: Session):
         self.session = session
     
@@ -28,23 +52,164 @@ class BaseRepository(ABC, Generic[T]):
         """Count entities matching filters."""
         pass
     
-    def _execute_query(self, query: str, params: Optional[dict] = None) -> List[dict]:
-        """Execute a SQL query and return results as list of dicts."""
-        # Use Snowpark's native collect() instead of to_pandas()
-        rows = self.session.sql(query).collect()
+    def _cached_query(
+        self,
+        kind: str,
+        query: str,
+        params: Optional[Sequence[Any]],
+        run: Callable[[], Any]
+    ) -> Any:
+        """Return a cached result for (kind, query, params), running the query on a miss.
         
-        # Convert Row objects to list of dicts with lowercase keys and JSON-safe types
-        result = []
-        for row in rows:
-            row_dict = {}
-            for k, v in row.as_dict().items():
-                # Convert Decimals and other numeric types to native Python types
-                if hasattr(v, '__float__') and not isinstance(v, bool):
-                    row_dict[k.lower()] = float(v) if v is not None else 0.0
-                elif v is None:
-                    row_dict[k.lower()] = None
-                else:
-                    row_dict[k.lower()] = v
-            result.append(row_dict)
+        Callers share the cached object, so they must not mutate it.
+        """
+        if not get_settings().cache_enabled:
+            return run()
+        
+        key = hashlib.blake2b(
+            "\0".join((kind, query, repr(params))).encode(), digest_size=16
+        ).digest()
+        with self._query_cache_lock:
+            result = self._query_cache.get(key)
+        if result is None:
+            result = run()
+            with self._query_cache_lock:
+                self._query_cache[key] = result
         return result
-
+    
+    @classmethod
+    def clear_query_cache(cls):
+        """Drop every cached query result, e.g. after a snapshot load."""
+        with cls._query_cache_lock:
+            cls._query_cache.clear()
+    
+    def _iter_query(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream a SQL query's rows as dicts, one result chunk at a time.
+        
+        The result is never buffered in full, so use this for scans that are
+        consumed row by row (exports, streaming responses).
+        """
+        keys = None
+        for row in self.session.sql(query, params=params).to_local_iterator():
+            if keys is None:
+                keys = self._row_keys(row)
+            yield self._row_to_dict(keys, row)
+    
+    @staticmethod
+    def _row_keys(row: Row) -> List[str]:
+        """Lowercase column names of a result, read from its first row."""
+        return [k.lower() for k in row.as_dict()]
+    
+    @staticmethod
+    def _row_to_dict(keys: Sequence[str], row: Row) -> Dict[str, Any]:
+        """Build one row dict from precomputed lowercase keys, Decimals as float."""
+        return {k: float(v) if isinstance(v, Decimal) else v for k, v in zip(keys, row)}
+    
+    def _execute_aggregate(
+        self,
+        query: Union[str, DataFrame],
+        params: Optional[Sequence[Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a one-row aggregate query and return it with lowercase keys.
+        
+        Aggregations run in Snowflake, so only the aggregate row crosses the wire.
+        Results are cached in _query_cache, keyed on the SQL a DataFrame
+        compiles to; callers get their own copy and may mutate it.
+        """
+        if isinstance(query, str):
+            df = self.session.sql(query, params=params)
+            sql = query
+        else:
+            df = query
+            sql = "\n".join(df.queries["queries"])
+        row = self._cached_query(
+            "aggregate", sql, params,
+            lambda: self._rows_to_dicts(df.collect()[:1])[0]
+        )
+        return dict(row)
+    
+    @classmethod
+    def _rows_to_columns(
+        cls,
+        rows: Sequence[Row],
+        keys: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """Transpose Snowpark rows into lowercase column -> values lists.
+        
+        Column names are stored once instead of once per row, and the
+        result serializes to JSON without building a dict per row. Pass
+        keys, in select order, when the query's projection is known.
+        """
+        if not rows:
+            return {}
+        keys = keys or cls._row_keys(rows[0])
+        columns = {k: list(values) for k, values in zip(keys, zip(*rows))}
+        for i in cls._decimal_columns(rows):
+            columns[keys[i]] = cls._decimals_to_float(columns[keys[i]])
+        for name in CATEGORICAL_COLUMNS.intersection(columns):
+            columns[name] = cls._intern_strings(columns[name])
+        return columns
+    
+    @staticmethod
+    def _intern_strings(values: List[Optional[str]]) -> List[Optional[str]]:
+        """Share one string object per distinct value in a low-cardinality column."""
+        seen: Dict[Optional[str], Optional[str]] = {}
+        return [seen.setdefault(v, v) for v in values]
+    
+    @staticmethod
+    def _decimal_columns(rows: Sequence[Row]) -> List[int]:
+        """Positions of columns whose first non-null value is a Decimal.
+        
+        Computed once per result so Decimal -> float conversion runs only on
+        those columns, instead of type-checking every cell.
+        """
+        decimal_idx = []
+        for i in range(len(rows[0])):
+            sample = next((row[i] for row in rows if row[i] is not None), None)
+            if isinstance(sample, Decimal):
+                decimal_idx.append(i)
+        return decimal_idx
+    
+    @classmethod
+    def _rows_to_dicts(
+        cls,
+        rows: Sequence[Row],
+        keys: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Convert Snowpark rows to dicts with lowercase keys and float NUMBERs.
+        
+        Nulls stay None; they are never coerced to 0.0. Pass keys, in select
+        order, when the query's projection is known.
+        """
+        if not rows:
+            return []
+        keys = keys or cls._row_keys(rows[0])
+        decimal_idx = cls._decimal_columns(rows)
+        if not decimal_idx:
+            return [dict(zip(keys, row)) for row in rows]
+        
+        columns = list(zip(*rows))
+        for i in decimal_idx:
+            columns[i] = cls._decimals_to_float(columns[i])
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+    
+    @staticmethod
+    def _decimals_to_float(values: Sequence[Optional[Decimal]]) -> List[Optional[float]]:
+        """Convert one Decimal column to floats, keeping NULLs as None.
+        
+        NUMBER(38, s) tops out near 1e38, well inside float range, so the
+        conversion cannot overflow; it only rounds past ~15 significant digits.
+        """
+        return [None if v is None else float(v) for v in values]
+    
+    @staticmethod
+    def _pop_total(rows: List[Dict[str, Any]]) -> int:
+        """Strip the TOTAL_COLUMN window count from row dicts and return it."""
+        total = rows[0].get(TOTAL_KEY, 0) if rows else 0
+        for row in rows:
+            del row[TOTAL_KEY]
+        return total
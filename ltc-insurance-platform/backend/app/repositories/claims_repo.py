@@ -1,25 +1,40 @@
 """Claims data repository with complex filtering logic."""
 
+import calendar
 import logging
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
-from snowflake.snowpark import Session
+from snowflake.snowpark import Column, DataFrame, Row, Session
 from snowflake.snowpark.functions import (
-    col, avg, sum as sf_sum, count, when, 
-    last_day, to_timestamp, lit
+    col, sum as sf_sum, count, when, lit, coalesce
 )
+from snowflake.snowpark.types import DoubleType
 
-from app.repositories.base import BaseRepository
-from app.models.domain import ClaimsTPAFeeWorksheet
+from app.repositories.base import BaseRepository, TOTAL_COLUMN, TOTAL_KEY
+from app.models.domain import ClaimsFilter, ClaimsTPAFeeWorksheet
+from app.models.schemas import CLAIM_RESPONSE_COLS
 from app.core.exceptions import DataNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
+def _month_end(day: date) -> date:
+    """Last day of day's month, i.e. LAST_DAY(day) computed in Python."""
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
 class ClaimsRepository(BaseRepository[ClaimsTPAFeeWorksheet]):
     """Repository for claims data access with complex business logic."""
     
     TABLE_NAME = "CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT"
+    # Core-filtered claims pre-aggregated by carrier, date, decision,
+    # ongoing rate month and retro flag (see sql_scripts/01_create_tables.sql)
+    SUMMARY_VIEW = "CLAIMS_SUMMARY_BY_CARRIER_MV"
+    _LIST_COLUMNS = tuple(col(name.upper()) for name in CLAIM_RESPONSE_COLS)
+    # Row-dict keys for _LIST_COLUMNS, so list results skip lowercasing
+    _LIST_KEYS = CLAIM_RESPONSE_COLS
+    _LIST_KEYS_WITH_TOTAL = CLAIM_RESPONSE_COLS + (TOTAL_KEY,)
     
     def __init__(self, session: Session):
         super().__init__(session)
@@ -35,7 +50,7 @@ class ClaimsRepository(BaseRepository[ClaimsTPAFeeWorksheet]):
             if not rows:
                 return None
             
-            return ClaimsTPAFeeWorksheet(**rows[0].as_dict())
+            return ClaimsTPAFeeWorksheet.from_row(rows[0].as_dict())
         except Exception as e:
             logger.error(f"Error fetching claim {claim_id}: {e}")
             raise
@@ -44,194 +59,263 @@ class ClaimsRepository(BaseRepository[ClaimsTPAFeeWorksheet]):
         self,
         limit: int = 100,
         offset: int = 0,
-        carrier_name: Optional[str] = None,
-        report_end_dt: Optional[date] = None,
-        decision_types: Optional[List[str]] = None,
-        ongoing_rate_months: Optional[List[int]] = None,
-        categories: Optional[List[str]] = None
+        filters: ClaimsFilter = ClaimsFilter(),
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """List claims with complex filtering logic."""
+        """List claims with complex filtering logic.
+        
+        Pass the last row's snapshot_date and tpa_fee_worksheet_snapshot_fact_id
+        as after_snapshot_date/after_id to fetch the next page by keyset
+        instead of offset.
+        """
         try:
-            df = self.session.table(self.TABLE_NAME)
-            
-            # Apply core business logic filter
-            # WHERE ((ONGOING_RATE_MONTH = '1' AND IS_INITIAL_DECISION_FLAG IN (0,1))
-            #     OR (ONGOING_RATE_MONTH = '0' AND IS_INITIAL_DECISION_FLAG = 1)
-            #     OR (ONGOING_RATE_MONTH = '2' AND IS_INITIAL_DECISION_FLAG IN (0,1)))
-            
-            core_filter = (
-                ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-                ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-                ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
-            )
-            df = df.filter(core_filter)
-            
-            # Carrier filter
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            
-            # Date filter - snapshot_date = last_day(to_timestamp(report_end_dt))
-            if report_end_dt:
-                # Convert date to string format for Snowflake
-                date_str = report_end_dt.strftime('%Y-%m-%d')
-                df = df.filter(
-                    col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str)))
-                )
-            
-            # Decision types filter
-            if decision_types:
-                df = df.filter(col("DECISION").isin(decision_types))
-            
-            # Ongoing rate month filter (user override)
-            if ongoing_rate_months:
-                df = df.filter(col("ONGOING_RATE_MONTH").isin(ongoing_rate_months))
-            
-            # Category filter (based on facility indicators)
-            if categories:
-                category_filters = []
-                if "Facility" in categories:
-                    category_filters.append(
-                        (col("INITIAL_DECISIONS_FACILITIES") > 0) |
-                        (col("ONGOING_ALL_FACILITIES") > 0) |
-                        (col("RETRO_ALL_FACILITIES") > 0)
-                    )
-                if "Home Health" in categories:
-                    category_filters.append(
-                        (col("INITIAL_DECISIONS_HOME_HEALTH") > 0) |
-                        (col("ONGOING_HOME_HEALTH") > 0) |
-                        (col("RETRO_HOME_HEALTH") > 0)
-                    )
-                if "Other" in categories:
-                    category_filters.append(
-                        (col("INITIAL_DECISIONS_ALL_OTHER") > 0) |
-                        (col("ALL_OTHER") > 0) |
-                        (col("RETRO_ALL_OTHER") > 0)
-                    )
-                
-                if category_filters:
-                    combined_filter = category_filters[0]
-                    for f in category_filters[1:]:
-                        combined_filter = combined_filter | f
-                    df = df.filter(combined_filter)
-            
-            # Order by snapshot date descending for consistent pagination
-            df = df.order_by(col("SNAPSHOT_DATE").desc())
-            
-            # Apply pagination - Snowpark requires ordering before offset
-            if offset > 0:
-                df = df.limit(limit + offset)
-                rows = df.collect()[offset:]  # Skip offset rows after collection
-            else:
-                df = df.limit(limit)
-                rows = df.collect()
-            
-            # Convert to list of dicts with lowercase keys
-            return [
-                {k.lower(): v for k, v in row.as_dict().items()}
-                for row in rows
-            ]
+            rows = self._list_rows(limit, offset, filters, after_snapshot_date, after_id)
+            return self._rows_to_dicts(rows, self._LIST_KEYS)
         
         except Exception as e:
             logger.error(f"Error listing claims: {e}")
             raise
     
-    def count(
+    def list_with_total(
         self,
-        carrier_name: Optional[str] = None,
-        report_end_dt: Optional[date] = None,
-        decision_types: Optional[List[str]] = None,
-        ongoing_rate_months: Optional[List[int]] = None
-    ) -> int:
-        """Count claims matching filters."""
+        limit: int = 100,
+        offset: int = 0,
+        filters: ClaimsFilter = ClaimsFilter(),
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """List claims like list(), plus the total matching rows, in one query.
+        
+        The total comes from COUNT(*) OVER () on the same filtered scan, so
+        no separate count() query is needed. It is 0 when the page is empty.
+        """
         try:
-            df = self.session.table(self.TABLE_NAME)
-            
-            # Apply core business logic filter
-            core_filter = (
-                ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-                ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-                ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
+            rows = self._list_rows(
+                limit, offset, filters, after_snapshot_date, after_id, with_total=True
             )
-            df = df.filter(core_filter)
-            
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            
-            if report_end_dt:
-                date_str = report_end_dt.strftime('%Y-%m-%d')
-                df = df.filter(
-                    col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str)))
+            result = self._rows_to_dicts(rows, self._LIST_KEYS_WITH_TOTAL)
+            return result, self._pop_total(result)
+        
+        except Exception as e:
+            logger.error(f"Error listing claims with total: {e}")
+            raise
+    
+    def list_columns(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: ClaimsFilter = ClaimsFilter(),
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """List claims like list(), but as lowercase column -> values."""
+        try:
+            rows = self._list_rows(limit, offset, filters, after_snapshot_date, after_id)
+            return self._rows_to_columns(rows, self._LIST_KEYS)
+        
+        except Exception as e:
+            logger.error(f"Error listing claim columns: {e}")
+            raise
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _core_filter() -> Column:
+        """Core business logic filter shared by every claims query.
+        
+        WHERE ((ONGOING_RATE_MONTH = '1' AND IS_INITIAL_DECISION_FLAG IN (0,1))
+            OR (ONGOING_RATE_MONTH = '0' AND IS_INITIAL_DECISION_FLAG = 1)
+            OR (ONGOING_RATE_MONTH = '2' AND IS_INITIAL_DECISION_FLAG IN (0,1)))
+        
+        The expression never changes, so it is built once and reused.
+        """
+        return (
+            ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
+            ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
+            ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _snapshot_predicate(report_end_dt: date) -> Column:
+        """SNAPSHOT_DATE predicate for the month-end snapshot of report_end_dt.
+        
+        The month end is a plain DATE literal rather than a LAST_DAY(...)
+        expression, so Snowflake can prune micro-partitions on SNAPSHOT_DATE.
+        """
+        return col("SNAPSHOT_DATE") == lit(_month_end(report_end_dt))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _list_filter(filters: ClaimsFilter) -> Column:
+        """Build the WHERE predicate for list()/count(), cached per filter combination.
+        
+        Filters come from a small set of dashboard selections, so the same
+        expression tree is reused instead of rebuilt on every request. The
+        frozen ClaimsFilter is the cache key; pagination is kept out of it.
+        """
+        predicate = ClaimsRepository._core_filter()
+        
+        # Carrier filter
+        if filters.carrier_name:
+            predicate = predicate & (col("CARRIER_NAME") == filters.carrier_name)
+        
+        # Date filter - snapshot_date = last day of report_end_dt's month
+        if filters.report_end_dt:
+            predicate = predicate & ClaimsRepository._snapshot_predicate(filters.report_end_dt)
+        
+        # Decision types filter
+        if filters.decision_types:
+            predicate = predicate & col("DECISION").isin(list(filters.decision_types))
+        
+        # Ongoing rate month filter (user override)
+        if filters.ongoing_rate_months:
+            predicate = predicate & col("ONGOING_RATE_MONTH").isin(list(filters.ongoing_rate_months))
+        
+        # Category filter (based on facility indicators)
+        if filters.categories:
+            category_filters = []
+            if "Facility" in filters.categories:
+                category_filters.append(
+                    (col("INITIAL_DECISIONS_FACILITIES") > 0) |
+                    (col("ONGOING_ALL_FACILITIES") > 0) |
+                    (col("RETRO_ALL_FACILITIES") > 0)
+                )
+            if "Home Health" in filters.categories:
+                category_filters.append(
+                    (col("INITIAL_DECISIONS_HOME_HEALTH") > 0) |
+                    (col("ONGOING_HOME_HEALTH") > 0) |
+                    (col("RETRO_HOME_HEALTH") > 0)
+                )
+            if "Other" in filters.categories:
+                category_filters.append(
+                    (col("INITIAL_DECISIONS_ALL_OTHER") > 0) |
+                    (col("ALL_OTHER") > 0) |
+                    (col("RETRO_ALL_OTHER") > 0)
                 )
             
-            if decision_types:
-                df = df.filter(col("DECISION").isin(decision_types))
-            
-            if ongoing_rate_months:
-                df = df.filter(col("ONGOING_RATE_MONTH").isin(ongoing_rate_months))
+            if category_filters:
+                combined_filter = category_filters[0]
+                for f in category_filters[1:]:
+                    combined_filter = combined_filter | f
+                predicate = predicate & combined_filter
+        
+        return predicate
+    
+    def _list_rows(
+        self,
+        limit: int,
+        offset: int,
+        filters: ClaimsFilter,
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None,
+        with_total: bool = False
+    ) -> List[Row]:
+        """Run the filtered, projected and paginated claims query."""
+        df = self.session.table(self.TABLE_NAME).filter(self._list_filter(filters))
+        
+        # Select only the columns ClaimResponse exposes, plus a window count
+        # over the filtered rows (evaluated before LIMIT) when requested
+        if with_total:
+            df = df.select(*self._LIST_COLUMNS, count("*").over().alias(TOTAL_COLUMN))
+        else:
+            df = df.select(*self._LIST_COLUMNS)
+        
+        # Keyset pagination: rows strictly after the cursor in (date, id) order
+        if after_snapshot_date is not None and after_id is not None:
+            df = df.filter(
+                (col("SNAPSHOT_DATE") < lit(after_snapshot_date)) |
+                ((col("SNAPSHOT_DATE") == lit(after_snapshot_date)) &
+                 (col("TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID") < after_id))
+            )
+            offset = 0
+        
+        # Order by snapshot date, then ID, so pages are stable
+        df = df.order_by(
+            col("SNAPSHOT_DATE").desc(),
+            col("TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID").desc()
+        )
+        
+        # LIMIT/OFFSET run in Snowflake, so only the requested page is transferred
+        return df.limit(limit, offset=offset).collect()
+    
+    def count(self, filters: ClaimsFilter = ClaimsFilter()) -> int:
+        """Count claims matching filters."""
+        try:
+            df = self.session.table(self.TABLE_NAME).filter(self._list_filter(filters))
             
             return df.count()
         except Exception as e:
             logger.error(f"Error counting claims: {e}")
             raise
     
+    def _summary_frame(
+        self,
+        carrier_name: Optional[str],
+        report_end_dt: Optional[date]
+    ) -> DataFrame:
+        """Rows of SUMMARY_VIEW for the carrier/date; the core filter is built in."""
+        df = self.session.table(self.SUMMARY_VIEW)
+        
+        if carrier_name:
+            df = df.filter(col("CARRIER_NAME") == carrier_name)
+        
+        if report_end_dt:
+            df = df.filter(self._snapshot_predicate(report_end_dt))
+        
+        return df
+    
     def get_summary(
         self,
         carrier_name: Optional[str] = None,
         report_end_dt: Optional[date] = None
     ) -> Dict[str, Any]:
-        """Get claims summary statistics."""
+        """Get claims summary statistics from the pre-aggregated summary view."""
         try:
-            df = self.session.table(self.TABLE_NAME)
+            df = self._summary_frame(carrier_name, report_end_dt)
             
-            # Apply core filter
-            core_filter = (
-                ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-                ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-                ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
-            )
-            df = df.filter(core_filter)
-            
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            
-            if report_end_dt:
-                date_str = report_end_dt.strftime('%Y-%m-%d')
-                df = df.filter(
-                    col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str)))
-                )
+            # Re-sum the view's per-group claim counts, optionally for one slice
+            def claim_count(condition=None):
+                counts = col("CLAIM_COUNT")
+                if condition is not None:
+                    counts = when(condition, counts).otherwise(0)
+                return coalesce(sf_sum(counts), lit(0))
             
             # Calculate summary metrics
             summary_df = df.agg([
-                count("*").alias("total_claims"),
-                count(when(col("DECISION") == "Approved", 1)).alias("approved_claims"),
-                count(when(col("DECISION") == "Denied", 1)).alias("denied_claims"),
-                count(when(col("DECISION") == "In Assessment", 1)).alias("in_assessment_claims"),
-                avg("RFB_PROCESS_TO_DECISION_TAT").alias("avg_processing_time"),
-                count(when(col("RETRO_MONTHS") > 0, 1)).alias("total_retro_claims"),
+                claim_count().alias("total_claims"),
+                claim_count(col("DECISION") == "Approved").alias("approved_claims"),
+                claim_count(col("DECISION") == "Denied").alias("denied_claims"),
+                claim_count(col("DECISION") == "In Assessment").alias("in_assessment_claims"),
+                sf_sum("RFB_TAT_SUM").alias("rfb_tat_sum"),
+                sf_sum("RFB_TAT_COUNT").alias("rfb_tat_count"),
+                claim_count(col("IS_RETRO")).alias("total_retro_claims"),
                 
                 # By category
-                sf_sum("INITIAL_DECISIONS_FACILITIES").alias("facility_initial"),
-                sf_sum("ONGOING_ALL_FACILITIES").alias("facility_ongoing"),
-                sf_sum("RETRO_ALL_FACILITIES").alias("facility_retro"),
+                sf_sum("FACILITY_INITIAL").alias("facility_initial"),
+                sf_sum("FACILITY_ONGOING").alias("facility_ongoing"),
+                sf_sum("FACILITY_RETRO").alias("facility_retro"),
                 
-                sf_sum("INITIAL_DECISIONS_HOME_HEALTH").alias("home_health_initial"),
-                sf_sum("ONGOING_HOME_HEALTH").alias("home_health_ongoing"),
-                sf_sum("RETRO_HOME_HEALTH").alias("home_health_retro"),
+                sf_sum("HOME_HEALTH_INITIAL").alias("home_health_initial"),
+                sf_sum("HOME_HEALTH_ONGOING").alias("home_health_ongoing"),
+                sf_sum("HOME_HEALTH_RETRO").alias("home_health_retro"),
                 
-                sf_sum("INITIAL_DECISIONS_ALL_OTHER").alias("other_initial"),
-                sf_sum("ALL_OTHER").alias("other_ongoing"),
-                sf_sum("RETRO_ALL_OTHER").alias("other_retro"),
+                sf_sum("OTHER_INITIAL").alias("other_initial"),
+                sf_sum("OTHER_ONGOING").alias("other_ongoing"),
+                sf_sum("OTHER_RETRO").alias("other_retro"),
                 
                 # By ongoing rate month
-                count(when(col("ONGOING_RATE_MONTH") == 0, 1)).alias("initial_decisions"),
-                count(when(col("ONGOING_RATE_MONTH") == 1, 1)).alias("ongoing_decisions"),
-                count(when(col("ONGOING_RATE_MONTH") == 2, 1)).alias("restoration_decisions"),
+                claim_count(col("ONGOING_RATE_MONTH") == 0).alias("initial_decisions"),
+                claim_count(col("ONGOING_RATE_MONTH") == 1).alias("ongoing_decisions"),
+                claim_count(col("ONGOING_RATE_MONTH") == 2).alias("restoration_decisions"),
             ])
             
-            result = summary_df.collect()[0].as_dict()
+            result = self._execute_aggregate(summary_df)
             
-            # Convert keys to lowercase (Snowflake returns uppercase)
-            result = {k.lower(): v for k, v in result.items()}
+            # AVG(RFB_PROCESS_TO_DECISION_TAT) from the view's sum and non-null count
+            tat_sum = result.pop("rfb_tat_sum")
+            tat_count = result.pop("rfb_tat_count")
+            result["avg_processing_time"] = tat_sum / tat_count if tat_count else None
             
             # Calculate derived metrics
             total_claims = result.get("total_claims", 0) or 0
@@ -273,43 +357,21 @@ class ClaimsRepository(BaseRepository[ClaimsTPAFeeWorksheet]):
         carrier_name: Optional[str] = None,
         report_end_dt: Optional[date] = None
     ) -> Dict[str, int]:
-        """Get count of claims by decision type."""
+        """Get count of claims by decision type from the pre-aggregated summary view."""
         try:
-            df = self.session.table(self.TABLE_NAME)
-            
-            # Apply core filter
-            core_filter = (
-                ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-                ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-                ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
-            )
-            df = df.filter(core_filter)
-            
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            
-            if report_end_dt:
-                date_str = report_end_dt.strftime('%Y-%m-%d')
-                df = df.filter(
-                    col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str)))
-                )
+            df = self._summary_frame(carrier_name, report_end_dt)
             
             # Group by decision
             decision_df = df.group_by("DECISION").agg(
-                count("*").alias("count")
+                sf_sum("CLAIM_COUNT").alias("count")
             )
             
-            # Collect results and convert to dict
-            rows = decision_df.collect()
-            result = {}
-            for row in rows:
-                row_dict = row.as_dict()
-                # Convert keys to lowercase (Snowflake returns uppercase)
-                decision = row_dict.get("DECISION") or row_dict.get("decision")
-                count_val = row_dict.get("COUNT") or row_dict.get("count")
-                if decision:
-                    result[decision] = count_val
-            return result
+            # Rows are (DECISION, COUNT); unpack positionally instead of via as_dict()
+            return {
+                decision: count_val
+                for decision, count_val in decision_df.collect()
+                if decision
+            }
         
         except Exception as e:
             logger.error(f"Error getting decision breakdown: {e}")
@@ -320,50 +382,28 @@ class ClaimsRepository(BaseRepository[ClaimsTPAFeeWorksheet]):
         carrier_name: Optional[str] = None,
         report_end_dt: Optional[date] = None
     ) -> Dict[str, Any]:
-        """Get detailed retro claims analysis."""
+        """Get detailed retro claims analysis from the pre-aggregated summary view."""
         try:
-            df = self.session.table(self.TABLE_NAME)
-            
-            # Apply core filter
-            core_filter = (
-                ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-                ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-                ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
-            )
-            df = df.filter(core_filter)
-            
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
+            df = self._summary_frame(carrier_name, report_end_dt)
             
-            if report_end_dt:
-                date_str = report_end_dt.strftime('%Y-%m-%d')
-                df = df.filter(
-                    col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str)))
-                )
-            
-            # Filter retro claims
-            retro_df = df.filter(col("RETRO_MONTHS") > 0)
+            # Filter retro claims (RETRO_MONTHS > 0)
+            retro_df = df.filter(col("IS_RETRO"))
             
-            # Calculate retro metrics
+            # Calculate retro metrics, cast to DOUBLE so rows come back as floats
+            def as_double(expr):
+                return coalesce(expr, lit(0)).cast(DoubleType())
+
             retro_metrics = retro_df.agg([
-                count("*").alias("total_retro_claims"),
-                avg("RETRO_MONTHS").alias("avg_retro_months"),
-                sf_sum("RETRO_ALL_FACILITIES").alias("total_retro_facilities"),
-                sf_sum("RETRO_HOME_HEALTH").alias("total_retro_home_health"),
-                sf_sum("RETRO_ALL_OTHER").alias("total_retro_other")
+                coalesce(sf_sum("CLAIM_COUNT"), lit(0)).alias("total_retro_claims"),
+                as_double(
+                    sf_sum("RETRO_MONTHS_SUM") / sf_sum("CLAIM_COUNT")
+                ).alias("avg_retro_months"),
+                as_double(sf_sum("FACILITY_RETRO")).alias("total_retro_facilities"),
+                as_double(sf_sum("HOME_HEALTH_RETRO")).alias("total_retro_home_health"),
+                as_double(sf_sum("OTHER_RETRO")).alias("total_retro_other")
             ])
             
-            result = retro_metrics.collect()[0].as_dict()
-            
-            # Convert keys to lowercase (Snowflake returns uppercase)
-            result = {k.lower(): v for k, v in result.items()}
-            
-            # Convert Decimal to float for JSON serialization
-            for key, value in result.items():
-                if hasattr(value, '__float__'):  # Handles Decimal, numpy types, etc.
-                    result[key] = float(value) if value is not None else 0.0
-                elif value is None:
-                    result[key] = 0
+            result = self._execute_aggregate(retro_metrics)
             
             return result
         
@@ -1,12 +1,14 @@
 """Policy data repository."""
 
 import logging
-from typing import List, Optional, Dict, Any
-from snowflake.snowpark import Session
-from snowflake.snowpark.functions import col, avg, sum as sf_sum, count, when
+from functools import lru_cache
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+from snowflake.snowpark import Column, Row, Session
+from snowflake.snowpark.functions import col, avg, call_builtin, sum as sf_sum, count
 
-from app.repositories.base import BaseRepository
-from app.models.domain import PolicyMonthlySnapshot
+from app.repositories.base import BaseRepository, TOTAL_COLUMN, TOTAL_KEY
+from app.models.domain import PolicyFilter, PolicyMonthlySnapshot, PolicyMonthlySnapshotSlim
+from app.models.schemas import POLICY_RESPONSE_COLS
 from app.core.exceptions import DataNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,12 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
     """Repository for policy data access."""
     
     TABLE_NAME = "POLICY_MONTHLY_SNAPSHOT_FACT"
+    _LIST_COLUMNS = tuple(col(name.upper()) for name in POLICY_RESPONSE_COLS)
+    # Row-dict keys for _LIST_COLUMNS, so list results skip lowercasing
+    _LIST_KEYS = POLICY_RESPONSE_COLS
+    _LIST_KEYS_WITH_TOTAL = POLICY_RESPONSE_COLS + (TOTAL_KEY,)
+    # Columns of PolicyMonthlySnapshotSlim, for bulk scans
+    _SLIM_SELECT = ", ".join(name.upper() for name in PolicyMonthlySnapshotSlim._FIELDS)
     
     def __init__(self, session: Session):
         super().__init__(session)
@@ -31,7 +39,7 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
             if not rows:
                 return None
             
-            return PolicyMonthlySnapshot(**rows[0].as_dict())
+            return PolicyMonthlySnapshot.from_row(rows[0].as_dict())
         except Exception as e:
             logger.error(f"Error fetching policy {policy_id}: {e}")
             raise
@@ -40,103 +48,175 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
         self,
         limit: int = 100,
         offset: int = 0,
-        carrier_name: Optional[str] = None,
-        snapshot_date: Optional[str] = None,
-        policy_status: Optional[str] = None,
-        state: Optional[str] = None
+        filters: PolicyFilter = PolicyFilter(),
+        after_snapshot_date: Optional[str] = None,
+        after_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """List policies with filters."""
+        """List policies with filters.
+        
+        Pass the last row's policy_snapshot_date and policy_id as
+        after_snapshot_date/after_id to fetch the next page by keyset
+        instead of offset.
+        """
         try:
-            df = self.session.table(self.TABLE_NAME)
-            
-            # Apply filters
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            
-            if snapshot_date:
-                df = df.filter(col("POLICY_SNAPSHOT_DATE") == snapshot_date)
-            
-            if policy_status:
-                df = df.filter(col("POLICY_STATUS_DIM_ID") == policy_status)
-            
-            if state:
-                df = df.filter(
-                    (col("INSURED_STATE") == state) | 
-                    (col("POLICY_RESIDENCE_STATE") == state)
-                )
-            
-            # Select relevant columns
-            df = df.select(
-                col("POLICY_ID"),
-                col("POLICY_DIM_ID"),
-                col("CARRIER_NAME"),
-                col("INSURED_STATE"),
-                col("POLICY_RESIDENCE_STATE"),
-                col("ANNUALIZED_PREMIUM"),
-                col("LIFETIME_COLLECTED_PREMIUM"),
-                col("PREMIUM_FREQUENCY"),
-                col("ORIGINAL_EFFECTIVE_DT"),
-                col("POLICY_EXPIRATION_DT"),
-                col("IN_WAIVER_FLG"),
-                col("IN_NONFORFEITURE_FLG"),
-                col("RATED_AGE"),
-                col("TOTAL_ACTIVE_CLAIMS"),
-                col("TOTAL_RFBS"),
-                col("TOTAL_APPROVED_RFBS"),
-                col("TOTAL_DENIALS"),
-                col("POLICY_SNAPSHOT_DATE")
-            )
-            
-            # Order by snapshot date descending for consistent pagination
-            df = df.order_by(col("POLICY_SNAPSHOT_DATE").desc())
-            
-            # Apply pagination - Snowpark requires ordering before offset
-            if offset > 0:
-                df = df.limit(limit + offset)
-                rows = df.collect()[offset:]  # Skip offset rows after collection
-            else:
-                df = df.limit(limit)
-                rows = df.collect()
-            
-            # Convert to list of dicts with lowercase keys
-            return [
-                {k.lower(): v for k, v in row.as_dict().items()}
-                for row in rows
-            ]
+            rows = self._list_rows(limit, offset, filters, after_snapshot_date, after_id)
+            return self._rows_to_dicts(rows, self._LIST_KEYS)
         
         except Exception as e:
             logger.error(f"Error listing policies: {e}")
             raise
     
-    def count(
+    def list_with_total(
         self,
-        carrier_name: Optional[str] = None,
-        snapshot_date: Optional[str] = None,
-        policy_status: Optional[str] = None,
-        state: Optional[str] = None
-    ) -> int:
+        limit: int = 100,
+        offset: int = 0,
+        filters: PolicyFilter = PolicyFilter(),
+        after_snapshot_date: Optional[str] = None,
+        after_id: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """List policies like list(), plus the total matching rows, in one query.
+        
+        The total comes from COUNT(*) OVER () on the same filtered scan, so
+        no separate count() query is needed. It is 0 when the page is empty.
+        """
+        try:
+            rows = self._list_rows(
+                limit, offset, filters, after_snapshot_date, after_id, with_total=True
+            )
+            result = self._rows_to_dicts(rows, self._LIST_KEYS_WITH_TOTAL)
+            return result, self._pop_total(result)
+        
+        except Exception as e:
+            logger.error(f"Error listing policies with total: {e}")
+            raise
+    
+    def list_columns(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        filters: PolicyFilter = PolicyFilter(),
+        after_snapshot_date: Optional[str] = None,
+        after_id: Optional[int] = None
+    ) -> Dict[str, List[Any]]:
+        """List policies like list(), but as lowercase column -> values."""
+        try:
+            rows = self._list_rows(limit, offset, filters, after_snapshot_date, after_id)
+            return self._rows_to_columns(rows, self._LIST_KEYS)
+        
+        except Exception as e:
+            logger.error(f"Error listing policy columns: {e}")
+            raise
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _list_filter(filters: PolicyFilter) -> Optional[Column]:
+        """Build the WHERE predicate for list()/count(), cached per filter combination.
+        
+        The frozen PolicyFilter is the cache key; pagination is kept out of
+        it. Returns None when no filter is set.
+        """
+        predicates = []
+        if filters.carrier_name:
+            predicates.append(col("CARRIER_NAME") == filters.carrier_name)
+        if filters.snapshot_date:
+            predicates.append(col("POLICY_SNAPSHOT_DATE") == filters.snapshot_date)
+        if filters.policy_status:
+            predicates.append(col("POLICY_STATUS_DIM_ID") == filters.policy_status)
+        if filters.state:
+            predicates.append(
+                (col("INSURED_STATE") == filters.state) | 
+                (col("POLICY_RESIDENCE_STATE") == filters.state)
+            )
+        
+        if not predicates:
+            return None
+        combined = predicates[0]
+        for p in predicates[1:]:
+            combined = combined & p
+        return combined
+    
+    def _list_rows(
+        self,
+        limit: int,
+        offset: int,
+        filters: PolicyFilter,
+        after_snapshot_date: Optional[str] = None,
+        after_id: Optional[int] = None,
+        with_total: bool = False
+    ) -> List[Row]:
+        """Run the filtered, projected and paginated policies query."""
+        df = self.session.table(self.TABLE_NAME)
+        
+        # Apply filters
+        predicate = self._list_filter(filters)
+        if predicate is not None:
+            df = df.filter(predicate)
+        
+        # Select only the columns PolicyResponse exposes, plus a window count
+        # over the filtered rows (evaluated before LIMIT) when requested
+        if with_total:
+            df = df.select(*self._LIST_COLUMNS, count("*").over().alias(TOTAL_COLUMN))
+        else:
+            df = df.select(*self._LIST_COLUMNS)
+        
+        # Keyset pagination: rows strictly after the cursor in (date, id) order
+        if after_snapshot_date is not None and after_id is not None:
+            df = df.filter(
+                (col("POLICY_SNAPSHOT_DATE") < after_snapshot_date) |
+                ((col("POLICY_SNAPSHOT_DATE") == after_snapshot_date) &
+                 (col("POLICY_ID") < after_id))
+            )
+            offset = 0
+        
+        # Order by snapshot date, then ID, so pages are stable
+        df = df.order_by(col("POLICY_SNAPSHOT_DATE").desc(), col("POLICY_ID").desc())
+        
+        # LIMIT/OFFSET run in Snowflake, so only the requested page is transferred
+        return df.limit(limit, offset=offset).collect()
+    
+    def count(self, filters: PolicyFilter = PolicyFilter()) -> int:
         """Count policies matching filters."""
         try:
             df = self.session.table(self.TABLE_NAME)
             
             # Apply same filters as list
-            if carrier_name:
-                df = df.filter(col("CARRIER_NAME") == carrier_name)
-            if snapshot_date:
-                df = df.filter(col("POLICY_SNAPSHOT_DATE") == snapshot_date)
-            if policy_status:
-                df = df.filter(col("POLICY_STATUS_DIM_ID") == policy_status)
-            if state:
-                df = df.filter(
-                    (col("INSURED_STATE") == state) | 
-                    (col("POLICY_RESIDENCE_STATE") == state)
-                )
+            predicate = self._list_filter(filters)
+            if predicate is not None:
+                df = df.filter(predicate)
             
             return df.count()
         except Exception as e:
             logger.error(f"Error counting policies: {e}")
             raise
     
+    def iter_slim(
+        self,
+        carrier_name: Optional[str] = None,
+        snapshot_date: Optional[str] = None
+    ) -> Iterator[PolicyMonthlySnapshotSlim]:
+        """Stream matching policies as slim rows for bulk scans.
+        
+        Only the slim model's columns are selected, and rows are fetched one
+        result chunk at a time, so a full-table scan never holds every row.
+        """
+        query = f"SELECT {self._SLIM_SELECT} FROM {self.TABLE_NAME}"
+        predicates, params = [], []
+        if carrier_name:
+            predicates.append("CARRIER_NAME = ?")
+            params.append(carrier_name)
+        if snapshot_date:
+            predicates.append("POLICY_SNAPSHOT_DATE = ?")
+            params.append(snapshot_date)
+        if predicates:
+            query += " WHERE " + " AND ".join(predicates)
+        
+        try:
+            for row in self._iter_query(query, params or None):
+                yield PolicyMonthlySnapshotSlim.from_row(row)
+        except Exception as e:
+            logger.error(f"Error scanning slim policies: {e}")
+            raise
+    
     def get_metrics(
         self,
         carrier_name: Optional[str] = None,
@@ -152,31 +232,24 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
             if snapshot_date:
                 df = df.filter(col("POLICY_SNAPSHOT_DATE") == snapshot_date)
             
+            # COUNT_IF over rows with a POLICY_ID, matching COUNT(POLICY_ID)
+            def count_policies_if(condition):
+                return call_builtin("count_if", condition & col("POLICY_ID").is_not_null())
+            
             # Calculate metrics
             metrics_df = df.agg([
                 count("POLICY_ID").alias("total_policies"),
-                count(
-                    when(col("POLICY_EXPIRATION_DT").isNull(), col("POLICY_ID"))
-                ).alias("active_policies"),
-                count(
-                    when(col("IN_NONFORFEITURE_FLG") == "Yes", col("POLICY_ID"))
-                ).alias("in_forfeiture_policies"),
-                count(
-                    when(col("IN_WAIVER_FLG") == "Yes", col("POLICY_ID"))
-                ).alias("in_waiver_policies"),
+                count_policies_if(col("POLICY_EXPIRATION_DT").isNull()).alias("active_policies"),
+                count_policies_if(col("IN_NONFORFEITURE_FLG") == "Yes").alias("in_forfeiture_policies"),
+                count_policies_if(col("IN_WAIVER_FLG") == "Yes").alias("in_waiver_policies"),
                 avg("ANNUALIZED_PREMIUM").alias("avg_premium"),
                 sf_sum("ANNUALIZED_PREMIUM").alias("total_premium_revenue"),
                 avg("RATED_AGE").alias("avg_insured_age"),
-                count(
-                    when(col("TOTAL_ACTIVE_CLAIMS") > 0, col("POLICY_ID"))
-                ).alias("policies_with_claims"),
+                count_policies_if(col("TOTAL_ACTIVE_CLAIMS") > 0).alias("policies_with_claims"),
                 sf_sum("TOTAL_ACTIVE_CLAIMS").alias("total_claims_count")
             ])
             
-            result = metrics_df.collect()[0].as_dict()
-            
-            # Convert keys to lowercase (Snowflake returns uppercase)
-            result = {k.lower(): v for k, v in result.items()}
+            result = self._execute_aggregate(metrics_df)
             
             # Calculate derived metrics
             total_policies = result.get("total_policies", 0) or 0
@@ -219,16 +292,8 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
                 count("POLICY_ID").alias("count")
             ).sort(col("count").desc()).limit(10)
             
-            # Collect results and convert to dict
-            rows = state_df.collect()
-            result = {}
-            for row in rows:
-                row_dict = row.as_dict()
-                state = row_dict.get("INSURED_STATE") or row_dict.get("insured_state")
-                count_val = row_dict.get("COUNT") or row_dict.get("count")
-                if state:
-                    result[state] = count_val
-            return result
+            # Rows are (INSURED_STATE, COUNT); unpack positionally instead of via as_dict()
+            return {state: count_val for state, count_val in state_df.collect() if state}
         
         except Exception as e:
             logger.error(f"Error getting state distribution: {e}")
@@ -253,16 +318,8 @@ class PolicyRepository(BaseRepository[PolicyMonthlySnapshot]):
                 sf_sum("ANNUALIZED_PREMIUM").alias("total_premium")
             ).sort(col("total_premium").desc()).limit(10)
             
-            # Collect results and convert to dict
-            rows = premium_df.collect()
-            result = {}
-            for row in rows:
-                row_dict = row.as_dict()
-                state = row_dict.get("INSURED_STATE") or row_dict.get("insured_state")
-                premium = row_dict.get("TOTAL_PREMIUM") or row_dict.get("total_premium")
-                if state:
-                    result[state] = premium
-            return result
+            # Rows are (INSURED_STATE, TOTAL_PREMIUM); unpack positionally instead of via as_dict()
+            return {state: premium for state, premium in premium_df.collect() if state}
         
         except Exception as e:
             logger.error(f"Error getting premium by state: {e}")
@@ -12,7 +12,6 @@ from app.models.schemas import (
     PolicyInsights,
     CombinedDashboard
 )
-from app.core.cache import cached
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +23,12 @@ class AnalyticsService:
         self.policy_repo = PolicyRepository(session)
         self.claims_service = ClaimsService(session)
     
-    @cached(ttl=300, key_prefix="analytics:policy_metrics:")
     def get_policy_metrics(
         self,
         carrier_name: Optional[str] = None,
         snapshot_date: Optional[str] = None
     ) -> PolicyMetrics:
-        """Get policy metrics with caching."""
+        """Get policy metrics."""
         logger.info(f"Calculating policy metrics: carrier={carrier_name}, date={snapshot_date}")
         
         metrics_data = self.policy_repo.get_metrics(
@@ -51,7 +49,6 @@ class AnalyticsService:
             avg_claims_per_policy=metrics_data.get("avg_claims_per_policy", 0.0)
         )
     
-    @cached(ttl=300, key_prefix="analytics:policy_insights:")
     def get_policy_insights(
         self,
         carrier_name: Optional[str] = None,
@@ -95,7 +92,6 @@ class AnalyticsService:
             status_distribution=status_distribution
         )
     
-    @cached(ttl=300, key_prefix="analytics:combined_dashboard:")
     def get_combined_dashboard(
         self,
         carrier_name: Optional[str] = None,
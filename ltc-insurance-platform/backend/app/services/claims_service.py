@@ -1,11 +1,13 @@
 """Claims business logic service with caching."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date
 from snowflake.snowpark import Session
 
 from app.repositories.claims_repo import ClaimsRepository
+from app.models.domain import ClaimsFilter
 from app.models.schemas import ClaimsSummary, ClaimsInsights
 from app.core.cache import cached
 
@@ -21,35 +23,64 @@ class ClaimsService:
     @cached(ttl=300, key_prefix="claims:list:")
     def get_claims(
         self,
-        carrier_name: Optional[str] = None,
-        report_end_dt: Optional[date] = None,
-        decision_types: Optional[List[str]] = None,
-        ongoing_rate_months: Optional[List[int]] = None,
-        categories: Optional[List[str]] = None,
+        filters: ClaimsFilter = ClaimsFilter(),
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get claims with configurable filters."""
-        logger.info(
-            f"Fetching claims: carrier={carrier_name}, date={report_end_dt}, "
-            f"decisions={decision_types}, limit={limit}"
-        )
+        logger.info(f"Fetching claims: {filters}, limit={limit}")
         
         return self.repo.list(
             limit=limit,
             offset=offset,
-            carrier_name=carrier_name,
-            report_end_dt=report_end_dt,
-            decision_types=decision_types,
-            ongoing_rate_months=ongoing_rate_months,
-            categories=categories
+            filters=filters,
+            after_snapshot_date=after_snapshot_date,
+            after_id=after_id
+        )
+    
+    @cached(ttl=300, key_prefix="claims:columns:")
+    def get_claims_columns(
+        self,
+        filters: ClaimsFilter = ClaimsFilter(),
+        limit: int = 100,
+        offset: int = 0,
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """Get claims with configurable filters as column -> values."""
+        return self.repo.list_columns(
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            after_snapshot_date=after_snapshot_date,
+            after_id=after_id
+        )
+    
+    @cached(ttl=300, key_prefix="claims:list_total:")
+    def get_claims_with_total(
+        self,
+        filters: ClaimsFilter = ClaimsFilter(),
+        limit: int = 100,
+        offset: int = 0,
+        after_snapshot_date: Optional[date] = None,
+        after_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of claims and the total matching count in one query."""
+        return self.repo.list_with_total(
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            after_snapshot_date=after_snapshot_date,
+            after_id=after_id
         )
     
     def get_claim_by_id(self, claim_id: str) -> Optional[Dict[str, Any]]:
         """Get single claim by ID."""
         logger.info(f"Fetching claim: {claim_id}")
         claim = self.repo.get_by_id(claim_id)
-        return claim.model_dump() if claim else None
+        return asdict(claim) if claim else None
     
     @cached(ttl=300, key_prefix="claims:summary:")
     def get_claims_summary(
@@ -92,34 +123,34 @@ class ClaimsService:
         logger.info(f"Calculating claims insights: carrier={carrier_name}, date={report_end_dt}")
         
         # Get summary
-        logger.info("Step 1: Getting claims summary...")
+        logger.debug("Step 1: Getting claims summary...")
         summary = self.get_claims_summary(carrier_name, report_end_dt)
-        logger.info(f"Step 1: Summary complete - {summary.total_claims} total claims")
+        logger.debug("Step 1: Summary complete - %s total claims", summary.total_claims)
         
         # Get decision breakdown
-        logger.info("Step 2: Getting decision breakdown...")
+        logger.debug("Step 2: Getting decision breakdown...")
         decision_breakdown = self.repo.get_decision_breakdown(
             carrier_name=carrier_name,
             report_end_dt=report_end_dt
         )
-        logger.info(f"Step 2: Decision breakdown complete - {decision_breakdown}")
+        logger.debug("Step 2: Decision breakdown complete - %s", decision_breakdown)
         
         # Category breakdown
-        logger.info("Step 3: Building category breakdown...")
+        logger.debug("Step 3: Building category breakdown...")
         category_breakdown = {
             "Facility": summary.facility_claims,
             "Home Health": summary.home_health_claims,
             "Other": summary.other_claims
         }
-        logger.info(f"Step 3: Category breakdown complete")
+        logger.debug("Step 3: Category breakdown complete")
         
         # Get retro analysis
-        logger.info("Step 4: Getting retro analysis...")
+        logger.debug("Step 4: Getting retro analysis...")
         retro_analysis = self.repo.get_retro_analysis(
             carrier_name=carrier_name,
             report_end_dt=report_end_dt
         )
-        logger.info(f"Step 4: Retro analysis complete")
+        logger.debug("Step 4: Retro analysis complete")
         
         # Calculate avg TAT by category (simplified)
         avg_tat_by_category = {
@@ -137,18 +168,7 @@ class ClaimsService:
             retro_analysis=retro_analysis
         )
     
-    def count_claims(
-        self,
-        carrier_name: Optional[str] = None,
-        report_end_dt: Optional[date] = None,
-        decision_types: Optional[List[str]] = None,
-        ongoing_rate_months: Optional[List[int]] = None
-    ) -> int:
+    def count_claims(self, filters: ClaimsFilter = ClaimsFilter()) -> int:
         """Count claims matching filters."""
-        return self.repo.count(
-            carrier_name=carrier_name,
-            report_end_dt=report_end_dt,
-            decision_types=decision_types,
-            ongoing_rate_months=ongoing_rate_months
-        )
+        return self.repo.count(filters)
 
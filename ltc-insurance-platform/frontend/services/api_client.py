@@ -3,12 +3,17 @@
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import date
+import ormsgpack
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+# Prefer msgpack where the backend offers it, JSON everywhere else
+MSGPACK_ACCEPT = f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.5"
+
 
 class APIClient:
     """Type-safe API client for LTC Insurance backend."""
@@ -38,6 +43,8 @@ class APIClient:
         """Handle API response."""
         try:
             response.raise_for_status()
+            if response.headers.get("content-type", "").startswith(MSGPACK_MEDIA_TYPE):
+                return ormsgpack.unpackb(response.content)
             return response.json()
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error: {e}")
@@ -237,6 +244,7 @@ class APIClient:
         response = self.session.get(
             self._build_url("/analytics/combined-dashboard"),
             params=params,
+            headers={"Accept": MSGPACK_ACCEPT},
             timeout=self.timeout
         )
         return self._handle_response(response)
@@ -181,6 +181,41 @@ CREATE INDEX IF NOT EXISTS idx_claims_carrier ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSH
 CREATE INDEX IF NOT EXISTS idx_claims_snapshot_date ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT(SNAPSHOT_DATE);
 CREATE INDEX IF NOT EXISTS idx_claims_decision ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT(DECISION);
 
+-- Cluster on the list endpoints' (date, id) sort key so keyset cursors prune micro-partitions
+ALTER TABLE POLICY_MONTHLY_SNAPSHOT_FACT CLUSTER BY (POLICY_SNAPSHOT_DATE, POLICY_ID);
+ALTER TABLE CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT CLUSTER BY (SNAPSHOT_DATE, TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID);
+
+-- Pre-aggregated claims for the summary, decision breakdown and retro analysis
+-- endpoints. Grouping by every dimension those queries slice on keeps each
+-- metric a plain COUNT/SUM that can be re-summed across carriers and dates.
+CREATE OR REPLACE MATERIALIZED VIEW CLAIMS_SUMMARY_BY_CARRIER_MV
+    CLUSTER BY (SNAPSHOT_DATE, CARRIER_NAME)
+AS
+SELECT
+    CARRIER_NAME,
+    SNAPSHOT_DATE,
+    DECISION,
+    ONGOING_RATE_MONTH,
+    RETRO_MONTHS > 0 AS IS_RETRO,
+    COUNT(*) AS CLAIM_COUNT,
+    SUM(RFB_PROCESS_TO_DECISION_TAT) AS RFB_TAT_SUM,
+    COUNT(RFB_PROCESS_TO_DECISION_TAT) AS RFB_TAT_COUNT,
+    SUM(RETRO_MONTHS) AS RETRO_MONTHS_SUM,
+    SUM(INITIAL_DECISIONS_FACILITIES) AS FACILITY_INITIAL,
+    SUM(ONGOING_ALL_FACILITIES) AS FACILITY_ONGOING,
+    SUM(RETRO_ALL_FACILITIES) AS FACILITY_RETRO,
+    SUM(INITIAL_DECISIONS_HOME_HEALTH) AS HOME_HEALTH_INITIAL,
+    SUM(ONGOING_HOME_HEALTH) AS HOME_HEALTH_ONGOING,
+    SUM(RETRO_HOME_HEALTH) AS HOME_HEALTH_RETRO,
+    SUM(INITIAL_DECISIONS_ALL_OTHER) AS OTHER_INITIAL,
+    SUM(ALL_OTHER) AS OTHER_ONGOING,
+    SUM(RETRO_ALL_OTHER) AS OTHER_RETRO
+FROM CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT
+WHERE (ONGOING_RATE_MONTH = 1 AND IS_INITIAL_DECISION_FLAG IN (0, 1))
+   OR (ONGOING_RATE_MONTH = 0 AND IS_INITIAL_DECISION_FLAG = 1)
+   OR (ONGOING_RATE_MONTH = 2 AND IS_INITIAL_DECISION_FLAG IN (0, 1))
+GROUP BY CARRIER_NAME, SNAPSHOT_DATE, DECISION, ONGOING_RATE_MONTH, IS_RETRO;
+
 -- Confirm tables created
 SELECT 'Tables created successfully' AS status;
 